@@ -1,12 +1,20 @@
+from typing import TYPE_CHECKING, Any
+
 from .graphiti import Graphiti, AddEpisodeResults
 from .nodes import EntityNode, EpisodicNode
 from .edges import EntityEdge, EpisodicEdge
 
 # Import legal extensions
 from .legal_entities import LEGAL_ENTITY_TYPES, get_legal_entity_type_descriptions
-from .graphiti_web_extension import extend_graphiti_with_web_capabilities
 from .synthetic_legal_graph import extend_graphiti_with_synthesis
 
+if TYPE_CHECKING:
+    from .graphiti_web_extension import (
+        LegalGraphiti,
+        LegalWebMixin,
+        extend_graphiti_with_web_capabilities,
+    )
+
 __all__ = [
     'Graphiti',
     'AddEpisodeResults',
@@ -16,6 +24,22 @@ __all__ = [
     'EpisodicEdge',
     'LEGAL_ENTITY_TYPES',
     'get_legal_entity_type_descriptions',
+    'LegalGraphiti',
+    'LegalWebMixin',
     'extend_graphiti_with_web_capabilities',
     'extend_graphiti_with_synthesis'
 ]
+
+# The web extension imports crawl4ai and its browser stack, so it is only loaded once one
+# of its names is used
+_WEB_EXTENSION_NAMES = frozenset(
+    {'LegalGraphiti', 'LegalWebMixin', 'extend_graphiti_with_web_capabilities'}
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _WEB_EXTENSION_NAMES:
+        from . import graphiti_web_extension
+
+        return getattr(graphiti_web_extension, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -65,6 +65,24 @@ def get_range_indices(db_type: str = 'neo4j') -> list[LiteralString]:
         ]
 
 
+def get_legal_range_indices(db_type: str = 'neo4j') -> list[LiteralString]:
+    # Custom entity attributes are stored as node properties, so the legal filters can
+    # use range indices on them
+    if db_type == 'falkordb':
+        return [
+            'CREATE INDEX FOR (n:Entity) ON (n.cyber_law_category)',
+            'CREATE INDEX FOR (n:CaseLaw) ON (n.citation, n.date)',
+            'CREATE INDEX FOR (n:Statute) ON (n.section)',
+        ]
+    else:
+        return [
+            'CREATE INDEX entity_cyber_law_category IF NOT EXISTS FOR (n:Entity) ON (n.cyber_law_category)',
+            'CREATE INDEX case_law_citation IF NOT EXISTS FOR (n:CaseLaw) ON (n.citation)',
+            'CREATE INDEX case_law_date IF NOT EXISTS FOR (n:CaseLaw) ON (n.date)',
+            'CREATE INDEX statute_section IF NOT EXISTS FOR (n:Statute) ON (n.section)',
+        ]
+
+
 def get_fulltext_indices(db_type: str = 'neo4j') -> list[LiteralString]:
     if db_type == 'falkordb':
         return [
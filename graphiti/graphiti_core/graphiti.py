@@ -97,6 +97,13 @@ class AddEpisodeResults(BaseModel):
     edges: list[EntityEdge]
 
 
+class AddBulkEpisodeResults(BaseModel):
+    episodes: list[EpisodicNode]
+    episodic_edges: list[EpisodicEdge]
+    nodes: list[EntityNode]
+    edges: list[EntityEdge]
+
+
 class Graphiti:
     def __init__(
         self,
@@ -544,7 +551,7 @@ class Graphiti:
         excluded_entity_types: list[str] | None = None,
         edge_types: dict[str, BaseModel] | None = None,
         edge_type_map: dict[tuple[str, str], list[str]] | None = None,
-    ):
+    ) -> AddBulkEpisodeResults:
         """
         Process multiple episodes in bulk and update the graph.
 
@@ -560,7 +567,8 @@ class Graphiti:
 
         Returns
         -------
-        None
+        AddBulkEpisodeResults
+            The saved episodes, episodic edges, entity nodes and entity edges.
 
         Notes
         -----
@@ -715,6 +723,13 @@ class Graphiti:
             end = time()
             logger.info(f'Completed add_episode_bulk in {(end - start) * 1000} ms')
 
+            return AddBulkEpisodeResults(
+                episodes=episodes,
+                episodic_edges=episodic_edges,
+                nodes=hydrated_nodes,
+                edges=list(edges_by_uuid.values()),
+            )
+
         except Exception as e:
             raise e
 
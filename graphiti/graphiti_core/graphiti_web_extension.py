@@ -14,17 +14,74 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import io
 import logging
+import warnings
+from collections import Counter, defaultdict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from pydantic import BaseModel
 
-from graphiti_core.nodes import EntityNode, EpisodicNode
-from graphiti_core.utils.web_crawler import WebCrawler, create_legal_entity_definitions
+from graphiti_core.graph_queries import get_legal_range_indices
+from graphiti_core.graphiti import AddBulkEpisodeResults, AddEpisodeResults, Graphiti
+from graphiti_core.helpers import DEFAULT_DATABASE, semaphore_gather
+from graphiti_core.nodes import EntityNode, EpisodeType, EpisodicNode
+from graphiti_core.search.legal_post_filters import filter_nodes_by_category, max_node_score
+from graphiti_core.search.one_hop_cache import OneHopCache
+from graphiti_core.search.search import search
+from graphiti_core.search.search_config import SearchResults
+from graphiti_core.search.search_config_recipes import (
+    COMBINED_HYBRID_SEARCH_CROSS_ENCODER,
+    NODE_HYBRID_SEARCH_RRF,
+)
+from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.search.semantic_cache import SemanticSearchCache
+from graphiti_core.utils.bulk_utils import RawEpisode
+from graphiti_core.utils.web_crawler import (
+    cached_crawl,
+    clear_crawl_cache,
+    close_shared_crawlers,
+    create_legal_entity_definitions,
+    get_shared_crawler,
+)
 
 logger = logging.getLogger(__name__)
 
+# Episodes per add_episode_bulk call when bulk writes are enabled
+BULK_EPISODE_BATCH_SIZE = 500
+
+# Search filters are only read during a search, so the legal variants are built once
+_DEFAULT_FILTER = SearchFilters()
+_CASE_LAW_FILTER = SearchFilters(node_labels=['CaseLaw'])
+_STATUTE_FILTER = SearchFilters(node_labels=['Statute'])
+
+# Episode header filled with str.format_map; fields missing from the document metadata
+# fall back to _EPISODE_HEADER_DEFAULTS and then to "Unknown"
+_EPISODE_HEADER_TEMPLATE = (
+    "Legal Document: {title}\n"
+    "URL: {url}\n"
+    "Document Type: {document_type}\n"
+    "Jurisdiction: {jurisdiction}\n"
+    "Date: {date}\n"
+    "Citation: {citation}\n"
+    "\n"
+    "Summary:\n"
+    "{summary}\n"
+    "\n"
+    "Cyber Law Relevance:\n"
+    "{cyber_law_relevance}\n"
+    "\n"
+    "Key Holdings:"
+)
+_EPISODE_HEADER_DEFAULTS = {"title": "Untitled", "citation": "Not available"}
+
+
+def _unknown_field() -> str:
+    return "Unknown"
+
 
 class WebCrawlResults(BaseModel):
     """Results from web crawling and processing."""
@@ -34,35 +91,125 @@ class WebCrawlResults(BaseModel):
     cyber_law_relevance_score: float
 
 
-async def add_legal_document_from_web(
-    self,
-    url: str,
-    group_id: str = '',
-    use_llm_extraction: bool = True,
-    css_selectors: Optional[Dict[str, str]] = None,
-) -> WebCrawlResults:
+class LegalEpisodeContent(BaseModel):
+    """Episode built from a crawled legal document, ready to be added to the graph."""
+    url: str
+    name: str
+    content: str
+
+
+@lru_cache(maxsize=1)
+def _get_legal_entity_types() -> Dict[str, type[BaseModel]]:
+    """Build the legal entity type models once; add_episode only reads them."""
+    return create_legal_entity_definitions()
+
+
+def entity_type_histogram(nodes: List[Any]) -> Dict[str, int]:
     """
-    Crawl and process a legal document from the web.
+    Count search result nodes by entity type.
     
     Args:
-        url: URL of the legal document
-        group_id: Group ID for organizing documents
-        use_llm_extraction: Whether to use LLM extraction
-        css_selectors: CSS selectors for structured extraction
+        nodes: Nodes returned from a search
         
     Returns:
-        WebCrawlResults with processed entities
+        Mapping of entity type name to node count, in first-seen order
     """
-    # Initialize web crawler with the LLM client's configuration
-    llm_config = self.llm_client.config
-    crawler = WebCrawler(
-        llm_provider=llm_config.provider if hasattr(llm_config, 'provider') else 'openai',
-        api_key=llm_config.api_key if hasattr(llm_config, 'api_key') else None
+    return dict(
+        Counter(
+            next((label for label in getattr(node, 'labels', []) if label != 'Entity'), None)
+            or type(node).__name__
+            for node in nodes
+        )
     )
+
+
+if TYPE_CHECKING:
+    # Type the mixin against Graphiti so its attributes and super() calls resolve
+    _LegalWebBase = Graphiti
+else:
+    _LegalWebBase = object
+
+
+class LegalWebMixin(_LegalWebBase):
+    """
+    Legal web crawling and search capabilities for Graphiti.
+    
+    Combine with Graphiti through subclassing, or use LegalGraphiti directly.
+    """
+    
+    async def _get_shared_crawler(self):
+        """Get the shared crawler configured from the Graphiti LLM client."""
+        llm_config = self.llm_client.config
+        return await get_shared_crawler(
+            llm_provider=getattr(llm_config, 'provider', 'openai'),
+            api_key=llm_config.api_key if hasattr(llm_config, 'api_key') else None
+        )
+    
+    def _get_search_cache(self) -> SemanticSearchCache[SearchResults]:
+        """Get the legal search cache for a Graphiti instance, creating it on first use."""
+        search_cache = getattr(self, '_legal_search_cache', None)
+        if search_cache is None:
+            search_cache = SemanticSearchCache()
+            self._legal_search_cache = search_cache
+        return search_cache
+    
+    def _get_one_hop_cache(self) -> OneHopCache:
+        """Get the entity lookup cache for a Graphiti instance, creating it on first use."""
+        one_hop_cache = getattr(self, '_legal_one_hop_cache', None)
+        if one_hop_cache is None:
+            one_hop_cache = OneHopCache()
+            self._legal_one_hop_cache = one_hop_cache
+        return one_hop_cache
+    
+    def _invalidate_legal_caches(self, group_ids: Optional[List[str]] = None) -> None:
+        """Invalidate cached legal searches for the given groups, or for all groups if None."""
+        self._get_search_cache().invalidate(group_ids)
+        self._get_one_hop_cache().invalidate(group_ids)
+    
+    async def add_episode(self, *args, **kwargs) -> AddEpisodeResults:
+        """Add an episode and invalidate cached legal searches for its group."""
+        results = await super().add_episode(*args, **kwargs)
+        self._invalidate_legal_caches([results.episode.group_id])
+        return results
     
-    async with crawler:
-        # Crawl the document
-        document_data = await crawler.crawl_legal_document(
+    async def add_episode_bulk(
+        self,
+        bulk_episodes: List[RawEpisode],
+        group_id: str = '',
+        *args,
+        **kwargs
+    ) -> AddBulkEpisodeResults:
+        """Add episodes in bulk and invalidate cached legal searches for the group."""
+        results = await super().add_episode_bulk(bulk_episodes, group_id, *args, **kwargs)
+        self._invalidate_legal_caches([group_id])
+        return results
+    
+    async def remove_episode(self, episode_uuid: str):
+        """Remove an episode and invalidate all cached legal searches."""
+        await super().remove_episode(episode_uuid)
+        self._invalidate_legal_caches()
+    
+    async def build_indices_and_constraints(self, delete_existing: bool = False):
+        """Build the core indices and constraints plus indices on legal entity fields."""
+        await super().build_indices_and_constraints(delete_existing)
+        await semaphore_gather(
+            *[
+                self.driver.execute_query(query, database_=DEFAULT_DATABASE)
+                for query in get_legal_range_indices(self.driver.provider)
+            ]
+        )
+    
+    async def _crawl_legal_episode(
+        self,
+        url: str,
+        use_llm_extraction: bool = True,
+        css_selectors: Optional[Dict[str, str]] = None,
+    ) -> LegalEpisodeContent:
+        """Crawl a legal document and build its episode content."""
+        # Crawl the document with the shared crawler
+        crawler = await self._get_shared_crawler()
+        document_data = await cached_crawl(
+            crawler,
             url, 
             use_llm_extraction, 
             css_selectors
@@ -86,47 +233,50 @@ async def add_legal_document_from_web(
             cyber_law_relevance = ''
             key_holdings = []
         
-        # Create episode content
-        episode_content = f"""
-Legal Document: {metadata.get('title', 'Untitled')}
-URL: {url}
-Document Type: {metadata.get('document_type', 'Unknown')}
-Jurisdiction: {metadata.get('jurisdiction', 'Unknown')}
-Date: {metadata.get('date', 'Unknown')}
-Citation: {metadata.get('citation', 'Not available')}
-
-Summary:
-{content}
-
-Cyber Law Relevance:
-{cyber_law_relevance}
-
-Key Holdings:
-{chr(10).join([f"- {holding}" for holding in key_holdings])}
-
-Sections:
-{chr(10).join([f"{s.get('heading', 'Section')}: {s.get('content', '')[:200]}..." for s in sections[:3]])}
-"""
+        # Stream episode content into one buffer instead of building nested joins
+        buffer = io.StringIO()
+        buffer.write(_EPISODE_HEADER_TEMPLATE.format_map(defaultdict(_unknown_field, {
+            **_EPISODE_HEADER_DEFAULTS,
+            **metadata,
+            "url": url,
+            "summary": content,
+            "cyber_law_relevance": cyber_law_relevance,
+        })))
+        for holding in key_holdings:
+            buffer.write(f"\n- {holding}")
+        buffer.write("\n\nSections:")
+        for section in islice(sections, 3):
+            buffer.write(f"\n{section.get('heading', 'Section')}: ")
+            buffer.write(section.get('content', '')[:200])
+            buffer.write("...")
         
+        return LegalEpisodeContent(
+            url=url,
+            name=f"Legal Document: {metadata.get('title', url)}",
+            content=buffer.getvalue()
+        )
+    
+    async def _add_legal_episode(
+        self,
+        episode_content: LegalEpisodeContent,
+        group_id: str = '',
+    ) -> WebCrawlResults:
+        """Add a crawled legal document to the graph as an episode."""
         # Add as episode with legal entity types
-        legal_entity_types = create_legal_entity_definitions()
+        legal_entity_types = _get_legal_entity_types()
         
         result = await self.add_episode(
-            name=f"Legal Document: {metadata.get('title', url)}",
-            episode_body=episode_content,
-            source_description=f"Crawled from {url}",
+            name=episode_content.name,
+            episode_body=episode_content.content,
+            source_description=f"Crawled from {episode_content.url}",
             reference_time=datetime.utcnow(),
-            source=url,
+            source=EpisodeType.text,
             group_id=group_id,
             entity_types=legal_entity_types
         )
         
         # Calculate cyber law relevance score
-        cyber_law_score = 0.0
-        if hasattr(result, 'nodes'):
-            for node in result.nodes:
-                if hasattr(node, 'cyber_law_relevance'):
-                    cyber_law_score = max(cyber_law_score, node.cyber_law_relevance)
+        cyber_law_score = max_node_score(result.nodes, 'cyber_law_relevance')
         
         return WebCrawlResults(
             episode=result.episode,
@@ -134,117 +284,308 @@ Sections:
             total_documents=1,
             cyber_law_relevance_score=cyber_law_score
         )
-
-
-async def add_legal_documents_bulk_from_web(
-    self,
-    urls: List[str],
-    group_id: str = '',
-    use_llm_extraction: bool = True,
-    css_selectors: Optional[Dict[str, str]] = None,
-) -> List[WebCrawlResults]:
-    """
-    Crawl and process multiple legal documents from the web.
     
-    Args:
-        urls: List of URLs to crawl
-        group_id: Group ID for organizing documents
-        use_llm_extraction: Whether to use LLM extraction
-        css_selectors: CSS selectors for structured extraction
+    async def _add_legal_episodes_bulk(
+        self,
+        episode_contents: List[LegalEpisodeContent],
+        group_id: str = '',
+    ) -> List[WebCrawlResults]:
+        """Add crawled legal documents to the graph in batches with add_episode_bulk."""
+        legal_entity_types = _get_legal_entity_types()
         
-    Returns:
-        List of WebCrawlResults
-    """
-    results = []
+        results = []
+        for start in range(0, len(episode_contents), BULK_EPISODE_BATCH_SIZE):
+            batch = episode_contents[start:start + BULK_EPISODE_BATCH_SIZE]
+            bulk_episodes = [
+                RawEpisode(
+                    name=episode_content.name,
+                    content=episode_content.content,
+                    source_description=f"Crawled from {episode_content.url}",
+                    source=EpisodeType.text,
+                    reference_time=datetime.utcnow()
+                )
+                for episode_content in batch
+            ]
+            
+            bulk_results = await self.add_episode_bulk(
+                bulk_episodes,
+                group_id,
+                entity_types=legal_entity_types
+            )
+            
+            # Map each episode to the entities it mentions through its episodic edges
+            nodes_by_uuid = {node.uuid: node for node in bulk_results.nodes}
+            node_uuids_by_episode: Dict[str, List[str]] = {}
+            for edge in bulk_results.episodic_edges:
+                node_uuids_by_episode.setdefault(edge.source_node_uuid, []).append(
+                    edge.target_node_uuid
+                )
+            
+            for episode in bulk_results.episodes:
+                nodes = [
+                    nodes_by_uuid[node_uuid]
+                    for node_uuid in node_uuids_by_episode.get(episode.uuid, [])
+                    if node_uuid in nodes_by_uuid
+                ]
+                results.append(
+                    WebCrawlResults(
+                        episode=episode,
+                        legal_entities=nodes,
+                        total_documents=1,
+                        cyber_law_relevance_score=max_node_score(nodes, 'cyber_law_relevance')
+                    )
+                )
+        
+        return results
+    
+    async def add_legal_document_from_web(
+        self,
+        url: str,
+        group_id: str = '',
+        use_llm_extraction: bool = True,
+        css_selectors: Optional[Dict[str, str]] = None,
+    ) -> WebCrawlResults:
+        """
+        Crawl and process a legal document from the web.
+        
+        Args:
+            url: URL of the legal document
+            group_id: Group ID for organizing documents
+            use_llm_extraction: Whether to use LLM extraction
+            css_selectors: CSS selectors for structured extraction
+            
+        Returns:
+            WebCrawlResults with processed entities
+        """
+        episode_content = await self._crawl_legal_episode(url, use_llm_extraction, css_selectors)
+        return await self._add_legal_episode(episode_content, group_id)
     
-    # Process URLs in batches to avoid overwhelming the system
-    batch_size = 5
-    for i in range(0, len(urls), batch_size):
-        batch_urls = urls[i:i + batch_size]
+    async def add_legal_documents_bulk_from_web(
+        self,
+        urls: List[str],
+        group_id: str = '',
+        use_llm_extraction: bool = True,
+        css_selectors: Optional[Dict[str, str]] = None,
+        bulk_write: bool = False,
+    ) -> List[WebCrawlResults]:
+        """
+        Crawl and process multiple legal documents from the web.
+        
+        All documents are crawled before any of them is added to the graph, so the
+        network-bound crawl phase is not interleaved with LLM extraction and embedding.
+        Duplicate URLs are processed once.
+        
+        Args:
+            urls: List of URLs to crawl
+            group_id: Group ID for organizing documents
+            use_llm_extraction: Whether to use LLM extraction
+            css_selectors: CSS selectors for structured extraction
+            bulk_write: Add the documents with add_episode_bulk in batches of
+                BULK_EPISODE_BATCH_SIZE, writing each batch with UNWIND queries instead
+                of one transaction per document. Bulk ingestion skips edge invalidation
+                and does not resolve entities against the existing graph.
+            
+        Returns:
+            List of WebCrawlResults for the unique URLs that were processed successfully
+        """
+        # Drop duplicate URLs up front, keeping first-seen order, so each page is only
+        # crawled, extracted and added once
+        urls = list(dict.fromkeys(urls))
         
-        # Process each URL in the batch
-        batch_results = await semaphore_gather(
+        # Create the shared crawler once before fanning out
+        await self._get_shared_crawler()
+        
+        # Submit every URL at once and let the semaphore bound concurrency, so a slow
+        # URL does not hold back the rest of its batch
+        crawl_results = await semaphore_gather(
             *[
-                self.add_legal_document_from_web(
-                    url, group_id, use_llm_extraction, css_selectors
-                )
-                for url in batch_urls
+                self._crawl_legal_episode(url, use_llm_extraction, css_selectors)
+                for url in urls
             ],
-            max_coroutines=self.max_coroutines
+            max_coroutines=self.max_coroutines,
+            return_exceptions=True
         )
         
-        results.extend(batch_results)
+        episode_contents = []
+        for url, crawl_result in zip(urls, crawl_results, strict=True):
+            if isinstance(crawl_result, BaseException):
+                logger.error(f"Error crawling {url}: {crawl_result}")
+                continue
+            episode_contents.append(crawl_result)
+        
+        if bulk_write:
+            return await self._add_legal_episodes_bulk(episode_contents, group_id)
+        
+        add_results = await semaphore_gather(
+            *[
+                self._add_legal_episode(episode_content, group_id)
+                for episode_content in episode_contents
+            ],
+            max_coroutines=self.max_coroutines,
+            return_exceptions=True
+        )
+        
+        results = []
+        for episode_content, add_result in zip(episode_contents, add_results, strict=True):
+            if isinstance(add_result, BaseException):
+                logger.error(f"Error processing {episode_content.url}: {add_result}")
+                continue
+            results.append(add_result)
+        
+        return results
     
-    return results
+    async def search_legal_knowledge(
+        self,
+        query: str,
+        group_ids: List[str] = None,
+        cyber_law_categories: Optional[List[str]] = None,
+        case_law_only: bool = False,
+        statutes_only: bool = False,
+        limit: int = 10,
+    ) -> SearchResults:
+        """
+        Search the legal knowledge graph with specialized filters.
+        
+        Args:
+            query: Search query
+            group_ids: Group IDs to search within
+            cyber_law_categories: Specific cyber law categories to filter
+            case_law_only: Only return case law entities
+            statutes_only: Only return statute entities
+            limit: Maximum results to return
+            
+        Returns:
+            SearchResults with filtered legal entities
+        """
+        # Hash-based membership for the cache key and the category post-filter
+        categories = frozenset(cyber_law_categories or ())
+        
+        # Embed the query once; it is used both for the cache lookup and the search
+        query_vector = await self.embedder.create(input_data=[query.replace('\n', ' ')])
+        
+        # Near-duplicate queries with identical filters are served from the semantic cache.
+        # The group versions in the key are bumped whenever documents are added to a group.
+        search_cache = self._get_search_cache()
+        cache_key = (
+            tuple(sorted(group_ids or [])),
+            search_cache.group_versions(group_ids),
+            tuple(sorted(categories)),
+            case_law_only,
+            statutes_only,
+            limit,
+        )
+        cached_results = search_cache.get(query_vector, cache_key)
+        if cached_results is not None:
+            return cached_results.model_copy(deep=True)
+        
+        # Pick a prebuilt filter based on legal criteria
+        if case_law_only:
+            search_filter = _CASE_LAW_FILTER
+        elif statutes_only:
+            search_filter = _STATUTE_FILTER
+        else:
+            search_filter = _DEFAULT_FILTER
+        
+        # Use hybrid search with cross-encoder for best results. The recipe is a shared
+        # module-level config, so copy it rather than mutating its limit.
+        config = COMBINED_HYBRID_SEARCH_CROSS_ENCODER.model_copy(update={'limit': limit})
+        
+        # Perform the search
+        results = await search(
+            self.clients,
+            query,
+            group_ids or [],
+            config,
+            search_filter,
+            query_vector=query_vector
+        )
+        
+        # Post-process for cyber law relevance if categories specified
+        if categories and results.nodes:
+            results.nodes = filter_nodes_by_category(results.nodes, categories)
+        
+        search_cache.put(query_vector, cache_key, results.model_copy(deep=True))
+        
+        return results
+    
+    async def search_legal_entities(
+        self,
+        query: str,
+        group_ids: Optional[List[str]] = None,
+        limit: int = 1,
+        node_labels: Optional[List[str]] = None,
+    ) -> List[EntityNode]:
+        """
+        Look up the entities that best match a short query.
+        
+        Intended for small, repeated lookups such as finding a statute or a case by
+        name. Results are cached as node uuids until the searched groups change, so
+        a repeated lookup only fetches the nodes by uuid.
+        
+        Args:
+            query: Search query
+            group_ids: Group IDs to search within
+            limit: Maximum entities to return
+            node_labels: Only return entities with these labels (e.g. ['Statute'])
+            
+        Returns:
+            Matching entity nodes, best match first
+        """
+        one_hop_cache = self._get_one_hop_cache()
+        cache_key = one_hop_cache.key(query, group_ids, limit, node_labels)
+        
+        cached_uuids = one_hop_cache.get(cache_key)
+        if cached_uuids is not None:
+            nodes = await EntityNode.get_by_uuids(self.driver, cached_uuids)
+            nodes_by_uuid = {node.uuid: node for node in nodes}
+            if len(nodes_by_uuid) == len(cached_uuids):
+                return [nodes_by_uuid[uuid] for uuid in cached_uuids]
+        
+        results = await search(
+            self.clients,
+            query,
+            group_ids or [],
+            NODE_HYBRID_SEARCH_RRF.model_copy(update={'limit': limit}),
+            SearchFilters(node_labels=node_labels)
+        )
+        one_hop_cache.put(cache_key, [node.uuid for node in results.nodes])
+        
+        return results.nodes
+    
+    async def aclose_web(self) -> None:
+        """Close the shared web crawlers used by the legal web extension."""
+        await close_shared_crawlers()
+    
+    def clear_crawl_cache(self) -> None:
+        """Clear the in-memory and on-disk caches of crawled legal documents."""
+        clear_crawl_cache()
+
 
+class LegalGraphiti(LegalWebMixin, Graphiti):
+    """Graphiti with legal web crawling and search capabilities."""
 
-async def search_legal_knowledge(
-    self,
-    query: str,
-    group_ids: List[str] = None,
-    cyber_law_categories: Optional[List[str]] = None,
-    case_law_only: bool = False,
-    statutes_only: bool = False,
-    limit: int = 10,
-) -> SearchResults:
+
+def extend_graphiti_with_web_capabilities():
     """
-    Search the legal knowledge graph with specialized filters.
+    Extend Graphiti class with web crawling capabilities.
+    
+    Deprecated: patching methods onto Graphiti at runtime invalidates the class's
+    method caches. Use LegalGraphiti, or subclass LegalWebMixin and Graphiti, instead.
     
-    Args:
-        query: Search query
-        group_ids: Group IDs to search within
-        cyber_law_categories: Specific cyber law categories to filter
-        case_law_only: Only return case law entities
-        statutes_only: Only return statute entities
-        limit: Maximum results to return
-        
     Returns:
-        SearchResults with filtered legal entities
+        The LegalWebMixin class
     """
-    # Build search filters based on legal criteria
-    search_filter = SearchFilters()
-    
-    if case_law_only:
-        search_filter.entity_types = ['CaseLaw']
-    elif statutes_only:
-        search_filter.entity_types = ['Statute']
-    
-    # Use hybrid search with cross-encoder for best results
-    config = COMBINED_HYBRID_SEARCH_CROSS_ENCODER
-    config.limit = limit
-    
-    # Perform the search
-    results = await self.search(
-        query=query,
-        group_ids=group_ids or [],
-        config=config,
-        search_filter=search_filter
+    warnings.warn(
+        "extend_graphiti_with_web_capabilities() is deprecated; use LegalGraphiti instead",
+        DeprecationWarning,
+        stacklevel=2
     )
     
-    # Post-process for cyber law relevance if categories specified
-    if cyber_law_categories and results.nodes:
-        # Filter nodes by cyber law relevance
-        filtered_nodes = []
-        for node in results.nodes:
-            if hasattr(node, 'cyber_law_category') and node.cyber_law_category in cyber_law_categories:
-                filtered_nodes.append(node)
-        results.nodes = filtered_nodes
+    # Add the methods to Graphiti class. Overrides of Graphiti's own methods rely on
+    # super() and are skipped, so cached legal searches are only refreshed by their TTL.
+    for name, method in vars(LegalWebMixin).items():
+        if not name.startswith('__') and name not in vars(Graphiti):
+            setattr(Graphiti, name, method)
     
-    return results
-
-
-# Monkey-patch these methods onto the Graphiti class
-# This approach allows extending Graphiti without modifying the core class
-def extend_graphiti_with_web_capabilities():
-    """Extend Graphiti class with web crawling capabilities."""
-    from graphiti_core.graphiti import Graphiti
-    from graphiti_core.helpers import semaphore_gather
-    from graphiti_core.search.search_config import SearchResults
-    from graphiti_core.search.search_filters import SearchFilters
-    
-    # Add the methods to Graphiti class
-    Graphiti.add_legal_document_from_web = add_legal_document_from_web
-    Graphiti.add_legal_documents_bulk_from_web = add_legal_documents_bulk_from_web
-    Graphiti.search_legal_knowledge = search_legal_knowledge
-    
-    logger.info("Extended Graphiti with web crawling capabilities")
\ No newline at end of file
+    logger.info("Extended Graphiti with web crawling capabilities")
+    return LegalWebMixin
@@ -100,6 +100,7 @@ def normalize_l2(embedding: list[float]) -> NDArray:
 async def semaphore_gather(
     *coroutines: Coroutine,
     max_coroutines: int | None = None,
+    return_exceptions: bool = False,
 ) -> list[Any]:
     semaphore = asyncio.Semaphore(max_coroutines or SEMAPHORE_LIMIT)
 
@@ -107,7 +108,48 @@ async def semaphore_gather(
         async with semaphore:
             return await coroutine
 
-    return await asyncio.gather(*(_wrap_coroutine(coroutine) for coroutine in coroutines))
+    return await asyncio.gather(
+        *(_wrap_coroutine(coroutine) for coroutine in coroutines),
+        return_exceptions=return_exceptions,
+    )
+
+
+def use_uvloop() -> bool:
+    """
+    Make uvloop the asyncio event loop policy if it is installed.
+
+    Call once at process start, before the event loop is created. Returns whether uvloop
+    is in use; without it the default event loop is kept.
+    """
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+class AsyncRateLimiter:
+    """
+    Spaces calls to acquire() at least 60 / requests_per_minute seconds apart.
+
+    Slots are reserved synchronously, so concurrent callers sharing one limiter queue up
+    in call order and the combined request rate never exceeds the limit.
+    """
+
+    def __init__(self, requests_per_minute: float):
+        if requests_per_minute <= 0:
+            raise ValueError('requests_per_minute must be positive')
+        self.interval = 60.0 / requests_per_minute
+        self._next_slot = 0.0
+
+    async def acquire(self):
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
 
 
 def validate_group_id(group_id: str) -> bool:
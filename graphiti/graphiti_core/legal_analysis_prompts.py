@@ -14,8 +14,26 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from typing import Dict, List, Any, Optional
+import hashlib
+import json
+import logging
+import re
+import sys
+import threading
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import cache
+from time import monotonic
+from types import MappingProxyType
+from typing import Any, Dict, Final, FrozenSet, List, Mapping, Optional, Set, Tuple, Type
+
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic_core import to_json
+
+from graphiti_core.prompts.models import Message
+from graphiti_core.utils.keyword_matcher import KeywordMatcher
+
+logger = logging.getLogger(__name__)
 
 
 class AnalysisType(Enum):
@@ -30,12 +48,47 @@ class AnalysisType(Enum):
     COMPARATIVE_ANALYSIS = "comparative_analysis"
     TEMPORAL_EVOLUTION = "temporal_evolution"
     JURISDICTION_MAPPING = "jurisdiction_mapping"
+    
+    # Definition order of the member, set below; indexes per-type lookup tables
+    index: int
+
+
+for _index, _analysis_type in enumerate(AnalysisType):
+    _analysis_type.index = _index
+
+
+# Keyword lists are only used for membership tests and matching, so they freeze to sets
+_KEYWORD_LIST_KEYS: Final[FrozenSet[str]] = frozenset({"cyber_law_keywords", "keywords"})
+
+_EMPTY_MAPPING: Final[Mapping[str, Any]] = MappingProxyType({})
+
+
+def _freeze(value: Any, key: Optional[str] = None) -> Any:
+    """Recursively convert a configuration constant into read-only containers."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v, k) for k, v in value.items()})
+    if isinstance(value, list):
+        if key in _KEYWORD_LIST_KEYS:
+            return frozenset(value)
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Convert a frozen configuration constant back into plain JSON-compatible types."""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, frozenset):
+        return sorted(value)
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
 
 
 class LegalWebsiteSchema:
     """Schema definitions for different legal websites."""
     
-    SCHEMAS = {
+    SCHEMAS: Final[Mapping[str, Mapping[str, Any]]] = _freeze({
         "indiankanoon": {
             "base_url": "https://indiankanoon.org",
             "search_endpoint": "/search/?formInput=",
@@ -92,24 +145,261 @@ class LegalWebsiteSchema:
                 "updates": "/updates"
             }
         }
-    }
+    })
     
     @classmethod
-    def get_schema(cls, website: str) -> Dict[str, Any]:
+    def get_schema(cls, website: str) -> Mapping[str, Any]:
         """Get schema for a specific website."""
-        return cls.SCHEMAS.get(website, {})
+        return cls.SCHEMAS.get(website, _EMPTY_MAPPING)
+    
+    @classmethod
+    def as_dict(cls) -> Dict[str, Any]:
+        """Get a mutable, JSON-compatible copy of all website schemas."""
+        return _thaw(cls.SCHEMAS)
+    
+    @classmethod
+    def match_keywords(cls, text: str, website: str = "indiankanoon") -> List[str]:
+        """
+        Find the website's cyber law keywords in a crawled document.
+        
+        Args:
+            text: Document text to scan
+            website: Website whose cyber_law_keywords should be matched
+            
+        Returns:
+            Distinct matching keywords in order of first occurrence
+        """
+        matcher = _KEYWORD_MATCHERS.get(website)
+        return matcher.find(text) if matcher is not None else []
+    
+    @classmethod
+    def get_compiled(cls, website: str, field_name: str) -> Optional[Any]:
+        """
+        Get the compiled CSS selector for one of a website's selector fields.
+        
+        Args:
+            website: Website key in SCHEMAS
+            field_name: Selector name, e.g. "title" or "referred_cases"
+            
+        Returns:
+            lxml CSSSelector, or None if the website has no such selector
+        """
+        return _compiled_selectors(website).get(field_name)
+    
+    @classmethod
+    def select_fields(cls, website: str, html: str) -> Dict[str, List[str]]:
+        """
+        Extract the text of every selector field from a page of the website.
+        
+        The page is parsed once with lxml and each precompiled selector is applied
+        to the same tree.
+        
+        Args:
+            website: Website key in SCHEMAS
+            html: Raw page HTML
+            
+        Returns:
+            Stripped text of the matching elements for each selector field
+        """
+        selectors = _compiled_selectors(website)
+        if not selectors or not html.strip():
+            return {}
+        
+        from lxml import html as lxml_html
+        
+        tree = lxml_html.fromstring(html)
+        return {
+            field_name: [element.text_content().strip() for element in selector(tree)]
+            for field_name, selector in selectors.items()
+        }
 
 
-class LegalAnalysisPrompts:
-    """Advanced prompts for legal analysis and synthetic graph generation."""
+@cache
+def _compiled_selectors(website: str) -> Mapping[str, Any]:
+    # CSS is translated to XPath once per website; lxml is imported on first use so
+    # importing the prompts does not load it
+    selectors = LegalWebsiteSchema.get_schema(website).get("selectors", _EMPTY_MAPPING)
+    if not selectors:
+        return _EMPTY_MAPPING
     
-    # Core analysis prompts
-    PROMPTS = {
-        AnalysisType.CASE_TO_LAW: {
-            "system": """You are an expert legal analyst specializing in Indian Cyber Law. 
-            Your task is to analyze case law and identify applicable statutory provisions.""",
-            
-            "template": """Analyze the following case and identify all applicable laws:
+    from lxml.cssselect import CSSSelector
+    
+    return MappingProxyType({
+        field_name: CSSSelector(selector) for field_name, selector in selectors.items()
+    })
+
+
+# Keyword matchers are compiled once at import rather than per document
+_KEYWORD_MATCHERS: Final[Mapping[str, KeywordMatcher]] = {
+    website: KeywordMatcher(sorted(schema["cyber_law_keywords"]))
+    for website, schema in LegalWebsiteSchema.SCHEMAS.items()
+    if "cyber_law_keywords" in schema
+}
+
+
+class AnalysisOutputModel(BaseModel):
+    """
+    Base class for the structured outputs of the analysis prompts.
+    
+    Validators and schemas are built on first use rather than at import, so importing
+    the prompts does not pay for models that a caller never uses.
+    """
+    model_config = ConfigDict(defer_build=True)
+
+
+class StatutoryMapping(AnalysisOutputModel):
+    issue: str
+    provisions: List[str]
+    interpretation: str
+    precedential_value: str
+
+
+class CaseToLawExtraction(AnalysisOutputModel):
+    """Structured output of a case-to-law analysis."""
+    statutory_mappings: List[StatutoryMapping]
+    novel_applications: List[str]
+    legal_gaps: List[str]
+    compliance_requirements: List[str]
+
+
+class CaseInterpretation(AnalysisOutputModel):
+    case_name: str
+    court: str
+    year: str
+    interpretation: str
+    key_reasoning: str
+    impact: str
+
+
+class ComplianceChecklist(AnalysisOutputModel):
+    mandatory: List[str]
+    recommended: List[str]
+    prohibited: List[str]
+
+
+class LawToCaseExtraction(AnalysisOutputModel):
+    """Structured output of a law-to-case analysis."""
+    case_interpretations: List[CaseInterpretation]
+    evolution_timeline: List[str]
+    settled_principles: List[str]
+    open_questions: List[str]
+    compliance_checklist: ComplianceChecklist
+
+
+class ExtractedPrinciple(AnalysisOutputModel):
+    name: str
+    definition: str
+    source: str
+    rationale: str
+    applications: List[str]
+    limitations: List[str]
+    cyber_law_relevance: float
+
+
+class PrincipleExtraction(AnalysisOutputModel):
+    """Structured output of a principle extraction."""
+    principles: List[ExtractedPrinciple]
+
+
+class PrecedentLink(AnalysisOutputModel):
+    source_case: str
+    cited_case: str
+    relationship: str = Field(description="follows, distinguishes or overrules")
+    rule_of_law: str
+    factual_distinction: str
+    current_validity: str
+
+
+class PrecedentChain(AnalysisOutputModel):
+    principle: str
+    evolution: List[str]
+
+
+class PrecedentMappingExtraction(AnalysisOutputModel):
+    """Structured output of a precedent mapping."""
+    precedent_network: List[PrecedentLink]
+    precedent_chains: List[PrecedentChain]
+
+
+class AnalyzedArgument(AnalysisOutputModel):
+    party: str
+    argument: str
+    authorities: List[str]
+    court_response: str
+    outcome: str
+    effectiveness_factors: List[str]
+
+
+class ArgumentAnalysisExtraction(AnalysisOutputModel):
+    """Structured output of an argument analysis."""
+    arguments: List[AnalyzedArgument]
+    argumentation_patterns: List[str]
+    technical_evidence_role: str
+
+
+class ComplianceRequirement(AnalysisOutputModel):
+    requirement: str
+    applicable_to: List[str]
+    compliance_steps: List[str]
+    deadline: str
+    penalties: str
+    safe_harbors: List[str]
+
+
+class IndustryRequirements(AnalysisOutputModel):
+    industry: str
+    special_requirements: List[str]
+
+
+class ComplianceMappingExtraction(AnalysisOutputModel):
+    """Structured output of a compliance mapping."""
+    compliance_requirements: List[ComplianceRequirement]
+    industry_specific: IndustryRequirements
+
+
+@dataclass(frozen=True, slots=True)
+class PromptSpec:
+    """
+    Immutable definition of a legal analysis prompt.
+    
+    The prompt is split at the template boundary: system and instructions never change
+    and are joined once into stable_prefix, while template holds only the placeholders
+    for the caller's fields. Sending stable_prefix as the system message keeps the
+    cacheable part of every request byte-identical across calls.
+    
+    extraction_schema is the structured output model passed to the LLM client as
+    response_model. Its JSON schema is generated on first access and then reused.
+    """
+    system: str
+    template: str
+    extraction_schema: Type[BaseModel]
+    input_schema: Optional[Mapping[str, Any]] = None
+    instructions: str = ""
+    stable_prefix: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        prefix = f"{self.system}\n\n{self.instructions}" if self.instructions else self.system
+        object.__setattr__(self, "stable_prefix", sys.intern(prefix))
+    
+    @property
+    def extraction_schema_json(self) -> Dict[str, Any]:
+        """JSON schema of the extraction model, e.g. for provider response formats."""
+        return _model_json_schema(self.extraction_schema)
+
+
+@cache
+def _model_json_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    return model.model_json_schema()
+
+
+# Prompt text is hoisted to module constants so every PROMPTS entry and every rendered
+# message shares the same string objects. Each analysis is split into a _TEMPLATE with
+# only the per-call fields and _INSTRUCTIONS that go into the stable system prefix.
+# The constants are interned so equal prompt text compares by identity in cache keys.
+_SYSTEM_CASE_TO_LAW: Final[str] = sys.intern("""You are an expert legal analyst specializing in Indian Cyber Law. 
+            Your task is to analyze case law and identify applicable statutory provisions.""")
+
+_TEMPLATE_CASE_TO_LAW: Final[str] = sys.intern("""Analyze the following case and identify all applicable laws:
 
 Case Details:
 {case_name}
@@ -125,8 +415,9 @@ Legal Issues:
 
 Judgment:
 {judgment}
+""")
 
-Tasks:
+_INSTRUCTIONS_CASE_TO_LAW: Final[str] = sys.intern("""Tasks:
 1. Identify all statutory provisions applied or discussed
 2. Map each legal issue to relevant sections of law
 3. Explain how the court interpreted each provision
@@ -146,34 +437,19 @@ Output Format:
 - Novel Applications: New interpretations of existing law
 - Legal Gaps: Areas needing legislative attention
 - Compliance Implications: What organizations must do
-""",
-            
-            "extraction_schema": {
-                "statutory_mappings": [
-                    {
-                        "issue": "str",
-                        "provisions": ["str"],
-                        "interpretation": "str",
-                        "precedential_value": "str"
-                    }
-                ],
-                "novel_applications": ["str"],
-                "legal_gaps": ["str"],
-                "compliance_requirements": ["str"]
-            }
-        },
-        
-        AnalysisType.LAW_TO_CASE: {
-            "system": """You are an expert legal researcher specializing in case law analysis.
-            Your task is to find how statutory provisions have been interpreted and applied.""",
-            
-            "template": """Analyze how the following statutory provision has been interpreted:
+""")
+
+_SYSTEM_LAW_TO_CASE: Final[str] = sys.intern("""You are an expert legal researcher specializing in case law analysis.
+            Your task is to find how statutory provisions have been interpreted and applied.""")
+
+_TEMPLATE_LAW_TO_CASE: Final[str] = sys.intern("""Analyze how the following statutory provision has been interpreted:
 
 Statute: {statute_name}
 Section: {section}
 Text: {section_text}
+""")
 
-Research Tasks:
+_INSTRUCTIONS_LAW_TO_CASE: Final[str] = sys.intern("""Research Tasks:
 1. Identify all major cases interpreting this provision
 2. Track evolution of interpretation over time
 3. Note conflicting interpretations by different courts
@@ -194,40 +470,18 @@ Required Output:
 - Settled Principles: Universally accepted interpretations
 - Open Questions: Conflicting or unclear areas
 - Compliance Checklist: Dos and Don'ts from case law
-""",
-            
-            "extraction_schema": {
-                "case_interpretations": [
-                    {
-                        "case_name": "str",
-                        "court": "str",
-                        "year": "str",
-                        "interpretation": "str",
-                        "key_reasoning": "str",
-                        "impact": "str"
-                    }
-                ],
-                "evolution_timeline": ["str"],
-                "settled_principles": ["str"],
-                "open_questions": ["str"],
-                "compliance_checklist": {
-                    "mandatory": ["str"],
-                    "recommended": ["str"],
-                    "prohibited": ["str"]
-                }
-            }
-        },
-        
-        AnalysisType.PRINCIPLE_EXTRACTION: {
-            "system": """You are a legal scholar extracting fundamental principles from cyber law cases.
-            Focus on principles that can guide future legal reasoning.""",
-            
-            "template": """Extract legal principles from the following material:
+""")
+
+_SYSTEM_PRINCIPLE_EXTRACTION: Final[str] = sys.intern("""You are a legal scholar extracting fundamental principles from cyber law cases.
+            Focus on principles that can guide future legal reasoning.""")
+
+_TEMPLATE_PRINCIPLE_EXTRACTION: Final[str] = sys.intern("""Extract legal principles from the following material:
 
 Content:
 {content}
+""")
 
-Extract:
+_INSTRUCTIONS_PRINCIPLE_EXTRACTION: Final[str] = sys.intern("""Extract:
 1. Fundamental principles established
 2. Tests or frameworks created by courts
 3. Balancing approaches for competing interests
@@ -249,33 +503,18 @@ Special Focus Areas:
 - Intermediary liability frameworks
 - Cyber crime investigation principles
 - Data protection compliance principles
-""",
-            
-            "extraction_schema": {
-                "principles": [
-                    {
-                        "name": "str",
-                        "definition": "str",
-                        "source": "str",
-                        "rationale": "str",
-                        "applications": ["str"],
-                        "limitations": ["str"],
-                        "cyber_law_relevance": "float"
-                    }
-                ]
-            }
-        },
-        
-        AnalysisType.PRECEDENT_MAPPING: {
-            "system": """You are a legal analyst creating a precedent map for cyber law cases.
-            Track how precedents are cited, followed, distinguished, or overruled.""",
-            
-            "template": """Map the precedential relationships in the following cases:
+""")
+
+_SYSTEM_PRECEDENT_MAPPING: Final[str] = sys.intern("""You are a legal analyst creating a precedent map for cyber law cases.
+            Track how precedents are cited, followed, distinguished, or overruled.""")
+
+_TEMPLATE_PRECEDENT_MAPPING: Final[str] = sys.intern("""Map the precedential relationships in the following cases:
 
 Cases:
 {cases}
+""")
 
-Create a precedent network showing:
+_INSTRUCTIONS_PRECEDENT_MAPPING: Final[str] = sys.intern("""Create a precedent network showing:
 1. Binding precedents vs. persuasive precedents
 2. Cases following earlier precedents
 3. Cases distinguishing precedents
@@ -294,37 +533,17 @@ Special Considerations:
 - Foreign precedents in Indian cyber law
 - Technology changes affecting precedent validity
 - Legislative overruling of judicial precedents
-""",
-            
-            "extraction_schema": {
-                "precedent_network": [
-                    {
-                        "source_case": "str",
-                        "cited_case": "str",
-                        "relationship": "str",  # follows/distinguishes/overrules
-                        "rule_of_law": "str",
-                        "factual_distinction": "str",
-                        "current_validity": "str"
-                    }
-                ],
-                "precedent_chains": [
-                    {
-                        "principle": "str",
-                        "evolution": ["str"]
-                    }
-                ]
-            }
-        },
-        
-        AnalysisType.ARGUMENT_ANALYSIS: {
-            "system": """You are analyzing legal arguments in cyber law cases to understand 
-            successful and unsuccessful argumentation strategies.""",
-            
-            "template": """Analyze the legal arguments in the following case:
+""")
+
+_SYSTEM_ARGUMENT_ANALYSIS: Final[str] = sys.intern("""You are analyzing legal arguments in cyber law cases to understand 
+            successful and unsuccessful argumentation strategies.""")
+
+_TEMPLATE_ARGUMENT_ANALYSIS: Final[str] = sys.intern("""Analyze the legal arguments in the following case:
 
 Case: {case_details}
+""")
 
-Extract and analyze:
+_INSTRUCTIONS_ARGUMENT_ANALYSIS: Final[str] = sys.intern("""Extract and analyze:
 1. Petitioner/Plaintiff arguments
 2. Respondent/Defendant arguments
 3. Intervener arguments (if any)
@@ -345,34 +564,18 @@ Meta-analysis:
 - Common logical fallacies to avoid
 - Persuasive techniques that worked
 - Role of technical evidence
-""",
-            
-            "extraction_schema": {
-                "arguments": [
-                    {
-                        "party": "str",
-                        "argument": "str",
-                        "authorities": ["str"],
-                        "court_response": "str",
-                        "outcome": "str",
-                        "effectiveness_factors": ["str"]
-                    }
-                ],
-                "argumentation_patterns": ["str"],
-                "technical_evidence_role": "str"
-            }
-        },
-        
-        AnalysisType.COMPLIANCE_MAPPING: {
-            "system": """You are a compliance expert extracting actionable compliance 
-            requirements from cyber law cases and statutes.""",
-            
-            "template": """Extract compliance requirements from the following legal material:
+""")
+
+_SYSTEM_COMPLIANCE_MAPPING: Final[str] = sys.intern("""You are a compliance expert extracting actionable compliance 
+            requirements from cyber law cases and statutes.""")
+
+_TEMPLATE_COMPLIANCE_MAPPING: Final[str] = sys.intern("""Extract compliance requirements from the following legal material:
 
 Material:
 {content}
+""")
 
-Identify:
+_INSTRUCTIONS_COMPLIANCE_MAPPING: Final[str] = sys.intern("""Identify:
 1. Mandatory compliance requirements
 2. Best practices endorsed by courts
 3. Practices specifically prohibited
@@ -395,60 +598,338 @@ Industry-specific requirements for:
 - Healthcare providers
 - Educational institutions
 - Government departments
-""",
-            
-            "extraction_schema": {
-                "compliance_requirements": [
-                    {
-                        "requirement": "str",
-                        "applicable_to": ["str"],
-                        "compliance_steps": ["str"],
-                        "deadline": "str",
-                        "penalties": "str",
-                        "safe_harbors": ["str"]
-                    }
-                ],
-                "industry_specific": {
-                    "industry": "str",
-                    "special_requirements": ["str"]
-                }
-            }
+""")
+
+# Batch variants put several items, each behind an "[i]" marker, into one user message
+# so N analyses cost N / batch_size LLM calls. The system message is the analysis's own
+# stable_prefix followed by a _BATCH_OUTPUT section, so single and batch requests share
+# the same cacheable prefix.
+_BATCH_ITEM_CASE_TO_LAW: Final[str] = sys.intern("""Case [{index}]:
+{case_name}
+Court: {court}
+Citation: {citation}
+Date: {date}
+Facts:
+{facts}
+Legal Issues:
+{issues}
+Judgment:
+{judgment}
+""")
+
+_BATCH_OUTPUT_CASE_TO_LAW: Final[str] = sys.intern("""
+Batch Input:
+The user message contains several cases, each introduced by "Case [i]:". Apply the
+tasks above to every case independently.
+
+Batch Output Format (replaces the output format above):
+Respond with one JSON object whose keys are the case indices ("1", "2", ...). The value
+for each case is an object with the keys statutory_mappings, novel_applications,
+legal_gaps and compliance_requirements.
+""")
+
+_BATCH_ITEM_LAW_TO_CASE: Final[str] = sys.intern("""Provision [{index}]:
+Statute: {statute_name}
+Section: {section}
+Text: {section_text}
+""")
+
+_BATCH_OUTPUT_LAW_TO_CASE: Final[str] = sys.intern("""
+Batch Input:
+The user message contains several statutory provisions, each introduced by
+"Provision [i]:". Apply the research tasks above to every provision independently.
+
+Batch Output Format (replaces the required output above):
+Respond with one JSON object whose keys are the provision indices ("1", "2", ...). The
+value for each provision is an object with the keys case_interpretations,
+evolution_timeline, settled_principles, open_questions and compliance_checklist.
+""")
+
+# Matches an "[i]" marker at the start of a line in raw batch responses
+_BATCH_MARKER_PATTERN: Final[re.Pattern[str]] = re.compile(r"^\[(\d+)\]\s*", re.MULTILINE)
+
+
+class LegalAnalysisPrompts:
+    """Advanced prompts for legal analysis and synthetic graph generation."""
+    
+    # Core analysis prompts
+    PROMPTS: Final[Mapping[AnalysisType, PromptSpec]] = MappingProxyType({
+        AnalysisType.CASE_TO_LAW: PromptSpec(
+            system=_SYSTEM_CASE_TO_LAW,
+            instructions=_INSTRUCTIONS_CASE_TO_LAW,
+            template=_TEMPLATE_CASE_TO_LAW,
+            extraction_schema=CaseToLawExtraction
+        ),
+        
+        AnalysisType.LAW_TO_CASE: PromptSpec(
+            system=_SYSTEM_LAW_TO_CASE,
+            instructions=_INSTRUCTIONS_LAW_TO_CASE,
+            template=_TEMPLATE_LAW_TO_CASE,
+            extraction_schema=LawToCaseExtraction
+        ),
+        
+        AnalysisType.PRINCIPLE_EXTRACTION: PromptSpec(
+            system=_SYSTEM_PRINCIPLE_EXTRACTION,
+            instructions=_INSTRUCTIONS_PRINCIPLE_EXTRACTION,
+            template=_TEMPLATE_PRINCIPLE_EXTRACTION,
+            extraction_schema=PrincipleExtraction
+        ),
+        
+        AnalysisType.PRECEDENT_MAPPING: PromptSpec(
+            system=_SYSTEM_PRECEDENT_MAPPING,
+            instructions=_INSTRUCTIONS_PRECEDENT_MAPPING,
+            template=_TEMPLATE_PRECEDENT_MAPPING,
+            extraction_schema=PrecedentMappingExtraction
+        ),
+        
+        AnalysisType.ARGUMENT_ANALYSIS: PromptSpec(
+            system=_SYSTEM_ARGUMENT_ANALYSIS,
+            instructions=_INSTRUCTIONS_ARGUMENT_ANALYSIS,
+            template=_TEMPLATE_ARGUMENT_ANALYSIS,
+            extraction_schema=ArgumentAnalysisExtraction
+        ),
+        
+        AnalysisType.COMPLIANCE_MAPPING: PromptSpec(
+            system=_SYSTEM_COMPLIANCE_MAPPING,
+            instructions=_INSTRUCTIONS_COMPLIANCE_MAPPING,
+            template=_TEMPLATE_COMPLIANCE_MAPPING,
+            extraction_schema=ComplianceMappingExtraction
+        )
+    })
+    
+    # Multi-item variants of the analysis prompts, rendered with build_batch_messages()
+    BATCH_TEMPLATES: Final[Mapping[AnalysisType, Mapping[str, str]]] = _freeze({
+        AnalysisType.CASE_TO_LAW: {
+            "system": sys.intern(
+                PROMPTS[AnalysisType.CASE_TO_LAW].stable_prefix + _BATCH_OUTPUT_CASE_TO_LAW
+            ),
+            "item": _BATCH_ITEM_CASE_TO_LAW
+        },
+        AnalysisType.LAW_TO_CASE: {
+            "system": sys.intern(
+                PROMPTS[AnalysisType.LAW_TO_CASE].stable_prefix + _BATCH_OUTPUT_LAW_TO_CASE
+            ),
+            "item": _BATCH_ITEM_LAW_TO_CASE
         }
-    }
+    })
     
     @classmethod
-    def get_prompt(cls, analysis_type: AnalysisType) -> Dict[str, Any]:
+    def get_prompt(cls, analysis_type: AnalysisType) -> PromptSpec:
         """Get prompt for specific analysis type."""
-        return cls.PROMPTS.get(analysis_type, {})
+        prompt = _PROMPT_TABLE[analysis_type.index]
+        if prompt is None:
+            raise ValueError(f"No prompt is defined for {analysis_type.value} analysis")
+        return prompt
+    
+    @classmethod
+    def build_messages(cls, analysis_type: AnalysisType, **fields: Any) -> List[Message]:
+        """
+        Render the prompt for an analysis type as LLM client messages.
+        
+        The system message is the prompt's stable_prefix and the user message carries
+        only the rendered fields, so consecutive calls share a byte-identical prefix
+        that providers can serve from their prompt cache.
+        
+        Args:
+            analysis_type: Type of analysis to perform
+            **fields: Values for the placeholders in the prompt template
+            
+        Returns:
+            System and user messages for LLMClient.generate_response
+        """
+        prompt = cls.get_prompt(analysis_type)
+        return [
+            Message(role="system", content=prompt.stable_prefix),
+            Message(role="user", content=prompt.template.format(**fields)),
+        ]
+    
+    @classmethod
+    def response_key(cls, analysis_type: AnalysisType, fields: Mapping[str, Any]) -> str:
+        """
+        Build the ResponseCache key for an analysis of the given prompt fields.
+        
+        Args:
+            analysis_type: Type of analysis to perform
+            fields: Values for the placeholders in the prompt template
+            
+        Returns:
+            Analysis type plus a SHA-256 digest of the canonical JSON of the fields
+        """
+        payload = json.dumps(fields, sort_keys=True, default=str)
+        return f"{analysis_type.value}:{hashlib.sha256(payload.encode()).hexdigest()}"
+    
+    @classmethod
+    def render_batch(
+        cls,
+        analysis_type: AnalysisType,
+        items: List[Dict[str, Any]],
+        batch_size: int = 8
+    ) -> List[str]:
+        """
+        Render user prompts that each number up to batch_size items.
+        
+        Args:
+            analysis_type: Type of analysis; must have an entry in BATCH_TEMPLATES
+            items: Template fields for each item, as passed to build_messages
+            batch_size: Maximum number of items per prompt
+            
+        Returns:
+            One prompt per batch; items are numbered from 1 within each batch
+        """
+        item_template = cls.BATCH_TEMPLATES[analysis_type]["item"]
+        return [
+            "\n".join(
+                item_template.format(index=index, **item)
+                for index, item in enumerate(items[start:start + batch_size], start=1)
+            )
+            for start in range(0, len(items), batch_size)
+        ]
+    
+    @classmethod
+    def build_batch_messages(
+        cls,
+        analysis_type: AnalysisType,
+        items: List[Dict[str, Any]],
+        batch_size: int = 8
+    ) -> List[List[Message]]:
+        """
+        Render batch prompts as LLM client messages, one message list per batch.
+        
+        The system message holds the analysis instructions and the batch output format,
+        and the user message carries only the numbered items.
+        
+        Args:
+            analysis_type: Type of analysis; must have an entry in BATCH_TEMPLATES
+            items: Template fields for each item, as passed to build_messages
+            batch_size: Maximum number of items per LLM call
+            
+        Returns:
+            System and user messages for each batch of items
+        """
+        system_prompt = cls.BATCH_TEMPLATES[analysis_type]["system"]
+        return [
+            [
+                Message(role="system", content=system_prompt),
+                Message(role="user", content=batch_prompt),
+            ]
+            for batch_prompt in cls.render_batch(analysis_type, items, batch_size)
+        ]
+    
+    @classmethod
+    def parse_batch_response(
+        cls,
+        response: Any,
+        count: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Split a batch response into per-item results.
+        
+        Accepts either the JSON object keyed by item index that the batch templates
+        ask for, or raw text where each item's JSON follows an "[i]" marker.
+        
+        Args:
+            response: Parsed JSON object or raw response text
+            count: Number of items in the batch
+            
+        Returns:
+            Results in item order; items missing from the response map to an empty dict
+        """
+        results: Dict[int, Dict[str, Any]] = {}
+        if isinstance(response, dict):
+            for key, value in response.items():
+                if str(key).isdigit() and isinstance(value, dict):
+                    results[int(key)] = value
+        else:
+            parts = _BATCH_MARKER_PATTERN.split(str(response))
+            for index, body in zip(parts[1::2], parts[2::2], strict=True):
+                try:
+                    results[int(index)] = json.loads(body)
+                except json.JSONDecodeError:
+                    logger.warning(f"Could not parse batch response item [{index}]")
+        
+        return [results.get(index, {}) for index in range(1, count + 1)]
     
     @classmethod
     def create_custom_prompt(
         cls, 
         analysis_goal: str,
         input_schema: Dict[str, Any],
-        output_schema: Dict[str, Any]
-    ) -> Dict[str, Any]:
+        output_schema: Type[BaseModel]
+    ) -> PromptSpec:
         """Create custom prompt for specific analysis needs."""
-        return {
-            "system": f"You are a legal analyst specializing in {analysis_goal}.",
-            "template": f"""Analyze the following content for {analysis_goal}:
-            
-{{content}}
-
-Required Analysis:
+        return PromptSpec(
+            system=f"You are a legal analyst specializing in {analysis_goal}.",
+            instructions=f"""Required Analysis:
 {analysis_goal}
 
 Output must follow the specified schema.
 """,
-            "input_schema": input_schema,
-            "extraction_schema": output_schema
-        }
+            template=f"""Analyze the following content for {analysis_goal}:
+            
+{{content}}
+""",
+            input_schema=input_schema,
+            extraction_schema=output_schema
+        )
+
+
+# The analysis types are a closed set, so prompts are looked up by position in a tuple
+# instead of hashing the enum into PROMPTS on every call
+_PROMPT_TABLE: Final[Tuple[Optional[PromptSpec], ...]] = tuple(
+    LegalAnalysisPrompts.PROMPTS.get(analysis_type) for analysis_type in AnalysisType
+)
+
+
+class ResponseCache:
+    """
+    Thread-safe, in-memory cache of parsed LLM analysis responses.
+    
+    Responses are stored as JSON strings so every hit returns a fresh copy that the
+    caller is free to mutate. Entries expire after their TTL and the least recently
+    inserted entries are dropped once max_size is reached.
+    """
+    
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 3600.0):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._store: Dict[str, Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._store)
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the cached response for a key, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None:
+                return None
+            serialized, expires_at = entry
+            if expires_at < monotonic():
+                del self._store[key]
+                return None
+        return json.loads(serialized)
+    
+    def set(self, key: str, response: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        """Cache a response for ttl seconds, defaulting to the cache-wide TTL."""
+        serialized = json.dumps(response)
+        expires_at = monotonic() + (ttl if ttl is not None else self.ttl_seconds)
+        with self._lock:
+            self._store.pop(key, None)
+            self._store[key] = (serialized, expires_at)
+            while len(self._store) > self.max_size:
+                del self._store[next(iter(self._store))]
+    
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock:
+            self._store.clear()
 
 
 class SyntheticGraphPrompts:
     """Prompts for generating synthetic legal knowledge graphs."""
     
-    SYNTHESIS_PROMPTS = {
+    SYNTHESIS_PROMPTS: Final[Mapping[str, str]] = _freeze({
         "case_law_synthesis": """Given the following related cases, synthesize a comprehensive understanding:
 
 Cases:
@@ -509,18 +990,61 @@ Generate synthetic nodes for:
 - Conflict resolution frameworks
 - Harmonization opportunities
 """
-    }
+    })
     
     @classmethod
     def get_synthesis_prompt(cls, synthesis_type: str) -> str:
         """Get synthesis prompt for specific type."""
         return cls.SYNTHESIS_PROMPTS.get(synthesis_type, "")
+    
+    @classmethod
+    def render_synthesis_prompt(
+        cls,
+        synthesis_type: str,
+        **materials: List[Dict[str, Any]]
+    ) -> str:
+        """
+        Render a synthesis prompt with its materials in canonical order.
+        
+        Materials are sorted by uuid (then citation and name) and serialized with sorted
+        keys, so the same inputs always render byte-identical prompts regardless of the
+        order callers pass them in. That keeps provider prompt caches warm across runs;
+        any per-request content should be appended after the rendered prompt.
+        
+        Args:
+            synthesis_type: Key into SYNTHESIS_PROMPTS
+            **materials: Item lists for the template placeholders, e.g. cases=[...]
+            
+        Returns:
+            Rendered synthesis prompt
+        """
+        return cls.get_synthesis_prompt(synthesis_type).format(
+            **{name: _canonical(items) for name, items in materials.items()}
+        )
+
+
+def dumps_prompt_json(obj: Any) -> str:
+    """Serialize prompt materials as indented JSON with pydantic_core's Rust encoder."""
+    return to_json(obj, indent=2, fallback=str).decode()
+
+
+def _canonical(items: List[Dict[str, Any]]) -> str:
+    """Serialize prompt materials deterministically."""
+    ordered = sorted(
+        items,
+        key=lambda item: (
+            str(item.get("uuid", "")),
+            str(item.get("citation", "")),
+            str(item.get("name", ""))
+        )
+    )
+    return dumps_prompt_json([{key: item[key] for key in sorted(item)} for item in ordered])
 
 
 class LegalSearchStrategies:
     """Search strategies for different legal research goals."""
     
-    STRATEGIES = {
+    STRATEGIES: Final[Mapping[str, Mapping[str, Any]]] = _freeze({
         "find_applicable_cases": {
             "keywords": ["applied", "interpreted", "section", "provision"],
             "filters": {
@@ -556,9 +1080,35 @@ class LegalSearchStrategies:
             },
             "ranking": "authoritative_source"
         }
-    }
+    })
     
     @classmethod
-    def get_strategy(cls, goal: str) -> Dict[str, Any]:
+    def get_strategy(cls, goal: str) -> Mapping[str, Any]:
         """Get search strategy for specific goal."""
-        return cls.STRATEGIES.get(goal, {})
\ No newline at end of file
+        return cls.STRATEGIES.get(goal, _EMPTY_MAPPING)
+    
+    @classmethod
+    def match_strategies(cls, text: str) -> Set[str]:
+        """
+        Find the research goals whose strategy keywords appear in a document.
+        
+        Args:
+            text: Candidate document text
+            
+        Returns:
+            Goals of every strategy with at least one keyword in the text
+        """
+        return {
+            goal
+            for keyword in _STRATEGY_KEYWORD_MATCHER.find(text)
+            for goal in _STRATEGIES_BY_KEYWORD[keyword]
+        }
+
+
+# Every strategy's keywords go into one matcher so a document is scanned once,
+# and each matched keyword maps back to the strategies that use it
+_STRATEGIES_BY_KEYWORD: Final[Dict[str, List[str]]] = {}
+for _goal, _strategy in LegalSearchStrategies.STRATEGIES.items():
+    for _keyword in sorted(_strategy["keywords"]):
+        _STRATEGIES_BY_KEYWORD.setdefault(_keyword.lower(), []).append(_goal)
+_STRATEGY_KEYWORD_MATCHER: Final[KeywordMatcher] = KeywordMatcher(_STRATEGIES_BY_KEYWORD)
\ No newline at end of file
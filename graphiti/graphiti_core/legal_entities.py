@@ -14,17 +14,37 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from typing import List, Optional
+import json
+import sys
+from functools import cache
+from os import PathLike
+from typing import Any, Dict, Final, Iterator, List, Mapping, Optional, Tuple, Type, Union
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
+# Descriptions shared by several entity types, interned so every field reuses one object
+_DESC_UUID: Final[str] = sys.intern("Unique identifier")
+_DESC_CYBER_LAW_RELEVANCE: Final[str] = sys.intern("Relevance score to cyber law (0-1)")
 
-class CaseLaw(BaseModel):
+
+class LegalEntityModel(BaseModel):
+    """
+    Base class for legal entity types.
+    
+    Parsed entities are immutable value objects, and unknown fields are rejected
+    instead of being silently carried along. Validators are built on first use, so
+    importing the entity types only pays for collecting their fields.
+    """
+    model_config = ConfigDict(frozen=True, extra='forbid', defer_build=True)
+
+
+class CaseLaw(LegalEntityModel):
     """
     Case law entity for legal knowledge graph.
     Represents court decisions and judgments.
     """
-    uuid: str = Field(description="Unique identifier")
+    uuid: str = Field(description=_DESC_UUID)
     name: str = Field(description="Case name (e.g., 'State v. Defendant')")
     summary: str = Field(description="Brief summary of the case")
     citation: str = Field(description="Legal citation (e.g., '2023 SCC 45')")
@@ -39,7 +59,7 @@ class CaseLaw(BaseModel):
         default=0.0,
         ge=0.0,
         le=1.0,
-        description="Relevance score to cyber law (0-1)"
+        description=_DESC_CYBER_LAW_RELEVANCE
     )
     precedential_value: str = Field(
         default="medium",
@@ -59,12 +79,12 @@ class CaseLaw(BaseModel):
     )
 
 
-class Statute(BaseModel):
+class Statute(LegalEntityModel):
     """
     Statute or regulation entity.
     Represents laws, acts, and regulations.
     """
-    uuid: str = Field(description="Unique identifier")
+    uuid: str = Field(description=_DESC_UUID)
     name: str = Field(description="Statute name (e.g., 'Information Technology Act, 2000')")
     summary: str = Field(description="Brief summary of the statute or section")
     section: str = Field(description="Section number (e.g., 'Section 66A')")
@@ -76,7 +96,7 @@ class Statute(BaseModel):
         default=0.0,
         ge=0.0,
         le=1.0,
-        description="Relevance score to cyber law (0-1)"
+        description=_DESC_CYBER_LAW_RELEVANCE
     )
     status: str = Field(
         default="active",
@@ -92,12 +112,12 @@ class Statute(BaseModel):
     )
 
 
-class LegalPrinciple(BaseModel):
+class LegalPrinciple(LegalEntityModel):
     """
     Legal principle or doctrine entity.
     Represents established legal principles and doctrines.
     """
-    uuid: str = Field(description="Unique identifier")
+    uuid: str = Field(description=_DESC_UUID)
     name: str = Field(description="Principle name (e.g., 'Reasonable Expectation of Privacy')")
     summary: str = Field(description="Description of the principle")
     established_by: str = Field(description="Case or statute that established this principle")
@@ -114,12 +134,12 @@ class LegalPrinciple(BaseModel):
     )
 
 
-class LegalProcedure(BaseModel):
+class LegalProcedure(LegalEntityModel):
     """
     Legal procedure or process entity.
     Represents procedural requirements and processes.
     """
-    uuid: str = Field(description="Unique identifier")
+    uuid: str = Field(description=_DESC_UUID)
     name: str = Field(description="Procedure name (e.g., 'Digital Evidence Collection')")
     summary: str = Field(description="Description of the procedure")
     steps: List[str] = Field(description="Ordered list of procedural steps")
@@ -143,12 +163,12 @@ class LegalProcedure(BaseModel):
     )
 
 
-class LegalAuthority(BaseModel):
+class LegalAuthority(LegalEntityModel):
     """
     Legal authority entity.
     Represents judges, regulatory bodies, and other legal authorities.
     """
-    uuid: str = Field(description="Unique identifier")
+    uuid: str = Field(description=_DESC_UUID)
     name: str = Field(description="Authority name")
     summary: str = Field(description="Description of the authority")
     type: str = Field(description="Type: judge, regulator, tribunal, commission")
@@ -167,12 +187,12 @@ class LegalAuthority(BaseModel):
     )
 
 
-class CyberIncident(BaseModel):
+class CyberIncident(LegalEntityModel):
     """
     Cyber incident entity.
     Represents specific cyber incidents referenced in legal contexts.
     """
-    uuid: str = Field(description="Unique identifier")
+    uuid: str = Field(description=_DESC_UUID)
     name: str = Field(description="Incident name or identifier")
     summary: str = Field(description="Description of the incident")
     incident_type: str = Field(
@@ -193,12 +213,12 @@ class CyberIncident(BaseModel):
     )
 
 
-class LegalArgument(BaseModel):
+class LegalArgument(LegalEntityModel):
     """
     Legal argument entity.
     Represents specific legal arguments made in cases.
     """
-    uuid: str = Field(description="Unique identifier")
+    uuid: str = Field(description=_DESC_UUID)
     name: str = Field(description="Argument identifier")
     summary: str = Field(description="Summary of the argument")
     made_by: str = Field(description="Party making the argument")
@@ -219,12 +239,12 @@ class LegalArgument(BaseModel):
     )
 
 
-class LegalConcept(BaseModel):
+class LegalConcept(LegalEntityModel):
     """
     Abstract legal concept entity.
     Represents conceptual legal frameworks and theories.
     """
-    uuid: str = Field(description="Unique identifier")
+    uuid: str = Field(description=_DESC_UUID)
     name: str = Field(description="Concept name")
     summary: str = Field(description="Description of the concept")
     domain: str = Field(description="Legal domain: criminal, civil, constitutional, etc.")
@@ -242,7 +262,7 @@ class LegalConcept(BaseModel):
 
 
 # Entity type definitions for Graphiti
-LEGAL_ENTITY_TYPES = {
+LEGAL_ENTITY_TYPES: Final[Dict[str, Type[LegalEntityModel]]] = {
     'CaseLaw': CaseLaw,
     'Statute': Statute,
     'LegalPrinciple': LegalPrinciple,
@@ -253,8 +273,137 @@ LEGAL_ENTITY_TYPES = {
     'LegalConcept': LegalConcept
 }
 
+@cache
+def _entity_json_schema(entity_type: str) -> Dict[str, Any]:
+    return LEGAL_ENTITY_TYPES[entity_type].model_json_schema()
+
+
+class _LazyJsonSchemas(Mapping[str, Dict[str, Any]]):
+    """Read-only mapping that generates each entity type's JSON schema on first access."""
+    
+    def __getitem__(self, entity_type: str) -> Dict[str, Any]:
+        if entity_type not in LEGAL_ENTITY_TYPES:
+            raise KeyError(entity_type)
+        return _entity_json_schema(entity_type)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(LEGAL_ENTITY_TYPES)
+    
+    def __len__(self) -> int:
+        return len(LEGAL_ENTITY_TYPES)
+
+
+# JSON schemas are generated once per entity type, on first use rather than at import.
+# Field descriptions stay on the models because graphiti reads them to build the
+# attribute extraction prompts.
+LEGAL_ENTITY_JSON_SCHEMAS: Final[Mapping[str, Dict[str, Any]]] = _LazyJsonSchemas()
+
+
+@cache
+def _bulk_adapter(entity_type: str) -> TypeAdapter[list[Any]]:
+    cls = LEGAL_ENTITY_TYPES[entity_type]
+    # The item type is looked up at runtime, so it is not a static type expression
+    entity_list: Any = list[cls]
+    return TypeAdapter(entity_list)
+
+
+def decode_bulk(entity_type: str, payload: Union[str, bytes]) -> List[LegalEntityModel]:
+    """
+    Decode a JSON array of legal entities of one type.
+    
+    The whole payload is parsed and validated in a single pass by pydantic-core,
+    instead of json.loads followed by one model construction per record.
+    
+    Args:
+        entity_type: Key into LEGAL_ENTITY_TYPES, e.g. 'CaseLaw'
+        payload: JSON array of entity objects
+        
+    Returns:
+        Validated entity models
+    """
+    return _bulk_adapter(entity_type).validate_json(payload)
+
+
+# Relevance scores in [0, 1] are stored in bulk arrays as uint8 steps of 1/255
+RELEVANCE_SCALE: Final[int] = 255
+
+# Fixed-width CaseLaw fields loaded into columns by load_case_law_bulk
+CASE_LAW_RECORD_DTYPE: Final[np.dtype] = np.dtype([
+    ("uuid", "U36"),
+    ("cyber_law_relevance", "u1"),
+    ("date", "datetime64[D]"),
+    ("precedential_value", "U11")
+])
+
+# List-typed CaseLaw fields kept per uuid alongside the record array
+CASE_LAW_LIST_FIELDS: Final[Tuple[str, ...]] = (
+    "judges",
+    "legal_reasoning",
+    "applied_principles",
+    "distinguished_cases"
+)
+
+
+def quantize_relevance(values: Any) -> np.ndarray:
+    """
+    Quantize relevance scores in [0, 1] to uint8 steps of 1/RELEVANCE_SCALE.
+    
+    Args:
+        values: A score or array-like of scores
+        
+    Returns:
+        uint8 array with the shape of values; out-of-range scores are clipped
+    """
+    scores = np.clip(np.asarray(values, dtype=np.float32), 0.0, 1.0)
+    return np.rint(scores * RELEVANCE_SCALE).astype(np.uint8)
+
+
+def dequantize_relevance(values: Any) -> np.ndarray:
+    """Convert quantized relevance scores back to float32 scores in [0, 1]."""
+    return np.asarray(values, dtype=np.float32) / RELEVANCE_SCALE
+
+
+def load_case_law_bulk(
+    path: Union[str, PathLike]
+) -> Tuple[np.recarray, Dict[str, Dict[str, List[str]]]]:
+    """
+    Load a JSON array of CaseLaw records into a numpy record array.
+    
+    Records are not validated; this is for bulk ingest of data that was written by
+    the graph, where the fixed-width fields are filtered as columns. Relevance is
+    quantized to uint8, so thresholds are quantized too, e.g.
+    records[records.cyber_law_relevance >= quantize_relevance(0.7)].
+    
+    Args:
+        path: Path of a JSON file holding a list of CaseLaw objects
+        
+    Returns:
+        Record array with the CASE_LAW_RECORD_DTYPE fields, and the
+        CASE_LAW_LIST_FIELDS of each record keyed by uuid
+    """
+    with open(path, "rb") as f:
+        raw = json.load(f)
+    
+    records = np.recarray(len(raw), dtype=CASE_LAW_RECORD_DTYPE)
+    records.uuid = [r["uuid"] for r in raw]
+    records.cyber_law_relevance = quantize_relevance(
+        [r.get("cyber_law_relevance", 0.0) for r in raw]
+    )
+    # Dates may carry a time part; only the ISO day is kept
+    records.date = np.array(
+        [(r.get("date") or "NaT")[:10] for r in raw],
+        dtype="datetime64[D]"
+    )
+    records.precedential_value = [r.get("precedential_value", "medium") for r in raw]
+    
+    list_fields = {
+        r["uuid"]: {name: r.get(name, []) for name in CASE_LAW_LIST_FIELDS}
+        for r in raw
+    }
+    return records, list_fields
+
 
-def get_legal_entity_type_descriptions():
+def get_legal_entity_type_descriptions() -> Dict[str, str]:
     """Get descriptions for legal entity types."""
     return {
         'CaseLaw': 'Court decisions, judgments, and case law relevant to cyber law',
@@ -0,0 +1,137 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any
+from uuid import uuid4
+
+from openai import AsyncOpenAI
+
+from ..prompts.models import Message
+from .config import DEFAULT_MAX_TOKENS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_COLLECT_SECONDS = 1.0
+DEFAULT_BATCH_POLL_SECONDS = 30.0
+BATCH_FINAL_STATUSES = frozenset({'completed', 'failed', 'expired', 'cancelled'})
+
+
+class OpenAIBatchProcessor:
+    """
+    Runs JSON chat completions through the OpenAI Batch API.
+
+    Batch requests cost half as much as regular ones and do not count against the
+    per-minute rate limits, but may take up to the completion window to finish. Requests
+    submitted within collect_seconds of each other share one batch; each submit()
+    resolves once the batch has completed and its output has been downloaded.
+    """
+
+    def __init__(
+        self,
+        client: AsyncOpenAI,
+        model: str,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        temperature: float | None = None,
+        collect_seconds: float = DEFAULT_BATCH_COLLECT_SECONDS,
+        poll_seconds: float = DEFAULT_BATCH_POLL_SECONDS,
+        completion_window: str = '24h',
+    ):
+        self.client = client
+        self.model = model
+        self.max_tokens = max_tokens
+        self.temperature = temperature
+        self.collect_seconds = collect_seconds
+        self.poll_seconds = poll_seconds
+        self.completion_window = completion_window
+        self._pending: dict[str, tuple[dict[str, Any], asyncio.Future[dict[str, Any]]]] = {}
+        self._flush_task: asyncio.Task | None = None
+
+    async def submit(self, messages: list[Message]) -> dict[str, Any]:
+        body: dict[str, Any] = {
+            'model': self.model,
+            'messages': [{'role': m.role, 'content': m.content} for m in messages],
+            'max_tokens': self.max_tokens,
+            'response_format': {'type': 'json_object'},
+        }
+        if self.temperature is not None:
+            body['temperature'] = self.temperature
+
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._pending[str(uuid4())] = (body, future)
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_collecting())
+        return await future
+
+    async def _flush_after_collecting(self):
+        await asyncio.sleep(self.collect_seconds)
+        requests, self._pending, self._flush_task = self._pending, {}, None
+        try:
+            await self._run_batch(requests)
+        except Exception as e:
+            for _, future in requests.values():
+                if not future.done():
+                    future.set_exception(e)
+
+    async def _run_batch(
+        self, requests: dict[str, tuple[dict[str, Any], asyncio.Future[dict[str, Any]]]]
+    ):
+        lines = '\n'.join(
+            json.dumps(
+                {
+                    'custom_id': custom_id,
+                    'method': 'POST',
+                    'url': '/v1/chat/completions',
+                    'body': body,
+                }
+            )
+            for custom_id, (body, _) in requests.items()
+        )
+        input_file = await self.client.files.create(
+            file=('batch_input.jsonl', lines.encode()), purpose='batch'
+        )
+        batch = await self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint='/v1/chat/completions',
+            completion_window=self.completion_window,  # type: ignore[arg-type]
+        )
+        logger.debug(f'Submitted batch {batch.id} with {len(requests)} requests')
+
+        while batch.status not in BATCH_FINAL_STATUSES:
+            await asyncio.sleep(self.poll_seconds)
+            batch = await self.client.batches.retrieve(batch.id)
+
+        if batch.output_file_id:
+            output = await self.client.files.content(batch.output_file_id)
+            for line in output.text.splitlines():
+                if not line.strip():
+                    continue
+                result = json.loads(line)
+                entry = requests.get(result.get('custom_id', ''))
+                if entry is None or entry[1].done():
+                    continue
+                future = entry[1]
+                try:
+                    content = result['response']['body']['choices'][0]['message']['content']
+                    future.set_result(json.loads(content or '{}'))
+                except (KeyError, IndexError, TypeError, json.JSONDecodeError) as e:
+                    future.set_exception(Exception(f'Invalid batch response: {e}'))
+
+        for _, future in requests.values():
+            if not future.done():
+                future.set_exception(Exception(f'Batch {batch.id} ended as {batch.status}'))
@@ -0,0 +1,128 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import hashlib
+import sqlite3
+from collections.abc import Sequence
+from pathlib import Path
+from time import time
+from typing import Any
+
+from pydantic_core import from_json, to_json
+
+from .models import Message
+
+DEFAULT_LLM_PROMPT_CACHE_PATH = './.llm_prompt_cache.sqlite3'
+DEFAULT_LLM_PROMPT_CACHE_TTL_DAYS = 7
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    hash TEXT PRIMARY KEY,
+    model TEXT,
+    prompt_version TEXT,
+    response BLOB,
+    tokens INTEGER,
+    created_at INTEGER,
+    expires_at INTEGER
+);
+CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at);
+"""
+
+
+class LLMPromptCache:
+    """
+    SQLite-backed cache of LLM responses keyed by the rendered prompt.
+
+    Keys hash the prompt version, the model and every message, so changing a prompt
+    string together with its PROMPT_VERSION invalidates all of its cached responses at
+    once. Expired rows are never returned and are deleted by evict_expired().
+    """
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_LLM_PROMPT_CACHE_PATH,
+        ttl_days: float = DEFAULT_LLM_PROMPT_CACHE_TTL_DAYS,
+    ):
+        self.path = str(path)
+        self.ttl_seconds = int(ttl_days * 24 * 60 * 60)
+        self._connection: sqlite3.Connection | None = None
+
+    @staticmethod
+    def key(messages: Sequence[Message], model_id: str | None, prompt_version: str) -> str:
+        # pydantic_core's Rust JSON encoder is several times faster than the json module
+        payload = to_json([prompt_version, model_id, [[m.role, m.content] for m in messages]])
+        return hashlib.sha256(payload).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            # WAL lets concurrent readers proceed while a response is being written
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.executescript(_SCHEMA)
+        return self._connection
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        row = (
+            self._connect()
+            .execute(
+                'SELECT response FROM responses WHERE hash = ? AND expires_at > ?',
+                (key, int(time())),
+            )
+            .fetchone()
+        )
+        return from_json(row[0]) if row is not None else None
+
+    def set(
+        self,
+        key: str,
+        response: dict[str, Any],
+        tokens: int | None = None,
+        model_id: str | None = None,
+        prompt_version: str | None = None,
+    ):
+        now = int(time())
+        connection = self._connect()
+        with connection:
+            connection.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (
+                    key,
+                    model_id,
+                    prompt_version,
+                    to_json(response, fallback=str),
+                    tokens,
+                    now,
+                    now + self.ttl_seconds,
+                ),
+            )
+
+    def evict_expired(self) -> int:
+        connection = self._connect()
+        with connection:
+            cursor = connection.execute(
+                'DELETE FROM responses WHERE expires_at <= ?', (int(time()),)
+            )
+        return cursor.rowcount
+
+    def clear(self):
+        connection = self._connect()
+        with connection:
+            connection.execute('DELETE FROM responses')
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
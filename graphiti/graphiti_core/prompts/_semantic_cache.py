@@ -0,0 +1,65 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+from collections.abc import Hashable
+from typing import Any
+
+from graphiti_core.embedder import EmbedderClient
+from graphiti_core.search.semantic_cache import DEFAULT_CACHE_SIZE, SemanticSearchCache
+
+from ._llm_cache import DEFAULT_LLM_PROMPT_CACHE_TTL_DAYS
+
+DEFAULT_SEMANTIC_RESPONSE_THRESHOLD = 0.92
+
+
+class SemanticResponseCache:
+    """
+    In-memory cache of LLM responses looked up by the embedding of the prompt input.
+
+    Near-duplicate inputs, such as boilerplate recitals that differ only in whitespace or
+    numbering, embed almost identically and reuse the same response. Only entries with
+    the same key (prompt version, model and system prompt) are compared, and responses
+    are stored as JSON so each hit returns a fresh copy.
+    """
+
+    def __init__(
+        self,
+        embedder: EmbedderClient,
+        threshold: float = DEFAULT_SEMANTIC_RESPONSE_THRESHOLD,
+        max_size: int = DEFAULT_CACHE_SIZE,
+        ttl_seconds: float = DEFAULT_LLM_PROMPT_CACHE_TTL_DAYS * 24 * 60 * 60,
+    ):
+        self.embedder = embedder
+        self._cache: SemanticSearchCache[str] = SemanticSearchCache(
+            max_size=max_size, ttl_seconds=ttl_seconds, threshold=threshold
+        )
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    async def embed(self, text: str) -> list[float]:
+        return await self.embedder.create(input_data=[text.replace('\n', ' ')])
+
+    def get(self, embedding: list[float], key: Hashable) -> dict[str, Any] | None:
+        response = self._cache.get(embedding, key)
+        return json.loads(response) if response is not None else None
+
+    def set(self, embedding: list[float], key: Hashable, response: dict[str, Any]):
+        self._cache.put(embedding, key, json.dumps(response, default=str))
+
+    def clear(self):
+        self._cache.clear()
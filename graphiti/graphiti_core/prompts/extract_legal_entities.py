@@ -14,15 +14,20 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from typing import Any, Protocol, TypedDict
+from collections.abc import Callable, Sequence
+from functools import lru_cache
+from typing import Any, Final, Protocol, TypedDict
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
-from .models import Message, PromptFunction, PromptVersion
+from .models import Message, PromptVersion
 
 
 class LegalEntity(BaseModel):
     """Base model for legal entities."""
+    # Core schemas are built on first validation instead of at import; subclasses
+    # inherit the config
+    model_config = ConfigDict(defer_build=True)
     name: str = Field(..., description='Name of the legal entity')
     entity_type: str = Field(..., description='Type: case_law, statute, principle, procedure, party, judge')
     description: str = Field(..., description='Brief description of the entity')
@@ -57,14 +62,29 @@ class LegalPrincipleEntity(LegalEntity):
 
 class ExtractedLegalEntities(BaseModel):
     """Container for all extracted legal entities."""
+    model_config = ConfigDict(defer_build=True)
     case_laws: list[CaseLawEntity] = Field(default_factory=list)
     statutes: list[StatuteEntity] = Field(default_factory=list)
     principles: list[LegalPrincipleEntity] = Field(default_factory=list)
     general_entities: list[LegalEntity] = Field(default_factory=list)
 
 
+class IndexedExtraction(BaseModel):
+    """Entities extracted from one document of a batch."""
+    model_config = ConfigDict(defer_build=True)
+    doc_id: int = Field(..., description='id of the <DOC> the entities were extracted from')
+    entities: ExtractedLegalEntities
+
+
+class BatchedExtraction(BaseModel):
+    """Entities extracted from every document of a batch."""
+    model_config = ConfigDict(defer_build=True)
+    results: list[IndexedExtraction] = Field(default_factory=list)
+
+
 class LegalRelationship(BaseModel):
     """Relationship between legal entities."""
+    model_config = ConfigDict(defer_build=True)
     source_entity: str = Field(..., description='Name of the source entity')
     target_entity: str = Field(..., description='Name of the target entity')
     relationship_type: str = Field(
@@ -76,76 +96,52 @@ class LegalRelationship(BaseModel):
 
 class ExtractedLegalRelationships(BaseModel):
     """Container for extracted legal relationships."""
+    model_config = ConfigDict(defer_build=True)
     relationships: list[LegalRelationship] = Field(default_factory=list)
 
 
-class ExtractLegalEntitiesPromptInputs(Protocol):
-    """Input protocol for legal entity extraction."""
-    context: str
-    cyber_law_focus: bool
-    jurisdiction: str
-    entity_types: list[str]
+class CategoryScore(BaseModel):
+    """Relevance of a text to one cyber law category."""
+    model_config = ConfigDict(defer_build=True)
+    category: str = Field(..., description='Cyber law category')
+    relevance: float = Field(default=0.0, ge=0.0, le=1.0, description='Relevance score (0-1)')
+    key_points: list[str] = Field(
+        default_factory=list, description='Key points that make the text relevant'
+    )
+    implications: list[str] = Field(
+        default_factory=list, description='Practical implications for cyber law practice'
+    )
+    precedential_value: str = Field(default='', description='Precedential value of the text')
 
 
-async def extract_legal_entities_prompt_v1(
-    inputs: ExtractLegalEntitiesPromptInputs,
-) -> list[Message]:
-    """Extract legal entities from legal documents with focus on cyber law."""
-    
-    context = f"""
-You are a legal AI assistant specialized in Indian Cyber Law. Extract legal entities from the provided text.
+class CyberLawClassification(BaseModel):
+    """Classification of a text against the cyber law categories."""
+    model_config = ConfigDict(defer_build=True)
+    categories: list[CategoryScore] = Field(default_factory=list)
+    novel_principles: list[str] = Field(
+        default_factory=list, description='Novel legal principles for cyber law'
+    )
+    procedural_insights: list[str] = Field(
+        default_factory=list, description='Procedural insights for cyber cases'
+    )
+    compliance_requirements: list[str] = Field(
+        default_factory=list, description='Compliance requirements mentioned'
+    )
+
 
-Focus Areas for Cyber Law:
+# Static prompt text is built once at import; the builders only concatenate the
+# per-call fields between fixed headers and footers. Each rule is stated once, in the
+# system prompt, and the user message only carries the inputs.
+_CYBER_LAW_FOCUS_AREAS_BLOCK: Final[str] = """Focus Areas for Cyber Law:
 1. Information Technology Act, 2000 and amendments
 2. Data protection and privacy laws
 3. Cybercrime and electronic evidence
 4. Digital signatures and electronic contracts
 5. Intermediary liability
 6. Cyber security regulations
-
-Text to analyze:
-{inputs.context}
-
-Jurisdiction: {inputs.jurisdiction}
-Entity types to extract: {', '.join(inputs.entity_types)}
-Cyber law focus: {'Yes - prioritize cyber law relevance' if inputs.cyber_law_focus else 'No - general legal extraction'}
-
-Instructions:
-1. Identify all legal entities (cases, statutes, principles, procedures)
-2. For each entity, assess its relevance to cyber law (0-1 score)
-3. Extract key relationships between entities
-4. Focus on precedents that shape cyber law jurisprudence
-5. Identify procedures relevant to cyber law practice
 """
 
-    return [
-        Message(
-            role='system',
-            content='You are an expert legal analyst specializing in Indian Cyber Law. '
-            'Extract structured legal information that can be used to build a comprehensive legal knowledge graph.'
-        ),
-        Message(role='user', content=context),
-    ]
-
-
-async def extract_legal_relationships_prompt_v1(
-    entities: list[LegalEntity],
-    context: str,
-) -> list[Message]:
-    """Extract relationships between legal entities."""
-    
-    entities_list = '\n'.join([f"- {e.name} ({e.entity_type})" for e in entities])
-    
-    prompt = f"""
-Given the following legal entities and context, identify relationships between them:
-
-Entities:
-{entities_list}
-
-Context:
-{context}
-
-Identify relationships such as:
+_RELATIONSHIP_TYPES_BLOCK: Final[str] = """Identify relationships such as:
 - Citation relationships (case A cites case B)
 - Overruling relationships (case A overrules case B)
 - Statutory interpretation (case interprets statute)
@@ -159,194 +155,276 @@ For cyber law, pay special attention to:
 - Digital evidence admissibility standards
 """
 
-    return [
-        Message(
-            role='system',
-            content='You are a legal relationship analyst. Identify and categorize relationships between legal entities.'
-        ),
-        Message(role='user', content=prompt),
-    ]
-
-
-async def classify_legal_relevance_prompt_v1(
-    text: str,
-    cyber_law_categories: list[str],
-) -> list[Message]:
-    """Classify text relevance to different cyber law categories."""
-    
-    categories_list = '\n'.join([f"- {cat}" for cat in cyber_law_categories])
-    
-    prompt = f"""
-Analyze the following legal text and classify its relevance to cyber law categories:
-
-Text:
-{text}
-
-Cyber Law Categories:
-{categories_list}
-
-For each category, provide:
-1. Relevance score (0-1)
-2. Key points that make it relevant
-3. Practical implications for cyber law practice
-
-Also identify:
-- Novel legal principles for cyber law
-- Procedural insights for cyber cases
-- Compliance requirements mentioned
-"""
 
-    return [
-        Message(
-            role='system',
-            content='You are a cyber law classification expert. Analyze legal texts for their relevance to various aspects of cyber law.'
-        ),
-        Message(role='user', content=prompt),
-    ]
+@lru_cache(maxsize=128)
+def _format_bullets(items: tuple[str, ...]) -> str:
+    return '\n'.join(f'- {item}' for item in items)
 
 
-def extract_legal_entities(context: dict[str, Any]) -> list[Message]:
-    """Extract legal entities from legal documents."""
-    
-    sys_prompt = """You are a legal AI assistant specialized in Indian Cyber Law. 
-    Extract legal entities from the provided text with focus on cyber law relevance."""
-    
-    user_prompt = f"""
-<TEXT>
-{context['content']}
-</TEXT>
-
-Focus Areas for Cyber Law:
-1. Information Technology Act, 2000 and amendments
-2. Data protection and privacy laws
-3. Cybercrime and electronic evidence
-4. Digital signatures and electronic contracts
-5. Intermediary liability
-6. Cyber security regulations
+def _entity_pair(entity: dict[str, Any] | LegalEntity) -> tuple[str, str]:
+    # Entity references are dicts from the extraction responses or LegalEntity models;
+    # both render the same so the relationship prompt stays byte-identical
+    if isinstance(entity, dict):
+        return entity['name'], entity['type']
+    return entity.name, entity.entity_type
+
+
+# Refinement passes re-send the same entities with updated context, so the rendered
+# list is cached by its (name, type) pairs
+@lru_cache(maxsize=256)
+def _format_entities(pairs: tuple[tuple[str, str], ...]) -> str:
+    return '\n'.join(f'- {name} ({entity_type})' for name, entity_type in pairs)
 
+
+# Everything that does not depend on the document lives in the system prompts, so every
+# call shares a byte-identical prefix that providers can serve from their prompt cache.
+# Only the strings are shared: VersionWrapper and LLMClient.generate_response append to
+# message content in place, so each call still builds its own Message objects. The
+# builders return tuples; LLM clients append retry messages, so callers pass list(...).
+EXTRACT_LEGAL_ENTITIES_SYSTEM_PROMPT: Final[str] = (
+    """You are a legal AI assistant specialized in Indian Cyber Law.
+Extract legal entities from the text in <TEXT> with focus on cyber law relevance.
+
+"""
+    + _CYBER_LAW_FOCUS_AREAS_BLOCK
+    + """
 Extract the following types of legal entities:
 - Case Laws (with citations, court, date, key holdings)
 - Statutes and Regulations (with sections and provisions)
 - Legal Principles and Doctrines
 - Legal Procedures and Processes
 - Parties, Judges, and Legal Authorities
+"""
+)
+
+EXTRACT_LEGAL_ENTITIES_BATCH_SYSTEM_PROMPT: Final[str] = (
+    EXTRACT_LEGAL_ENTITIES_SYSTEM_PROMPT
+    + """
+The text is split across the <DOC> elements of <DOCS> instead of <TEXT>. Extract the
+entities of each <DOC> separately and return one result per document, with doc_id set to
+the id of its <DOC>.
+"""
+)
 
-For each entity:
-1. Provide a clear name
-2. Classify its type
-3. Assess cyber law relevance (0-1 score)
-4. Extract key attributes
-5. Note relationships to other entities
+EXTRACT_LEGAL_RELATIONSHIPS_SYSTEM_PROMPT: Final[str] = (
+    """You are a legal relationship analyst.
+Identify and categorize relationships between the legal entities in <ENTITIES>,
+using the text in <CONTEXT>.
 
-{context.get('custom_prompt', '')}
 """
-    
-    return [
-        Message(role='system', content=sys_prompt),
-        Message(role='user', content=user_prompt),
-    ]
+    + _RELATIONSHIP_TYPES_BLOCK
+)
 
+DEFAULT_CYBER_LAW_CATEGORIES: Final[tuple[str, ...]] = (
+    'Data Protection & Privacy',
+    'Cybercrime & Electronic Evidence',
+    'Digital Contracts & E-Commerce',
+    'Intermediary Liability',
+    'Cyber Security Compliance',
+    'Digital Rights & Freedom',
+)
 
-def extract_legal_relationships(context: dict[str, Any]) -> list[Message]:
-    """Extract relationships between legal entities."""
-    
-    sys_prompt = """You are a legal relationship analyst. 
-    Identify and categorize relationships between legal entities."""
-    
-    entities_list = '\n'.join([f"- {e['name']} ({e['type']})" for e in context['entities']])
-    
-    user_prompt = f"""
-<ENTITIES>
-{entities_list}
-</ENTITIES>
-
-<CONTEXT>
-{context['content']}
-</CONTEXT>
-
-Identify relationships such as:
-- Citation relationships (case A cites case B)
-- Overruling relationships (case A overrules case B)
-- Statutory interpretation (case interprets statute)
-- Principle application (case applies legal principle)
-- Procedural relationships (procedure derives from statute/case)
+CLASSIFY_CYBER_LAW_RELEVANCE_SYSTEM_PROMPT_TEMPLATE: Final[str] = """You are a cyber law classification expert.
+Analyze the legal text in <TEXT> for its relevance to various aspects of cyber law.
 
-For cyber law, pay special attention to:
-- How cases interpret IT Act provisions
-- Evolution of data protection principles
-- Cybercrime investigation procedures
-- Digital evidence admissibility standards
+<CATEGORIES>
+{categories}
+</CATEGORIES>
+
+Score every category, and also identify novel legal principles, procedural insights and
+compliance requirements.
 """
-    
-    return [
-        Message(role='system', content=sys_prompt),
-        Message(role='user', content=user_prompt),
-    ]
 
+_DEFAULT_CATEGORIES_BLOCK: Final[str] = _format_bullets(DEFAULT_CYBER_LAW_CATEGORIES)
 
-def classify_cyber_law_relevance(context: dict[str, Any]) -> list[Message]:
-    """Classify content relevance to cyber law categories."""
-    
-    sys_prompt = """You are a cyber law classification expert. 
-    Analyze legal texts for their relevance to various aspects of cyber law."""
-    
-    categories = context.get('categories', [
-        'Data Protection & Privacy',
-        'Cybercrime & Electronic Evidence',
-        'Digital Contracts & E-Commerce',
-        'Intermediary Liability',
-        'Cyber Security Compliance',
-        'Digital Rights & Freedom'
-    ])
-    
-    user_prompt = f"""
-<TEXT>
-{context['content']}
-</TEXT>
+CLASSIFY_CYBER_LAW_RELEVANCE_SYSTEM_PROMPT: Final[str] = (
+    CLASSIFY_CYBER_LAW_RELEVANCE_SYSTEM_PROMPT_TEMPLATE.format(categories=_DEFAULT_CATEGORIES_BLOCK)
+)
+
+# Compact shape of one streamed category, escaped for use in the str.format template.
+# The other builders describe no output format: their response models are passed to
+# the LLM client as structured-output schemas.
+_CATEGORY_SCHEMA_STUB: Final[str] = (
+    '{{"category": str, "relevance": float 0-1, "key_points": [str], '
+    '"implications": [str], "precedential_value": str}}'
+)
+
+# Streaming variant: one JSON object per line, so each category can be parsed and handed
+# to the caller as soon as its line is complete
+CLASSIFY_CYBER_LAW_RELEVANCE_STREAM_SYSTEM_PROMPT_TEMPLATE: Final[str] = (
+    """You are a cyber law classification expert.
+Analyze the legal text in <TEXT> for its relevance to each category in <CATEGORIES>.
 
 <CATEGORIES>
-{chr(10).join([f"- {cat}" for cat in categories])}
+{categories}
 </CATEGORIES>
 
-Analyze the text and for each category provide:
-1. Relevance score (0-1)
-2. Key points that make it relevant
-3. Practical implications for cyber law practice
-4. Precedential value
-
-Also identify:
-- Novel legal principles for cyber law
-- Procedural insights for cyber cases
-- Compliance requirements mentioned
+Respond with NDJSON: exactly one JSON object per line, one line per category, in the order above.
+"""
+    + _CATEGORY_SCHEMA_STUB
+    + """
+Do not wrap the lines in a code block and do not add any other text.
 """
-    
-    return [
+)
+
+_EXTRACT_ENTITIES_HEADER: Final[str] = '\n<TEXT>\n'
+_EXTRACT_ENTITIES_FOOTER: Final[str] = '\n</TEXT>\n\n'
+_EXTRACT_REL_HEADER: Final[str] = '\n<ENTITIES>\n'
+_EXTRACT_REL_SEPARATOR: Final[str] = '\n</ENTITIES>\n\n<CONTEXT>\n'
+_EXTRACT_REL_FOOTER: Final[str] = '\n</CONTEXT>\n'
+_CLASSIFY_HEADER: Final[str] = '\n<TEXT>\n'
+_CLASSIFY_FOOTER: Final[str] = '\n</TEXT>\n'
+
+
+@lru_cache(maxsize=128)
+def _classify_system_prompt(categories: tuple[str, ...]) -> str:
+    return CLASSIFY_CYBER_LAW_RELEVANCE_SYSTEM_PROMPT_TEMPLATE.format(
+        categories=_format_bullets(categories)
+    )
+
+
+@lru_cache(maxsize=128)
+def _classify_stream_system_prompt(categories: tuple[str, ...]) -> str:
+    return CLASSIFY_CYBER_LAW_RELEVANCE_STREAM_SYSTEM_PROMPT_TEMPLATE.format(
+        categories=_format_bullets(categories)
+    )
+
+
+def extract_legal_entities(context: dict[str, Any]) -> Sequence[Message]:
+    """Extract legal entities from legal documents."""
+    user_prompt = ''.join(
+        (
+            _EXTRACT_ENTITIES_HEADER,
+            context['content'],
+            _EXTRACT_ENTITIES_FOOTER,
+            context.get('custom_prompt', ''),
+            '\n',
+        )
+    )
+
+    return (
+        Message(role='system', content=EXTRACT_LEGAL_ENTITIES_SYSTEM_PROMPT),
+        Message(role='user', content=user_prompt),
+    )
+
+
+def extract_legal_entities_batch(context: dict[str, Any]) -> Sequence[Message]:
+    """Extract legal entities from several documents in one prompt, one result per doc id."""
+    parts = ['<DOCS>\n']
+    for doc_id, content in enumerate(context['documents']):
+        parts += ('<DOC id=', str(doc_id), '>\n', content, '\n</DOC>\n')
+    parts += ('</DOCS>\n\n', context.get('custom_prompt', ''), '\n')
+
+    return (
+        Message(role='system', content=EXTRACT_LEGAL_ENTITIES_BATCH_SYSTEM_PROMPT),
+        Message(role='user', content=''.join(parts)),
+    )
+
+
+def extract_legal_relationships(context: dict[str, Any]) -> Sequence[Message]:
+    """Extract relationships between legal entities."""
+    entities_list = _format_entities(tuple(map(_entity_pair, context['entities'])))
+
+    user_prompt = ''.join(
+        (
+            _EXTRACT_REL_HEADER,
+            entities_list,
+            _EXTRACT_REL_SEPARATOR,
+            context['content'],
+            _EXTRACT_REL_FOOTER,
+        )
+    )
+
+    return (
+        Message(role='system', content=EXTRACT_LEGAL_RELATIONSHIPS_SYSTEM_PROMPT),
+        Message(role='user', content=user_prompt),
+    )
+
+
+def classify_cyber_law_relevance(context: dict[str, Any]) -> Sequence[Message]:
+    """Classify content relevance to cyber law categories."""
+    # Only custom categories need a different system prompt, and those are cached too
+    categories = context.get('categories')
+    sys_prompt = (
+        _classify_system_prompt(tuple(categories))
+        if categories
+        else CLASSIFY_CYBER_LAW_RELEVANCE_SYSTEM_PROMPT
+    )
+
+    user_prompt = ''.join((_CLASSIFY_HEADER, context['content'], _CLASSIFY_FOOTER))
+
+    return (
         Message(role='system', content=sys_prompt),
         Message(role='user', content=user_prompt),
-    ]
+    )
+
+
+def classify_cyber_law_relevance_stream(context: dict[str, Any]) -> Sequence[Message]:
+    """Classify content relevance to cyber law categories, one NDJSON line per category."""
+    categories = tuple(context.get('categories') or DEFAULT_CYBER_LAW_CATEGORIES)
+    user_prompt = ''.join((_CLASSIFY_HEADER, context['content'], _CLASSIFY_FOOTER))
+
+    return (
+        Message(role='system', content=_classify_stream_system_prompt(categories)),
+        Message(role='user', content=user_prompt),
+    )
+
+
+async def build_all_prompts(
+    context: dict[str, Any],
+) -> tuple[Sequence[Message], Sequence[Message], Sequence[Message]]:
+    """
+    Build the entity, relationship and classification prompts for one document.
+
+    The three prompts are independent given context['entities'], so their LLM calls can
+    be gathered concurrently. Without entities, extract them first and gather the
+    relationship and classification calls afterwards.
+    """
+    return (
+        extract_legal_entities(context),
+        extract_legal_relationships({**context, 'entities': context.get('entities', [])}),
+        classify_cyber_law_relevance(context),
+    )
 
 
 # Version mappings
-Versions = TypedDict(
-    'Versions',
-    {
-        'extract_legal_entities': Any,
-        'extract_legal_relationships': Any,
-        'classify_cyber_law_relevance': Any,
-    },
-)
+LegalPromptFunction = Callable[[dict[str, Any]], Sequence[Message]]
 
-Prompt = TypedDict(
-    'Prompt',
-    {
-        'extract_legal_entities': Any,
-        'extract_legal_relationships': Any,
-        'classify_cyber_law_relevance': Any,
-    },
-)
+
+class Prompt(Protocol):
+    extract_legal_entities: PromptVersion
+    extract_legal_entities_batch: PromptVersion
+    extract_legal_relationships: PromptVersion
+    classify_cyber_law_relevance: PromptVersion
+    classify_cyber_law_relevance_stream: PromptVersion
+
+
+class Versions(TypedDict):
+    extract_legal_entities: LegalPromptFunction
+    extract_legal_entities_batch: LegalPromptFunction
+    extract_legal_relationships: LegalPromptFunction
+    classify_cyber_law_relevance: LegalPromptFunction
+    classify_cyber_law_relevance_stream: LegalPromptFunction
+
+
+# Bump whenever a prompt in this module changes, so cached responses to the old prompts
+# are no longer used
+PROMPT_VERSION = 'v3'
 
 versions: Versions = {
     'extract_legal_entities': extract_legal_entities,
+    'extract_legal_entities_batch': extract_legal_entities_batch,
     'extract_legal_relationships': extract_legal_relationships,
     'classify_cyber_law_relevance': classify_cyber_law_relevance,
-}
\ No newline at end of file
+    'classify_cyber_law_relevance_stream': classify_cyber_law_relevance_stream,
+}
+
+# Shared validators for parsing responses. They are deferred with their models, and
+# once built every validate_json call reuses the compiled validator.
+EXTRACTED_ENTITIES_ADAPTER: Final[TypeAdapter[ExtractedLegalEntities]] = TypeAdapter(
+    ExtractedLegalEntities
+)
+EXTRACTED_RELATIONSHIPS_ADAPTER: Final[TypeAdapter[ExtractedLegalRelationships]] = TypeAdapter(
+    ExtractedLegalRelationships
+)
+CATEGORY_SCORE_ADAPTER: Final[TypeAdapter[CategoryScore]] = TypeAdapter(CategoryScore)
@@ -0,0 +1,64 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from collections.abc import Iterable, Sequence
+from typing import Any, TypeVar
+
+import numpy as np
+
+# Below this many nodes the numpy setup costs more than a plain Python pass
+NUMPY_MIN_NODES = 128
+
+T = TypeVar('T')
+
+
+def node_attribute(node: Any, name: str, default: Any = None) -> Any:
+    # Custom entity fields live in EntityNode.attributes, while typed entity models
+    # expose them as regular attributes
+    attributes = getattr(node, 'attributes', None)
+    if isinstance(attributes, dict) and name in attributes:
+        return attributes[name]
+    return getattr(node, name, default)
+
+
+def filter_nodes_by_category(nodes: Sequence[T], categories: Iterable[str]) -> list[T]:
+    # Categories are free-form strings, so each node still needs one lookup of its own
+    # category; a frozenset membership test is the whole filter
+    allowed = categories if isinstance(categories, frozenset) else frozenset(categories)
+    return [node for node in nodes if node_attribute(node, 'cyber_law_category') in allowed]
+
+
+def max_node_score(nodes: Sequence[Any], name: str) -> float:
+    if not nodes:
+        return 0.0
+
+    scores = np.fromiter(
+        (node_attribute(node, name) or 0.0 for node in nodes),
+        dtype=np.float32,
+        count=len(nodes),
+    )
+    return float(scores.max(initial=0.0))
+
+
+def sort_nodes_by_date(nodes: Sequence[T]) -> list[T]:
+    dates = [str(node_attribute(node, 'date', '')) for node in nodes]
+    if len(nodes) <= NUMPY_MIN_NODES:
+        order: Iterable[int] = sorted(range(len(nodes)), key=dates.__getitem__)
+    else:
+        # Legal entity dates are ISO-8601 strings, so a stable argsort over the strings is
+        # chronological without parsing and matches sorted(key=date)
+        order = np.argsort(np.array(dates), kind='stable')
+    return [nodes[i] for i in order]
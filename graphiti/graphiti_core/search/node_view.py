@@ -0,0 +1,97 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+import numpy as np
+from numpy._typing import NDArray
+
+from graphiti_core.search.legal_post_filters import node_attribute
+
+T = TypeVar('T')
+
+
+@dataclass
+class NodeView(Generic[T]):
+    """
+    Columnar view over the legal fields of a list of nodes.
+
+    The fields are read once in from_nodes(); filters are then boolean masks over the
+    columns and select() maps a mask back to the original nodes.
+    """
+
+    nodes: list[T]
+    has_compliance: NDArray[np.bool_]
+    has_date: NDArray[np.bool_]
+    has_citation: NDArray[np.bool_]
+    has_key_holding: NDArray[np.bool_]
+    dates: NDArray[np.str_]
+    category_codes: NDArray[np.int32]
+    categories: list[str]
+    relevance: NDArray[np.float32]
+
+    @classmethod
+    def from_nodes(cls, nodes: Sequence[T]) -> 'NodeView[T]':
+        count = len(nodes)
+        has_compliance = np.zeros(count, dtype=np.bool_)
+        has_date = np.zeros(count, dtype=np.bool_)
+        has_citation = np.zeros(count, dtype=np.bool_)
+        has_key_holding = np.zeros(count, dtype=np.bool_)
+        category_codes = np.full(count, -1, dtype=np.int32)
+        relevance = np.zeros(count, dtype=np.float32)
+        dates: list[str] = []
+        category_index: dict[str, int] = {}
+
+        for i, node in enumerate(nodes):
+            date = node_attribute(node, 'date')
+            has_date[i] = bool(date)
+            dates.append(str(date) if date else '')
+            has_compliance[i] = bool(node_attribute(node, 'compliance_requirements'))
+            has_citation[i] = bool(node_attribute(node, 'citation'))
+            has_key_holding[i] = bool(node_attribute(node, 'key_holding'))
+            relevance[i] = node_attribute(node, 'cyber_law_relevance') or 0.0
+
+            category = node_attribute(node, 'cyber_law_category')
+            if category:
+                category_codes[i] = category_index.setdefault(category, len(category_index))
+
+        return cls(
+            nodes=list(nodes),
+            has_compliance=has_compliance,
+            has_date=has_date,
+            has_citation=has_citation,
+            has_key_holding=has_key_holding,
+            dates=np.array(dates, dtype=np.str_),
+            category_codes=category_codes,
+            categories=list(category_index),
+            relevance=relevance,
+        )
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def category_mask(self, categories: Sequence[str]) -> NDArray[np.bool_]:
+        codes = [self.categories.index(c) for c in categories if c in self.categories]
+        return np.isin(self.category_codes, codes)
+
+    def select(self, mask: NDArray[np.bool_] | None = None, sort_by_date: bool = False) -> list[T]:
+        indices = np.arange(len(self.nodes)) if mask is None else np.flatnonzero(mask)
+        if sort_by_date:
+            # Dates are ISO-8601 strings, so a stable string argsort is chronological
+            indices = indices[np.argsort(self.dates[indices], kind='stable')]
+        return [self.nodes[i] for i in indices]
@@ -0,0 +1,85 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import hashlib
+from collections import OrderedDict
+
+DEFAULT_ONE_HOP_CACHE_SIZE = 10_000
+
+
+class OneHopCache:
+    """
+    LRU cache from small entity lookups to the uuids of the nodes they returned.
+
+    Only uuids are stored, so a hit costs one fetch by uuid instead of a full hybrid
+    search. Keys include a per-group version that invalidate() bumps on writes.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_ONE_HOP_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries: OrderedDict[str, list[str]] = OrderedDict()
+        self._group_versions: dict[str, int] = {}
+        self._global_version = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(
+        self,
+        query: str,
+        group_ids: list[str] | None,
+        limit: int,
+        node_labels: list[str] | None = None,
+    ) -> str:
+        sorted_group_ids = sorted(group_ids or [])
+        versions = (
+            [self._group_versions.get(group_id, 0) for group_id in sorted_group_ids]
+            if sorted_group_ids
+            else [self._global_version]
+        )
+        raw_key = repr(
+            (
+                query.lower().strip(),
+                sorted_group_ids,
+                versions,
+                limit,
+                sorted(node_labels or []),
+            )
+        )
+        return hashlib.sha1(raw_key.encode()).hexdigest()
+
+    def get(self, key: str) -> list[str] | None:
+        uuids = self._entries.get(key)
+        if uuids is not None:
+            self._entries.move_to_end(key)
+        return uuids
+
+    def put(self, key: str, uuids: list[str]):
+        self._entries[key] = uuids
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, group_ids: list[str] | None = None):
+        # Lookups without group_ids cover every group, so any write invalidates them too
+        self._global_version += 1
+        if group_ids is None:
+            self._entries.clear()
+            return
+
+        for group_id in group_ids:
+            self._group_versions[group_id] = self._group_versions.get(group_id, 0) + 1
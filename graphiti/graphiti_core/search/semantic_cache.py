@@ -0,0 +1,190 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+from collections import OrderedDict, deque
+from collections.abc import Hashable
+from dataclasses import dataclass
+from pathlib import Path
+from time import monotonic
+from typing import Generic, TypeVar
+
+import numpy as np
+from numpy._typing import NDArray
+
+from graphiti_core.helpers import normalize_l2
+
+DEFAULT_SIMILARITY_THRESHOLD = 0.97
+DEFAULT_CACHE_SIZE = 256
+DEFAULT_CACHE_TTL_SECONDS = 300.0
+
+T = TypeVar('T')
+
+
+@dataclass
+class CacheEntry(Generic[T]):
+    embedding: NDArray
+    key: Hashable
+    value: T
+    created_at: float
+
+
+class SemanticSearchCache(Generic[T]):
+    """
+    In-memory cache of search results keyed by query embedding.
+
+    A lookup hits when a cached entry has the same key (the search filters) and its
+    query embedding has a cosine similarity of at least the threshold with the new query.
+    Entries expire after ttl_seconds and the least recently used entry is evicted once
+    max_size is reached. Keys should include group_versions() for the searched groups so
+    that invalidate() makes stale entries unreachable.
+
+    The embeddings of each key are stacked into one float32 matrix on first lookup and
+    kept until an entry of that key is added or removed, so a lookup is a single
+    matrix-vector product instead of restacking every candidate.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_CACHE_SIZE,
+        ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.threshold = threshold
+        self._entries: OrderedDict[int, CacheEntry[T]] = OrderedDict()
+        # Entry ids in creation order, which is also expiry order
+        self._created: deque[tuple[float, int]] = deque()
+        self._matrices: dict[Hashable, tuple[list[int], NDArray[np.float32]]] = {}
+        self._group_versions: dict[str, int] = {}
+        self._global_version = 0
+        self._next_id = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def group_versions(self, group_ids: list[str] | None) -> tuple[int, ...]:
+        if not group_ids:
+            return (self._global_version,)
+
+        return tuple(self._group_versions.get(group_id, 0) for group_id in sorted(group_ids))
+
+    def invalidate(self, group_ids: list[str] | None = None):
+        # Searches without group_ids cover every group, so any write invalidates them too
+        self._global_version += 1
+        if group_ids is None:
+            self.clear()
+            return
+
+        for group_id in group_ids:
+            self._group_versions[group_id] = self._group_versions.get(group_id, 0) + 1
+
+    def clear(self):
+        self._entries.clear()
+        self._created.clear()
+        self._matrices.clear()
+
+    def get(
+        self, embedding: list[float], key: Hashable, threshold: float | None = None
+    ) -> T | None:
+        self._evict_expired()
+
+        candidates = self._key_matrix(key)
+        if candidates is None:
+            return None
+
+        entry_ids, matrix = candidates
+        similarities = matrix @ normalize_l2(embedding).astype(np.float32)
+        best = int(np.argmax(similarities))
+        if similarities[best] < (threshold if threshold is not None else self.threshold):
+            return None
+
+        entry_id = entry_ids[best]
+        self._entries.move_to_end(entry_id)
+        return self._entries[entry_id].value
+
+    def put(self, embedding: list[float], key: Hashable, value: T):
+        self._add(normalize_l2(embedding), key, value, monotonic())
+        self._evict_oldest()
+
+    def save(self, path: str | Path):
+        """
+        Write the live entries to an .npz file so a later process can load() them.
+
+        Keys and values must be JSON serializable; tuple keys are restored as tuples.
+        """
+        self._evict_expired()
+        entries = list(self._entries.values())
+        embeddings = (
+            np.stack([entry.embedding for entry in entries])
+            if entries
+            else np.empty((0, 0), dtype=np.float64)
+        )
+        items = json.dumps([[entry.key, entry.value] for entry in entries], default=str)
+        with open(path, 'wb') as file:
+            np.savez(file, embeddings=embeddings, items=np.array(items))
+
+    def load(self, path: str | Path):
+        """Add the entries of a file written by save(); their TTL restarts now."""
+        with np.load(path) as data:
+            embeddings = data['embeddings']
+            items = json.loads(str(data['items']))
+
+        created_at = monotonic()
+        for embedding, (key, value) in zip(embeddings, items, strict=True):
+            self._add(embedding, tuple(key) if isinstance(key, list) else key, value, created_at)
+        self._evict_oldest()
+
+    def _add(self, embedding: NDArray, key: Hashable, value: T, created_at: float):
+        self._entries[self._next_id] = CacheEntry(
+            embedding=embedding, key=key, value=value, created_at=created_at
+        )
+        self._created.append((created_at, self._next_id))
+        self._matrices.pop(key, None)
+        self._next_id += 1
+
+    def _evict_oldest(self):
+        while len(self._entries) > self.max_size:
+            _, entry = self._entries.popitem(last=False)
+            self._matrices.pop(entry.key, None)
+        # Ids of evicted entries linger in the expiry queue until they expire
+        if len(self._created) > 2 * max(self.max_size, 1):
+            self._created = deque(
+                (created_at, entry_id)
+                for created_at, entry_id in self._created
+                if entry_id in self._entries
+            )
+
+    def _evict_expired(self):
+        cutoff = monotonic() - self.ttl_seconds
+        while self._created and self._created[0][0] < cutoff:
+            _, entry_id = self._created.popleft()
+            entry = self._entries.pop(entry_id, None)
+            if entry is not None:
+                self._matrices.pop(entry.key, None)
+
+    def _key_matrix(self, key: Hashable) -> tuple[list[int], NDArray[np.float32]] | None:
+        candidates = self._matrices.get(key)
+        if candidates is None:
+            entry_ids = [
+                entry_id for entry_id, entry in self._entries.items() if entry.key == key
+            ]
+            if not entry_ids:
+                return None
+            matrix = np.stack([self._entries[i].embedding for i in entry_ids]).astype(np.float32)
+            candidates = self._matrices[key] = (entry_ids, matrix)
+        return candidates
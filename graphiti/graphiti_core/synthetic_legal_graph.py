@@ -15,27 +15,121 @@ limitations under the License.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
+import os
+import sys
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from functools import cache
+from itertools import chain
+from typing import (
+    Any, AsyncIterator, Dict, Final, FrozenSet, List, Mapping, Optional, Tuple, Type, cast
+)
 
+import numpy as np
+from openai import AsyncOpenAI
 from pydantic import BaseModel, Field
 
 from graphiti_core.edges import EntityEdge
+from graphiti_core.helpers import SEMAPHORE_LIMIT, AsyncRateLimiter, semaphore_gather
 from graphiti_core.nodes import EntityNode
-from graphiti_core.legal_entities import LEGAL_ENTITY_TYPES
 from graphiti_core.legal_analysis_prompts import (
     AnalysisType,
     LegalAnalysisPrompts,
     LegalWebsiteSchema,
+    ResponseCache,
     SyntheticGraphPrompts,
-    LegalSearchStrategies
+    LegalSearchStrategies,
+    dumps_prompt_json
 )
-from graphiti_core.utils.web_crawler import WebCrawler
+from graphiti_core.llm_client.openai_base_client import DEFAULT_MODEL
+from graphiti_core.llm_client.openai_batch import OpenAIBatchProcessor
+from graphiti_core.prompts._llm_cache import LLMPromptCache
+from graphiti_core.prompts.models import Message
+from graphiti_core.search.legal_post_filters import node_attribute
+from graphiti_core.search.semantic_cache import SemanticSearchCache
 
 logger = logging.getLogger(__name__)
 
+# Document pages fetched at once per website
+DEFAULT_CRAWL_CONCURRENCY = 8
+# Documents ingested into the graph at once; kept low because ingestion contends on
+# graph database writes
+DEFAULT_INGEST_CONCURRENCY = 4
+# System messages of the synthesis prompts, interned once so every request reuses them
+_CASE_LAW_SYNTHESIS_SYSTEM: Final[str] = sys.intern(
+    "You are a legal analyst creating synthetic understanding from multiple cases."
+)
+_STATUTE_CASE_INTEGRATION_SYSTEM: Final[str] = sys.intern(
+    "You are integrating statutory law with case law interpretations."
+)
+# Crawled documents waiting for analysis; bounds memory when crawling outpaces the LLM
+DEFAULT_PIPELINE_QUEUE_SIZE = 32
+# LLM requests started per minute across all of a synthesizer's calls
+DEFAULT_LLM_REQUESTS_PER_MINUTE = 500
+# Texts sent per embedder request; chunks are embedded concurrently
+DEFAULT_EMBEDDING_BATCH_SIZE = 256
+# Principles whose embeddings are at least this cosine-similar are treated as duplicates
+DEFAULT_PRINCIPLE_DEDUPE_THRESHOLD = 0.9
+
+
+def _document_key(doc: Dict[str, Any]) -> Any:
+    """Identify a document by its citation, or by a hash of its normalized content."""
+    citation = doc.get('metadata', {}).get('citation')
+    if citation:
+        return " ".join(citation.split()).lower()
+    content = " ".join(str(doc.get('content', '')).split()).lower()
+    return hashlib.sha256(content.encode()).digest()
+
+
+def _near_duplicate_mask(embeddings: List[List[float]], threshold: float) -> np.ndarray:
+    """Mark the rows to keep, dropping each row too similar to an earlier kept row."""
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    matrix /= np.where(norms == 0, 1, norms)
+    # One matrix product gives every pairwise cosine similarity
+    similarity = matrix @ matrix.T
+    
+    keep = np.ones(len(matrix), dtype=np.bool_)
+    for i in range(len(matrix)):
+        if keep[i]:
+            keep[i + 1:] &= similarity[i, i + 1:] < threshold
+    return keep
+
+
+def _confidence(value: Any, default: float) -> float:
+    """Clamp an LLM-reported confidence into [0, 1], falling back to default."""
+    try:
+        return min(max(float(value), 0.0), 1.0)
+    except (TypeError, ValueError):
+        return default
+
+
+# Roles used to dispatch relationship analyses, by entity type name
+_ROLE_BY_LABEL: Final[Dict[str, str]] = {'CaseLaw': 'case', 'Statute': 'statute'}
+
+
+@cache
+def _accepted_fields(model: Type[BaseModel]) -> FrozenSet[str]:
+    """Field names of an entity model, computed once per model."""
+    return frozenset(model.model_fields)
+
+
+def _entity_role(entity: Any) -> Optional[str]:
+    """Classify an entity as a 'case' or 'statute', or None for other types."""
+    # Legal entity models are named after their entity type
+    role = _ROLE_BY_LABEL.get(type(entity).__name__)
+    if role is not None:
+        return role
+    # Nodes read from the graph are plain EntityNodes tagged with their entity type label
+    for label in getattr(entity, 'labels', ()):
+        role = _ROLE_BY_LABEL.get(label)
+        if role is not None:
+            return role
+    return None
+
 
 class SyntheticNode(BaseModel):
     """Synthetic node generated from analysis."""
@@ -57,22 +151,277 @@ class SyntheticEdge(BaseModel):
     derived_from: List[str]  # Source edges or analysis
 
 
+@dataclass(frozen=True, slots=True)
+class _PendingAnalysis:
+    """An analysis that missed every cache, with the keys to store its result under."""
+    analysis_type: AnalysisType
+    messages: List[Message]
+    cache_key: str
+    disk_key: Optional[str]
+    input_vector: Optional[List[float]]
+
+
 class LegalGraphSynthesizer:
     """Synthesizes legal knowledge graphs from multiple sources."""
     
-    def __init__(self, graphiti_instance):
+    def __init__(
+        self,
+        graphiti_instance,
+        semantic_threshold: Optional[float] = None,
+        crawl_concurrency: int = DEFAULT_CRAWL_CONCURRENCY,
+        llm_concurrency: Optional[int] = None,
+        ingest_concurrency: int = DEFAULT_INGEST_CONCURRENCY,
+        semantic_cache_path: Optional[str] = None,
+        llm_requests_per_minute: Optional[float] = DEFAULT_LLM_REQUESTS_PER_MINUTE,
+        disk_cache_path: Optional[str] = None
+    ):
         """
         Initialize the synthesizer.
         
         Args:
             graphiti_instance: Instance of Graphiti class
+            semantic_threshold: If set, an analysis whose input embedding has at least
+                this cosine similarity with a cached analysis of the same type reuses
+                its response; None disables the semantic cache
+            crawl_concurrency: Maximum document pages crawled at once per website
+            llm_concurrency: Default maximum concurrent analysis calls, sized to the
+                LLM provider's rate limit; None uses SEMAPHORE_LIMIT
+            ingest_concurrency: Maximum documents added to the graph at once
+            semantic_cache_path: File the semantic cache is loaded from, if it exists,
+                and written to by save_semantic_cache(), so re-runs of the same
+                research reuse earlier analyses
+            llm_requests_per_minute: Rate at which LLM requests, including crawls with
+                LLM extraction, are started, set to the provider tier's limit so
+                concurrent calls do not hit 429s; None disables rate limiting
+            disk_cache_path: SQLite file that keeps analysis and synthesis responses
+                across runs, keyed by a hash of the model and rendered prompt; None
+                keeps responses in memory only
         """
         self.graphiti = graphiti_instance
+        self.crawl_concurrency = crawl_concurrency
+        self.llm_concurrency = llm_concurrency
+        self.ingest_concurrency = ingest_concurrency
         self.llm_client = graphiti_instance.llm_client
         self.embedder = graphiti_instance.embedder
+        self._rate_limiter: Optional[AsyncRateLimiter] = (
+            AsyncRateLimiter(llm_requests_per_minute)
+            if llm_requests_per_minute is not None
+            else None
+        )
         self.prompts = LegalAnalysisPrompts()
+        # Looked up on every analysis, so copied into a plain dict once per synthesizer.
+        # Only analysis types that have a prompt are included.
+        self._prompt_specs = dict(self.prompts.PROMPTS)
         self.schemas = LegalWebsiteSchema()
+        # Read-only schema table flattened into a plain dict for single-lookup access
+        self._schema_by_site: Dict[str, Mapping[str, Any]] = {
+            sys.intern(site): schema for site, schema in self.schemas.SCHEMAS.items()
+        }
+        self._all_sites: Tuple[str, ...] = tuple(self._schema_by_site)
+        self.response_cache = ResponseCache()
+        self.semantic_cache: Optional[SemanticSearchCache[str]] = (
+            SemanticSearchCache(
+                ttl_seconds=self.response_cache.ttl_seconds,
+                threshold=semantic_threshold
+            )
+            if semantic_threshold is not None
+            else None
+        )
+        self.semantic_cache_path = semantic_cache_path
+        self.disk_cache: Optional[LLMPromptCache] = (
+            LLMPromptCache(disk_cache_path) if disk_cache_path is not None else None
+        )
+        self._batch_processor: Optional[OpenAIBatchProcessor] = None
+        if (
+            self.semantic_cache is not None
+            and semantic_cache_path is not None
+            and os.path.exists(semantic_cache_path)
+        ):
+            self.semantic_cache.load(semantic_cache_path)
+    
+    def save_semantic_cache(self) -> None:
+        """Write the semantic cache to semantic_cache_path, if both are configured."""
+        if self.semantic_cache is not None and self.semantic_cache_path is not None:
+            self.semantic_cache.save(self.semantic_cache_path)
+    
+    async def _lookup_analysis(
+        self,
+        analysis_type: AnalysisType,
+        fields: Dict[str, Any],
+        input_vector: Optional[List[float]] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[_PendingAnalysis]]:
+        """
+        Look up an analysis in the response, disk and semantic caches.
+        
+        Args:
+            analysis_type: Type of analysis to perform
+            fields: Values for the placeholders in the prompt template
+            input_vector: Embedding of the rendered input, if already computed for
+                the semantic cache
+            
+        Returns:
+            The cached analysis and None on a hit, or None and the pending analysis
+            to generate and pass to _store_analysis on a miss
+        """
+        # Identical analyses (common in evaluation loops) skip the LLM entirely
+        cache_key = self.prompts.response_key(analysis_type, fields)
+        cached_analysis = self.response_cache.get(cache_key)
+        if cached_analysis is not None:
+            return cached_analysis, None
+        
+        messages = self.prompts.build_messages(analysis_type, **fields)
+        
+        # Re-runs of the same research find earlier responses on disk
+        disk_key = self._disk_cache_key(messages, analysis_type.value)
+        if self.disk_cache is not None and disk_key is not None:
+            stored_analysis = self.disk_cache.get(disk_key)
+            if stored_analysis is not None:
+                self.response_cache.set(cache_key, stored_analysis)
+                return stored_analysis, None
+        
+        # Inputs that differ only in formatting embed almost identically, so a close
+        # enough cached analysis of the same type is reused as well
+        if self.semantic_cache is None:
+            input_vector = None
+        else:
+            if input_vector is None:
+                input_vector = await self._embed_analysis_input(messages[-1].content)
+            similar_analysis = (
+                self.semantic_cache.get(input_vector, analysis_type.value)
+                if input_vector is not None
+                else None
+            )
+            if similar_analysis is not None:
+                analysis = json.loads(similar_analysis)
+                self.response_cache.set(cache_key, analysis)
+                return analysis, None
+        
+        return None, _PendingAnalysis(analysis_type, messages, cache_key, disk_key, input_vector)
+    
+    def _store_analysis(self, pending: _PendingAnalysis, analysis: Dict[str, Any]) -> None:
+        """Cache a generated analysis everywhere _lookup_analysis looks for it."""
+        self.response_cache.set(pending.cache_key, analysis)
+        if self.disk_cache is not None and pending.disk_key is not None:
+            self.disk_cache.set(pending.disk_key, analysis, model_id=self.llm_client.model)
+        if self.semantic_cache is not None and pending.input_vector is not None:
+            self.semantic_cache.put(
+                pending.input_vector,
+                pending.analysis_type.value,
+                json.dumps(analysis, default=str)
+            )
+    
+    async def _run_analysis(
+        self,
+        analysis_type: AnalysisType,
+        fields: Dict[str, Any],
+        input_vector: Optional[List[float]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run an analysis prompt through the LLM, reusing cached responses.
+        
+        Args:
+            analysis_type: Type of analysis to perform
+            fields: Values for the placeholders in the prompt template
+            input_vector: Embedding of the rendered input, if already computed for
+                the semantic cache
+            
+        Returns:
+            Parsed analysis response
+        """
+        cached_analysis, pending = await self._lookup_analysis(
+            analysis_type, fields, input_vector
+        )
+        if pending is None:
+            return cast(Dict[str, Any], cached_analysis)
+        
+        prompt_data = self._prompt_specs[analysis_type]
+        analysis = await self._generate_response(
+            pending.messages,
+            response_model=prompt_data.extraction_schema
+        )
+        self._store_analysis(pending, analysis)
+        return analysis
+    
+    def _disk_cache_key(self, messages: List[Message], prompt_version: str) -> Optional[str]:
+        """Key a response in the disk cache, or None if the disk cache is disabled."""
+        if self.disk_cache is None:
+            return None
+        return self.disk_cache.key(messages, self.llm_client.model, prompt_version)
+    
+    async def _acquire_rate_limit(self) -> None:
+        """Wait for the next LLM request slot, if rate limiting is enabled."""
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire()
+    
+    async def _generate_response(
+        self,
+        messages: List[Message],
+        response_model: Optional[Type[BaseModel]] = None
+    ) -> Dict[str, Any]:
+        """Call the LLM client once the rate limiter allows another request."""
+        await self._acquire_rate_limit()
+        return await self.llm_client.generate_response(messages, response_model=response_model)
+    
+    async def _embed_analysis_input(self, text: str) -> Optional[List[float]]:
+        """Embed a rendered analysis input, or return None if the embedder fails."""
+        try:
+            return await self.embedder.create(input_data=[text.replace('\n', ' ')])
+        except Exception as e:
+            logger.warning(f"Skipping semantic analysis cache: {e}")
+            return None
+    
+    async def _embed_all(
+        self,
+        texts: List[str],
+        chunk_size: int = DEFAULT_EMBEDDING_BATCH_SIZE
+    ) -> List[List[float]]:
+        """
+        Embed texts with as few embedder requests as possible.
         
+        Args:
+            texts: Texts to embed
+            chunk_size: Maximum texts per create_batch request
+            
+        Returns:
+            One embedding per text, in order
+        """
+        chunks = await semaphore_gather(*[
+            self.embedder.create_batch(texts[start:start + chunk_size])
+            for start in range(0, len(texts), chunk_size)
+        ])
+        return list(chain.from_iterable(chunks))
+    
+    async def dedupe_principles(
+        self,
+        principles: List[Dict[str, Any]],
+        threshold: float = DEFAULT_PRINCIPLE_DEDUPE_THRESHOLD
+    ) -> List[Dict[str, Any]]:
+        """
+        Drop principles that restate an earlier principle.
+        
+        Args:
+            principles: Extracted principles, in order of preference
+            threshold: Cosine similarity at which two principles are duplicates
+            
+        Returns:
+            The first principle of each group of near-duplicates
+        """
+        if len(principles) < 2:
+            return principles
+        
+        texts = [
+            f"{principle.get('name', '')}: {principle.get('definition', '')}".replace('\n', ' ')
+            for principle in principles
+        ]
+        try:
+            embeddings = await self._embed_all(texts)
+        except Exception as e:
+            logger.warning(f"Skipping principle deduplication: {e}")
+            return principles
+        
+        keep = _near_duplicate_mask(embeddings, threshold)
+        return [principles[i] for i in np.flatnonzero(keep)]
+    
     async def analyze_case_to_law(
         self,
         case_content: Dict[str, Any]
@@ -86,19 +435,7 @@ class LegalGraphSynthesizer:
         Returns:
             Analysis results with statutory mappings
         """
-        prompt_data = self.prompts.get_prompt(AnalysisType.CASE_TO_LAW)
-        
-        # Format the prompt with case data
-        formatted_prompt = prompt_data["template"].format(**case_content)
-        
-        # Get analysis from LLM
-        analysis = await self.llm_client.generate_response(
-            system_prompt=prompt_data["system"],
-            user_prompt=formatted_prompt,
-            response_model=prompt_data["extraction_schema"]
-        )
-        
-        return analysis
+        return await self._run_analysis(AnalysisType.CASE_TO_LAW, case_content)
     
     async def analyze_law_to_case(
         self,
@@ -113,17 +450,100 @@ class LegalGraphSynthesizer:
         Returns:
             Analysis results with case interpretations
         """
-        prompt_data = self.prompts.get_prompt(AnalysisType.LAW_TO_CASE)
+        return await self._run_analysis(AnalysisType.LAW_TO_CASE, statute_content)
+    
+    async def analyze_batch(
+        self,
+        analysis_type: AnalysisType,
+        items: List[Dict[str, Any]],
+        batch_size: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze many cases or provisions with one LLM call per batch of items.
         
-        formatted_prompt = prompt_data["template"].format(**statute_content)
+        Each item is looked up in the same caches as a single analysis, so only
+        uncached items are sent to the LLM, and their results are cached per item.
         
-        analysis = await self.llm_client.generate_response(
-            system_prompt=prompt_data["system"],
-            user_prompt=formatted_prompt,
-            response_model=prompt_data["extraction_schema"]
+        Args:
+            analysis_type: CASE_TO_LAW or LAW_TO_CASE
+            items: Template fields for each case or provision
+            batch_size: Maximum number of items per LLM call
+            
+        Returns:
+            Analysis results in the same order as items; an item missing from the
+            LLM response maps to an empty dict
+        """
+        lookups = await semaphore_gather(
+            *[self._lookup_analysis(analysis_type, item) for item in items]
         )
+        results = [cached_analysis or {} for cached_analysis, _ in lookups]
+        misses = [
+            (index, pending)
+            for index, (_, pending) in enumerate(lookups)
+            if pending is not None
+        ]
         
-        return analysis
+        batch_messages = self.prompts.build_batch_messages(
+            analysis_type, [items[index] for index, _ in misses], batch_size
+        )
+        responses = await semaphore_gather(
+            *[self._generate_response(messages) for messages in batch_messages]
+        )
+        
+        for start, response in zip(range(0, len(misses), batch_size), responses, strict=True):
+            batch = misses[start:start + batch_size]
+            parsed = self.prompts.parse_batch_response(response, len(batch))
+            for (index, pending), analysis in zip(batch, parsed, strict=True):
+                results[index] = analysis
+                if analysis:
+                    self._store_analysis(pending, analysis)
+        return results
+    
+    async def batch_generate(
+        self,
+        specs: List[Tuple[AnalysisType, Dict[str, Any]]],
+        concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run many analyses concurrently, one LLM call per analysis.
+        
+        Up to concurrency requests are in flight at once, so network round trips
+        overlap instead of being paid one after another. Rate-limit errors are
+        retried with exponential backoff by the LLM client.
+        
+        Args:
+            specs: Analysis type and template fields for each analysis
+            concurrency: Maximum concurrent LLM calls; defaults to llm_concurrency
+            
+        Returns:
+            Analysis results in the same order as specs
+        """
+        input_vectors: List[Optional[List[float]]] = [None] * len(specs)
+        if self.semantic_cache is not None:
+            # Embed every uncached input in batched requests instead of one per analysis
+            pending = [
+                i for i, (analysis_type, fields) in enumerate(specs)
+                if self.response_cache.get(self.prompts.response_key(analysis_type, fields))
+                is None
+            ]
+            texts = [
+                self.prompts.build_messages(specs[i][0], **specs[i][1])[-1]
+                .content.replace('\n', ' ')
+                for i in pending
+            ]
+            try:
+                for i, vector in zip(pending, await self._embed_all(texts), strict=True):
+                    input_vectors[i] = vector
+            except Exception as e:
+                logger.warning(f"Embedding analysis inputs one at a time: {e}")
+        
+        return await semaphore_gather(
+            *[
+                self._run_analysis(analysis_type, fields, input_vector)
+                for (analysis_type, fields), input_vector in zip(specs, input_vectors, strict=True)
+            ],
+            max_coroutines=concurrency if concurrency is not None else self.llm_concurrency
+        )
     
     async def extract_legal_principles(
         self,
@@ -138,14 +558,9 @@ class LegalGraphSynthesizer:
         Returns:
             List of extracted principles
         """
-        prompt_data = self.prompts.get_prompt(AnalysisType.PRINCIPLE_EXTRACTION)
-        
-        formatted_prompt = prompt_data["template"].format(content=content)
-        
-        analysis = await self.llm_client.generate_response(
-            system_prompt=prompt_data["system"],
-            user_prompt=formatted_prompt,
-            response_model=prompt_data["extraction_schema"]
+        analysis = await self._run_analysis(
+            AnalysisType.PRINCIPLE_EXTRACTION,
+            {"content": content}
         )
         
         return analysis.get("principles", [])
@@ -163,29 +578,66 @@ class LegalGraphSynthesizer:
         Returns:
             Precedent network and chains
         """
-        prompt_data = self.prompts.get_prompt(AnalysisType.PRECEDENT_MAPPING)
-        
-        formatted_prompt = prompt_data["template"].format(
-            cases=json.dumps(cases, indent=2)
+        return await self._run_analysis(
+            AnalysisType.PRECEDENT_MAPPING,
+            {"cases": dumps_prompt_json(cases)}
         )
+    
+    def _get_batch_processor(self) -> Optional[OpenAIBatchProcessor]:
+        """Get the Batch API processor, or None if the LLM client is not OpenAI-based."""
+        if self._batch_processor is None:
+            client = getattr(self.llm_client, 'client', None)
+            if not isinstance(client, AsyncOpenAI):
+                return None
+            self._batch_processor = OpenAIBatchProcessor(
+                client,
+                model=self.llm_client.model or DEFAULT_MODEL,
+                max_tokens=self.llm_client.max_tokens,
+                temperature=self.llm_client.temperature
+            )
+        return self._batch_processor
+    
+    async def _generate_synthesis(
+        self,
+        messages: List[Message],
+        batch_mode: bool
+    ) -> Dict[str, Any]:
+        """Generate a synthesis response, through the Batch API in batch_mode."""
+        # generate_response appends to the messages in place, so the key is taken first
+        disk_key = self._disk_cache_key(messages, "synthesis")
+        if self.disk_cache is not None and disk_key is not None:
+            stored_synthesis = self.disk_cache.get(disk_key)
+            if stored_synthesis is not None:
+                return stored_synthesis
         
-        analysis = await self.llm_client.generate_response(
-            system_prompt=prompt_data["system"],
-            user_prompt=formatted_prompt,
-            response_model=prompt_data["extraction_schema"]
-        )
+        synthesis = None
+        if batch_mode:
+            batch_processor = self._get_batch_processor()
+            if batch_processor is not None:
+                synthesis = await batch_processor.submit(messages)
+            else:
+                logger.warning(
+                    "Batch mode needs an OpenAI-based LLM client; calling the LLM directly"
+                )
+        if synthesis is None:
+            synthesis = await self._generate_response(messages)
         
-        return analysis
+        if self.disk_cache is not None and disk_key is not None:
+            self.disk_cache.set(disk_key, synthesis, model_id=self.llm_client.model)
+        return synthesis
     
     async def synthesize_case_law(
         self,
-        cases: List[EntityNode]
+        cases: List[EntityNode],
+        batch_mode: bool = False
     ) -> Tuple[List[SyntheticNode], List[SyntheticEdge]]:
         """
         Synthesize understanding from multiple cases.
         
         Args:
             cases: List of case law nodes
+            batch_mode: Send the request through the provider Batch API, at half the
+                cost and outside the rate limits but with up to a day of latency
             
         Returns:
             Synthetic nodes and edges
@@ -203,53 +655,56 @@ class LegalGraphSynthesizer:
         ]
         
         # Get synthesis prompt
-        synthesis_prompt = SyntheticGraphPrompts.get_synthesis_prompt("case_law_synthesis")
-        formatted_prompt = synthesis_prompt.format(
-            cases=json.dumps(case_data, indent=2)
+        formatted_prompt = SyntheticGraphPrompts.render_synthesis_prompt(
+            "case_law_synthesis",
+            cases=case_data
         )
         
         # Generate synthesis
-        synthesis = await self.llm_client.generate_response(
-            system_prompt="You are a legal analyst creating synthetic understanding from multiple cases.",
-            user_prompt=formatted_prompt
-        )
+        synthesis = await self._generate_synthesis([
+            Message(role="system", content=_CASE_LAW_SYNTHESIS_SYSTEM),
+            Message(role="user", content=formatted_prompt),
+        ], batch_mode)
         
-        # Parse synthesis into nodes and edges
+        # Parse synthesis into nodes and edges. The fields are built here from trusted
+        # values, so model_construct skips re-validating every synthetic entry
         synthetic_nodes = []
         synthetic_edges = []
+        case_uuids = [case.uuid for case in cases]
         
         # Create synthetic principle nodes
         for principle in synthesis.get("common_principles", []):
-            node = SyntheticNode(
+            confidence = _confidence(principle.get("confidence", 0.8), 0.8)
+            node = SyntheticNode.model_construct(
                 entity_type="LegalPrinciple",
                 name=principle["name"],
                 properties={
                     "description": principle["description"],
                     "derived_from_cases": principle["source_cases"]
                 },
-                source_nodes=[case.uuid for case in cases],
-                confidence=principle.get("confidence", 0.8),
+                source_nodes=list(case_uuids),
+                confidence=confidence,
                 analysis_type="case_law_synthesis"
             )
             synthetic_nodes.append(node)
             
             # Create edges from cases to principle
             for case_uuid in principle["source_cases"]:
-                edge = SyntheticEdge(
+                edge = SyntheticEdge.model_construct(
                     source_node=case_uuid,
                     target_node=node.name,  # Will be replaced with actual UUID
                     relationship_type="establishes_principle",
                     properties={
                         "strength": principle.get("strength", "medium")
                     },
-                    confidence=principle.get("confidence", 0.8),
+                    confidence=confidence,
                     derived_from=["synthesis"]
                 )
                 synthetic_edges.append(edge)
         
         # Create evolution edges
         for evolution in synthesis.get("legal_evolution", []):
-            edge = SyntheticEdge(
+            edge = SyntheticEdge.model_construct(
                 source_node=evolution["earlier_case"],
                 target_node=evolution["later_case"],
                 relationship_type="evolved_into",
@@ -257,7 +712,7 @@ class LegalGraphSynthesizer:
                     "evolution_type": evolution["type"],
                     "changes": evolution["changes"]
                 },
-                confidence=evolution.get("confidence", 0.7),
+                confidence=_confidence(evolution.get("confidence", 0.7), 0.7),
                 derived_from=["temporal_analysis"]
             )
             synthetic_edges.append(edge)
@@ -267,7 +722,8 @@ class LegalGraphSynthesizer:
     async def integrate_statute_cases(
         self,
         statutes: List[EntityNode],
-        cases: List[EntityNode]
+        cases: List[EntityNode],
+        batch_mode: bool = False
     ) -> Tuple[List[SyntheticNode], List[SyntheticEdge]]:
         """
         Integrate statutory provisions with case law interpretations.
@@ -275,6 +731,7 @@ class LegalGraphSynthesizer:
         Args:
             statutes: List of statute nodes
             cases: List of case nodes
+            batch_mode: Send the request through the provider Batch API
             
         Returns:
             Synthetic nodes and edges showing integration
@@ -299,24 +756,25 @@ class LegalGraphSynthesizer:
         ]
         
         # Get integration prompt
-        synthesis_prompt = SyntheticGraphPrompts.get_synthesis_prompt("statute_case_integration")
-        formatted_prompt = synthesis_prompt.format(
-            statutes=json.dumps(statute_data, indent=2),
-            cases=json.dumps(case_data, indent=2)
+        formatted_prompt = SyntheticGraphPrompts.render_synthesis_prompt(
+            "statute_case_integration",
+            statutes=statute_data,
+            cases=case_data
         )
         
         # Generate integration
-        integration = await self.llm_client.generate_response(
-            system_prompt="You are integrating statutory law with case law interpretations.",
-            user_prompt=formatted_prompt
-        )
+        integration = await self._generate_synthesis([
+            Message(role="system", content=_STATUTE_CASE_INTEGRATION_SYSTEM),
+            Message(role="user", content=formatted_prompt),
+        ], batch_mode)
         
         synthetic_nodes = []
         synthetic_edges = []
+        source_uuids = [s.uuid for s in statutes] + [c.uuid for c in cases]
         
         # Create compliance guideline nodes
         for guideline in integration.get("compliance_guidelines", []):
-            node = SyntheticNode(
+            node = SyntheticNode.model_construct(
                 entity_type="LegalProcedure",
                 name=guideline["name"],
                 properties={
@@ -325,15 +783,15 @@ class LegalGraphSynthesizer:
                     "validated_by_cases": guideline["cases"],
                     "steps": guideline["steps"]
                 },
-                source_nodes=[s.uuid for s in statutes] + [c.uuid for c in cases],
-                confidence=guideline.get("confidence", 0.85),
+                source_nodes=list(source_uuids),
+                confidence=_confidence(guideline.get("confidence", 0.85), 0.85),
                 analysis_type="statute_case_integration"
             )
             synthetic_nodes.append(node)
         
         # Create interpretation edges
         for interpretation in integration.get("interpretations", []):
-            edge = SyntheticEdge(
+            edge = SyntheticEdge.model_construct(
                 source_node=interpretation["case_uuid"],
                 target_node=interpretation["statute_uuid"],
                 relationship_type="interprets",
@@ -341,7 +799,7 @@ class LegalGraphSynthesizer:
                     "interpretation": interpretation["interpretation"],
                     "impact": interpretation["impact"]
                 },
-                confidence=interpretation.get("confidence", 0.8),
+                confidence=_confidence(interpretation.get("confidence", 0.8), 0.8),
                 derived_from=["case_analysis"]
             )
             synthetic_edges.append(edge)
@@ -367,11 +825,54 @@ class LegalGraphSynthesizer:
         Returns:
             Synthesis results with entities and relationships
         """
+        processed = [
+            item
+            async for item in self._iter_documents(website, search_query, analysis_type, limit)
+        ]
+        # Results keep the order of the document URLs
+        processed.sort(key=lambda item: item[0])
+        documents = [doc for _, doc, _ in processed]
+        results = [result for _, _, result in processed if result is not None]
+        
+        if analysis_type == AnalysisType.CASE_TO_LAW:
+            return {"analyses": results, "documents": documents}
+        
+        elif analysis_type == AnalysisType.PRINCIPLE_EXTRACTION:
+            all_principles = await self.dedupe_principles(list(chain.from_iterable(results)))
+            return {"principles": all_principles, "documents": documents}
+        
+        else:
+            return {"episodes": results, "documents": documents}
+    
+    async def _iter_documents(
+        self,
+        website: str,
+        search_query: str,
+        analysis_type: AnalysisType,
+        limit: int = 10
+    ) -> AsyncIterator[Tuple[int, Dict[str, Any], Any]]:
+        """
+        Crawl a legal website and yield each document as soon as it is processed.
+        
+        Args:
+            website: Website identifier (e.g., 'indiankanoon')
+            search_query: Search query for the website
+            analysis_type: Type of analysis to perform on each document
+            limit: Maximum documents to process
+            
+        Yields:
+            Position of the document URL, the document, and its analysis result,
+            principles or episode (None if skipped), in order of completion
+        """
         # Get website schema
-        schema = self.schemas.get_schema(website)
+        schema = self._schema_by_site.get(website)
         if not schema:
             raise ValueError(f"Unknown website: {website}")
         
+        # The crawler pulls in crawl4ai and its browser stack, so it is only imported
+        # once a website is actually crawled
+        from graphiti_core.utils.web_crawler import WebCrawler
+        
         # Initialize crawler
         crawler = WebCrawler(
             llm_provider=self.llm_client.config.provider if hasattr(self.llm_client.config, 'provider') else 'openai',
@@ -392,54 +893,99 @@ class LegalGraphSynthesizer:
             # Extract document URLs (this would need actual implementation based on website)
             doc_urls = self._extract_document_urls(search_results, schema, limit)
             
-            # Crawl individual documents
-            documents = []
-            for url in doc_urls[:limit]:
+            # Crawled documents are analyzed or ingested while later pages are still
+            # being fetched: crawl tasks feed a bounded queue drained by a worker pool,
+            # and each processed document is handed to the caller right away
+            if analysis_type in (AnalysisType.CASE_TO_LAW, AnalysisType.PRINCIPLE_EXTRACTION):
+                worker_count = self.llm_concurrency or SEMAPHORE_LIMIT
+            else:
+                worker_count = self.ingest_concurrency
+            queue: asyncio.Queue = asyncio.Queue(maxsize=DEFAULT_PIPELINE_QUEUE_SIZE)
+            output: asyncio.Queue = asyncio.Queue()
+            
+            # Failed pages are logged and skipped
+            async def crawl_document(index: int, url: str) -> None:
                 try:
+                    await self._acquire_rate_limit()
                     doc = await crawler.crawl_legal_document(
                         url,
                         use_llm_extraction=True,
                         css_selectors=schema.get('selectors', {})
                     )
-                    documents.append(doc)
                 except Exception as e:
                     logger.error(f"Error crawling {url}: {e}")
-                    continue
-            
-            # Perform analysis based on type
-            if analysis_type == AnalysisType.CASE_TO_LAW:
-                results = []
-                for doc in documents:
-                    if doc.get('metadata', {}).get('document_type') == 'case_law':
-                        analysis = await self.analyze_case_to_law(doc)
-                        results.append(analysis)
-                return {"analyses": results, "documents": documents}
+                    return
+                await queue.put((index, doc))
             
-            elif analysis_type == AnalysisType.PRINCIPLE_EXTRACTION:
-                all_principles = []
-                for doc in documents:
-                    principles = await self.extract_legal_principles(
-                        doc.get('content', '')
+            async def produce() -> None:
+                try:
+                    await semaphore_gather(
+                        *[crawl_document(i, url) for i, url in enumerate(doc_urls[:limit])],
+                        max_coroutines=self.crawl_concurrency
                     )
-                    all_principles.extend(principles)
-                return {"principles": all_principles, "documents": documents}
+                finally:
+                    for _ in range(worker_count):
+                        await queue.put(None)
             
-            else:
-                # Default: Create episodes for all documents
-                episodes = []
-                for doc in documents:
-                    episode_result = await self.graphiti.add_legal_document_from_web(
-                        doc.get('url', ''),
+            async def add_episode(doc: Dict[str, Any]) -> Optional[Any]:
+                url = doc.get('url', '')
+                try:
+                    return await self.graphiti.add_legal_document_from_web(
+                        url,
                         group_id=f"{website}_{search_query}",
                         use_llm_extraction=True
                     )
-                    episodes.append(episode_result)
-                return {"episodes": episodes, "documents": documents}
+                except Exception as e:
+                    logger.error(f"Error adding episode for {url}: {e}")
+                    return None
+            
+            async def process_document(doc: Dict[str, Any]) -> Optional[Any]:
+                if analysis_type == AnalysisType.CASE_TO_LAW:
+                    if doc.get('metadata', {}).get('document_type') != 'case_law':
+                        return None
+                    return await self._run_analysis(AnalysisType.CASE_TO_LAW, doc)
+                if analysis_type == AnalysisType.PRINCIPLE_EXTRACTION:
+                    analysis = await self._run_analysis(
+                        AnalysisType.PRINCIPLE_EXTRACTION,
+                        {"content": doc.get('content', '')}
+                    )
+                    return analysis.get("principles", [])
+                # Default: Create episodes for all documents
+                return await add_episode(doc)
+            
+            # Each worker reports its results, then an error if it failed, then None
+            async def consume() -> None:
+                try:
+                    while (item := await queue.get()) is not None:
+                        index, doc = item
+                        output.put_nowait((index, doc, await process_document(doc)))
+                except Exception as e:
+                    output.put_nowait(e)
+                finally:
+                    output.put_nowait(None)
+            
+            producer = asyncio.create_task(produce())
+            workers = [asyncio.create_task(consume()) for _ in range(worker_count)]
+            try:
+                finished = 0
+                while finished < worker_count:
+                    item = await output.get()
+                    if item is None:
+                        finished += 1
+                    elif isinstance(item, Exception):
+                        raise item
+                    else:
+                        yield item
+                await producer
+            finally:
+                # Stops the pipeline if processing failed or the caller stopped early
+                for task in (producer, *workers):
+                    task.cancel()
     
     def _extract_document_urls(
         self,
         search_results: Dict[str, Any],
-        schema: Dict[str, Any],
+        schema: Mapping[str, Any],
         limit: int
     ) -> List[str]:
         """
@@ -455,7 +1001,8 @@ class LegalGraphSynthesizer:
         self,
         research_question: str,
         websites: List[str] = None,
-        max_depth: int = 3
+        max_depth: int = 3,
+        batch_mode: bool = False
     ) -> Dict[str, Any]:
         """
         Create comprehensive legal research graph for a question.
@@ -464,66 +1011,71 @@ class LegalGraphSynthesizer:
             research_question: Legal research question
             websites: List of websites to search (defaults to all)
             max_depth: Maximum depth of research
+            batch_mode: Run the synthesis calls through the provider Batch API
             
         Returns:
             Research graph with all findings
         """
         if websites is None:
-            websites = list(self.schemas.SCHEMAS.keys())
+            websites = list(self._all_sites)
         
-        # Phase 1: Initial search across websites
-        initial_results = {}
-        for website in websites:
+        # Phase 1: Initial search across websites. Documents are turned into nodes as
+        # they arrive, so only the nodes are kept rather than every crawled page
+        site_nodes: Dict[str, List[Tuple[int, str, Any, EntityNode]]] = {}
+        
+        async def search_website(website: str) -> None:
+            nodes = site_nodes.setdefault(website, [])
             try:
-                results = await self.crawl_and_synthesize(
-                    website=website,
-                    search_query=research_question,
-                    analysis_type=AnalysisType.PRINCIPLE_EXTRACTION,
+                async for index, doc, _ in self._iter_documents(
+                    website,
+                    research_question,
+                    AnalysisType.PRINCIPLE_EXTRACTION,
                     limit=5
-                )
-                initial_results[website] = results
+                ):
+                    doc_type = doc.get('metadata', {}).get('document_type')
+                    if doc_type in ('case_law', 'statute'):
+                        nodes.append((index, doc_type, _document_key(doc), self._doc_to_node(doc)))
             except Exception as e:
                 logger.error(f"Error searching {website}: {e}")
         
-        # Phase 2: Deep analysis of found materials
-        all_cases = []
-        all_statutes = []
+        # Each search is bound by HTTP and LLM latency, so websites are searched
+        # concurrently; a failing website is logged and keeps the documents it yielded
+        await semaphore_gather(*[search_website(website) for website in websites])
         
-        for website, results in initial_results.items():
-            for doc in results.get('documents', []):
-                if doc.get('metadata', {}).get('document_type') == 'case_law':
-                    all_cases.append(doc)
-                elif doc.get('metadata', {}).get('document_type') == 'statute':
-                    all_statutes.append(doc)
+        # Phase 2: Deep analysis of found materials. The same judgment is often found on
+        # several websites; duplicates would only add tokens to the synthesis prompts, so
+        # the first copy in website and URL order is kept
+        unique_nodes: Dict[str, Dict[Any, EntityNode]] = {"case_law": {}, "statute": {}}
+        for website in websites:
+            for _, doc_type, key, node in sorted(site_nodes.get(website, []), key=lambda n: n[0]):
+                unique_nodes[doc_type].setdefault(key, node)
+        case_nodes = list(unique_nodes["case_law"].values())
+        statute_nodes = list(unique_nodes["statute"].values())
         
         # Phase 3: Synthesize relationships
         synthesis_results = {
             "research_question": research_question,
             "sources_searched": websites,
-            "documents_analyzed": len(all_cases) + len(all_statutes),
+            "documents_analyzed": len(case_nodes) + len(statute_nodes),
             "timestamp": datetime.utcnow().isoformat()
         }
         
-        # Create synthetic understanding
-        if all_cases:
-            case_nodes = [self._doc_to_node(doc) for doc in all_cases]
-            synthetic_nodes, synthetic_edges = await self.synthesize_case_law(case_nodes)
-            synthesis_results["case_synthesis"] = {
-                "nodes": synthetic_nodes,
-                "edges": synthetic_edges
-            }
-        
-        if all_cases and all_statutes:
-            statute_nodes = [self._doc_to_node(doc) for doc in all_statutes]
-            case_nodes = [self._doc_to_node(doc) for doc in all_cases]
-            integrated_nodes, integrated_edges = await self.integrate_statute_cases(
-                statute_nodes, case_nodes
+        # Create synthetic understanding. The syntheses are independent, so they run
+        # together and, in batch mode, are submitted as one batch.
+        syntheses = {}
+        if case_nodes:
+            syntheses["case_synthesis"] = self.synthesize_case_law(case_nodes, batch_mode)
+        if case_nodes and statute_nodes:
+            syntheses["integration"] = self.integrate_statute_cases(
+                statute_nodes, case_nodes, batch_mode
             )
-            synthesis_results["integration"] = {
-                "nodes": integrated_nodes,
-                "edges": integrated_edges
-            }
         
+        for name, (nodes, edges) in zip(
+            syntheses, await semaphore_gather(*syntheses.values()), strict=True
+        ):
+            synthesis_results[name] = {"nodes": nodes, "edges": edges}
+        
+        self.save_semantic_cache()
         return synthesis_results
     
     def _doc_to_node(self, doc: Dict[str, Any]) -> EntityNode:
@@ -531,6 +1083,8 @@ class LegalGraphSynthesizer:
         metadata = doc.get('metadata', {})
         doc_type = metadata.get('document_type', 'unknown')
         
+        from graphiti_core.legal_entities import LEGAL_ENTITY_TYPES
+        
         # Create appropriate entity based on type
         if doc_type == 'case_law':
             entity_class = LEGAL_ENTITY_TYPES['CaseLaw']
@@ -539,12 +1093,16 @@ class LegalGraphSynthesizer:
         else:
             entity_class = EntityNode
         
-        return entity_class(
+        # Crawled metadata is partial, so the node is built without validation: fields
+        # the page did not provide are left unset instead of failing the conversion
+        fields = {key: metadata[key] for key in metadata.keys() & _accepted_fields(entity_class)}
+        fields.update(
             uuid=doc.get('uuid', ''),
             name=metadata.get('title', 'Untitled'),
-            summary=doc.get('summary', ''),
-            **{k: v for k, v in metadata.items() if k in entity_class.__fields__}
+            summary=doc.get('summary', '')
         )
+        # Case law and statute models stand in for EntityNode in the synthesis steps
+        return cast(EntityNode, entity_class.model_construct(**fields))
 
 
 # Extension function to add synthetic graph capabilities to Graphiti
@@ -556,12 +1114,13 @@ def extend_graphiti_with_synthesis():
         self,
         research_question: str,
         websites: List[str] = None,
-        max_depth: int = 3
+        max_depth: int = 3,
+        batch_mode: bool = False
     ) -> Dict[str, Any]:
         """Create comprehensive legal research graph."""
         synthesizer = LegalGraphSynthesizer(self)
         return await synthesizer.create_legal_research_graph(
-            research_question, websites, max_depth
+            research_question, websites, max_depth, batch_mode
         )
     
     async def analyze_legal_relationship(
@@ -573,26 +1132,29 @@ def extend_graphiti_with_synthesis():
         """Analyze relationship between two legal entities."""
         synthesizer = LegalGraphSynthesizer(self)
         
-        # Get entities
-        entity1 = await EntityNode.get_by_uuid(self.driver, entity1_uuid)
-        entity2 = await EntityNode.get_by_uuid(self.driver, entity2_uuid)
+        # The two reads are independent, so they run concurrently
+        entity1, entity2 = await semaphore_gather(
+            EntityNode.get_by_uuid(self.driver, entity1_uuid),
+            EntityNode.get_by_uuid(self.driver, entity2_uuid)
+        )
+        roles = (_entity_role(entity1), _entity_role(entity2))
         
         # Determine analysis based on entity types
-        if hasattr(entity1, 'citation') and hasattr(entity2, 'section'):
+        if roles == ('case', 'statute'):
             # Case analyzing statute
             return await synthesizer.analyze_case_to_law({
                 "case_name": entity1.name,
-                "citation": entity1.citation,
+                "citation": node_attribute(entity1, 'citation', ''),
                 "statute_name": entity2.name,
-                "section": entity2.section
+                "section": node_attribute(entity2, 'section', '')
             })
-        elif hasattr(entity1, 'section') and hasattr(entity2, 'citation'):
+        elif roles == ('statute', 'case'):
             # Statute interpreted by case
             return await synthesizer.analyze_law_to_case({
                 "statute_name": entity1.name,
-                "section": entity1.section,
+                "section": node_attribute(entity1, 'section', ''),
                 "case_name": entity2.name,
-                "citation": entity2.citation
+                "citation": node_attribute(entity2, 'citation', '')
             })
         else:
             # General relationship analysis
@@ -14,6 +14,19 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from .web_crawler import WebCrawler, create_legal_entity_definitions
+from typing import TYPE_CHECKING, Any
 
-__all__ = ['WebCrawler', 'create_legal_entity_definitions']
\ No newline at end of file
+if TYPE_CHECKING:
+    from .web_crawler import WebCrawler, create_legal_entity_definitions
+
+__all__ = ['WebCrawler', 'create_legal_entity_definitions']
+
+
+def __getattr__(name: str) -> Any:
+    # web_crawler imports crawl4ai and its browser stack, so it is only loaded once one
+    # of its names is used rather than whenever a graphiti_core.utils module is imported
+    if name in __all__:
+        from . import web_crawler
+
+        return getattr(web_crawler, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
\ No newline at end of file
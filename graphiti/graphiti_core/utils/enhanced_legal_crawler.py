@@ -5,16 +5,322 @@ Extends the base crawler with specialized extractors for each legal source.
 
 import asyncio
 import re
-from typing import Dict, List, Any, Optional, Union
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from typing import Dict, Iterable, List, Any, Optional, Tuple, Union, cast, overload
 from datetime import datetime
-from bs4 import BeautifulSoup
+from urllib.parse import urlsplit
+from bs4 import BeautifulSoup, SoupStrainer, Tag  # pyright: ignore[reportPrivateImportUsage]
 import logging
 
-from .web_crawler import WebCrawler, LegalDocument, LegalDocumentMetadata, LegalDocumentSection
+import httpx
+from diskcache import Cache
+
+from ..helpers import semaphore_gather
+from .keyword_matcher import KeywordMatcher
+from .web_crawler import (
+    DEFAULT_CRAWL_CACHE_TTL_SECONDS,
+    WebCrawler,
+    LegalDocument,
+    LegalDocumentMetadata,
+    LegalDocumentSection
+)
 from ..legal_analysis_prompts import LegalWebsiteSchema
 
 logger = logging.getLogger(__name__)
 
+# Documents fetched at once by extract_many(); all of them share one crawler session
+DEFAULT_EXTRACT_CONCURRENCY = 20
+
+# Extracted documents each crawler remembers by URL, least recently used evicted first
+DEFAULT_DOCUMENT_CACHE_SIZE = 1024
+
+# Keep-alive pool for plain HTTP fetches of server-rendered pages
+DEFAULT_HTTP_MAX_CONNECTIONS = 100
+DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_HTTP_TIMEOUT_SECONDS = 30
+# Idle connections stay open this long, so prewarmed connections survive until used
+DEFAULT_HTTP_KEEPALIVE_SECONDS = 60
+
+# Pages in the on-disk HTTP cache are stored as (etag, last_modified, html)
+_CachedPage = Tuple[Optional[str], Optional[str], str]
+
+# lxml's C parser is several times faster than the pure-Python html.parser; crawl4ai
+# already depends on it
+_HTML_PARSER = "lxml"
+
+# Patterns are compiled once here rather than looked up in re's cache on every call
+_SECTION_HEADINGS = {
+    "facts": r"facts|background|factual background",
+    "issues": r"issues|questions|points for determination",
+    "arguments": r"arguments|submissions|contentions",
+    "judgment": r"judgment|decision|order|findings",
+    "precedents": r"precedents|authorities|cases cited"
+}
+_SECTION_ORDER = {section_type: i for i, section_type in enumerate(_SECTION_HEADINGS)}
+
+# One alternation finds every heading in a single scan; lastgroup names the section type
+_SECTION_RE = re.compile(
+    "|".join(
+        f"(?P<{section_type}>{pattern})" for section_type, pattern in _SECTION_HEADINGS.items()
+    ),
+    re.IGNORECASE
+)
+
+_HOLDING_PATTERNS = [
+    re.compile(r"(?i)held that[^.]+\."),
+    re.compile(r"(?i)court holds[^.]+\."),
+    re.compile(r"(?i)we hold[^.]+\."),
+    re.compile(r"(?i)it is held[^.]+\."),
+    re.compile(r"(?i)decided that[^.]+\."),
+    re.compile(r"(?i)court finds[^.]+\.")
+]
+# Literal each holding pattern starts with; a pattern cannot match a text without it
+_HOLDING_TRIGGERS = (
+    "held that", "court holds", "we hold", "it is held", "decided that", "court finds"
+)
+
+_PRINCIPLE_PATTERNS = [
+    re.compile(r"(?i)principle of[^.]+\."),
+    re.compile(r"(?i)doctrine of[^.]+\."),
+    re.compile(r"(?i)rule of[^.]+\."),
+    re.compile(r"(?i)test of[^.]+\.")
+]
+
+_CITATION_PATTERNS = [
+    re.compile(r"\d{4}\s+\(\d+\)\s+\w+\s+\d+"),  # 2024 (5) SCC 123
+    re.compile(r"\d{4}\s+\w+\s+\d+"),  # 2024 SCC 123
+    re.compile(r"AIR\s+\d{4}\s+\w+\s+\d+"),  # AIR 2024 SC 123
+    re.compile(r"\[\d{4}\]\s+\d+\s+\w+\s+\d+")  # [2024] 5 SCC 123
+]
+
+_CASE_NUMBER_PATTERNS = [
+    re.compile(r"No\.\s*\d+\s*of\s*\d{4}"),
+    re.compile(r"Case No\.\s*\d+/\d{4}"),
+    re.compile(r"\d+/\d{4}"),
+    re.compile(r"[A-Z]+\s+No\.\s*\d+")
+]
+
+# Common patterns: "A vs B", "A v. B"
+_PARTIES_PATTERNS = [
+    re.compile(r"(.+?)\s+v(?:s)?\.?\s+(.+)", re.IGNORECASE),
+    re.compile(r"(.+?)\s+versus\s+(.+)", re.IGNORECASE)
+]
+
+_DATE_PATTERNS = [
+    re.compile(r"\d{1,2}[/-]\d{1,2}[/-]\d{4}"),
+    re.compile(r"\d{1,2}\s+\w+\s+\d{4}"),
+    re.compile(r"\w+\s+\d{1,2},\s+\d{4}")
+]
+
+_BENCH_PREFIX_RE = re.compile(r"(?i)(coram|bench|before):\s*")
+_BENCH_SEPARATOR_RE = re.compile(r"[,&]|and")
+_HONORIFIC_RE = re.compile(r"(?i)(hon'ble|justice|judge|mr\.|mrs\.|dr\.)\s*")
+
+# Numbered ("1. ", "12 ") or lettered ("A. ") regulatory section headings
+_SECTION_HEADING_RE = re.compile(r"^\d+\.?\s+|^[A-Z]\.\s+")
+
+# Regulatory section content is cut to this many characters
+_MAX_SECTION_CHARS = 2000
+
+_REQUIREMENT_PATTERNS = [
+    re.compile(r"(?i)shall[^.]+\."),
+    re.compile(r"(?i)must[^.]+\."),
+    re.compile(r"(?i)required to[^.]+\."),
+    re.compile(r"(?i)obligated to[^.]+\.")
+]
+_REQUIREMENT_TRIGGERS = ("shall", "must", "required to", "obligated to")
+
+_REPORT_NUMBER_RE = re.compile(r"report\s+no\.?\s*(\d+)", re.IGNORECASE)
+
+# Keywords reported by _analyze_cyber_law_relevance(), in reporting order
+_CYBER_LAW_KEYWORDS = (
+    "information technology", "cyber", "digital", "electronic",
+    "data protection", "privacy", "internet", "online",
+    "computer", "software", "intermediary", "encryption",
+    "cyber crime", "hacking", "phishing", "identity theft",
+    "electronic evidence", "digital signature", "e-commerce",
+    "social media", "blockchain", "artificial intelligence",
+    "machine learning", "cloud computing", "iot"
+)
+
+# Cyber law specific keywords attached to document metadata by _extract_keywords()
+_CYBER_TERMS = (
+    "cyber", "digital", "electronic", "internet", "online",
+    "data", "privacy", "security", "information technology"
+)
+
+# Every term either method looks for, matched in one scan of the document text
+_KEYWORD_MATCHER = KeywordMatcher(
+    _CYBER_LAW_KEYWORDS + _CYBER_TERMS + ("information technology act", "it act")
+)
+
+
+def _distinct_matches(
+    patterns: List[re.Pattern],
+    texts: Iterable[str],
+    limit: int,
+    pos: int = 0,
+    endpos: Optional[int] = None,
+    triggers: Optional[Tuple[str, ...]] = None
+) -> List[str]:
+    """
+    Collect up to limit distinct stripped matches of patterns across texts.
+    
+    Matches are streamed and scanning stops as soon as the limit is reached, instead of
+    collecting every match in the document and then truncating. pos and endpos restrict
+    the scan of each text the same way slicing it would. triggers, when given, holds the
+    lowercase literal each case-insensitive pattern requires, and a pattern is only run
+    on texts containing its literal, since a substring test is far cheaper than a regex.
+    """
+    found: Dict[str, None] = {}
+    for text in texts:
+        end = len(text) if endpos is None else endpos
+        lowered = text[pos:end].lower() if triggers is not None else ""
+        for i, pattern in enumerate(patterns):
+            if triggers is not None and triggers[i] not in lowered:
+                continue
+            for match in pattern.finditer(text, pos, end):
+                found[match.group().strip()] = None
+                if len(found) >= limit:
+                    return list(found)
+    return list(found)
+
+
+@lru_cache(maxsize=16)
+def _find_keywords(text: str) -> frozenset:
+    """
+    Find the cyber law keywords in a document text.
+    
+    Extractors pass the same text to _analyze_cyber_law_relevance() and
+    _extract_keywords(), so the small cache lets both share one scan.
+    """
+    return frozenset(_KEYWORD_MATCHER.find(text))
+
+
+
+# Court names and case titles repeat across a crawl (the same court appears on thousands
+# of judgments), so the helpers below are cached per string
+@lru_cache(maxsize=8192)
+def _jurisdiction_for_court(court_text: str) -> str:
+    court_lower = court_text.lower()
+    
+    if "supreme court" in court_lower:
+        return "supreme_court"
+    elif "high court" in court_lower:
+        for state in ["delhi", "bombay", "madras", "calcutta", "karnataka", "kerala"]:
+            if state in court_lower:
+                return f"high_court_{state}"
+        return "high_court"
+    elif "tribunal" in court_lower:
+        return "tribunal"
+    elif "commission" in court_lower:
+        return "commission"
+    else:
+        return "other"
+
+
+@lru_cache(maxsize=8192)
+def _case_number_in_title(title: str) -> Optional[str]:
+    for pattern in _CASE_NUMBER_PATTERNS:
+        match = pattern.search(title)
+        if match:
+            return match.group()
+    
+    return None
+
+
+@lru_cache(maxsize=8192)
+def _parties_in_title(title: str) -> Tuple[str, ...]:
+    # A tuple, so callers cannot mutate the cached value
+    for pattern in _PARTIES_PATTERNS:
+        match = pattern.search(title)
+        if match:
+            return (match.group(1).strip(), match.group(2).strip())
+    
+    return ()
+
+@dataclass(frozen=True, slots=True)
+class JudgmentSiteConfig:
+    """
+    Page layout of a court or tribunal website whose judgments share one structure.
+    
+    Each selector is a CSS selector list. When every selector in it is qualified by a
+    class, strainer limits parsing to elements with those classes, so navigation and
+    other page chrome are never built into the tree.
+    """
+    title_selector: str
+    bench_selector: str
+    date_selector: str
+    content_selector: str
+    document_type: str
+    jurisdiction: str
+    default_title: str
+    keywords: Tuple[str, ...]
+    strainer: Optional[SoupStrainer] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        classes = []
+        selectors = (self.title_selector, self.bench_selector, self.date_selector, self.content_selector)
+        for selector in ",".join(selectors).split(","):
+            _, dot, class_name = selector.strip().partition(".")
+            if not dot:
+                # A bare tag selector such as "h1" needs the whole tree
+                classes = None
+                break
+            classes.append(class_name)
+        strainer = SoupStrainer(attrs={"class": classes}) if classes else None
+        object.__setattr__(self, "strainer", strainer)
+
+
+def _high_court_site(court_name: str) -> JudgmentSiteConfig:
+    return JudgmentSiteConfig(
+        title_selector="h1.case-title, h2.judgment-title, .case-name",
+        bench_selector=".bench, .coram, .judges",
+        date_selector=".date, .judgment-date, .decision-date",
+        content_selector=".judgment-content, .full-text, .case-content",
+        document_type="case_law",
+        jurisdiction="high_court",
+        default_title=f"{court_name} Judgment",
+        keywords=("high court",)
+    )
+
+
+def _tribunal_site(tribunal_name: str) -> JudgmentSiteConfig:
+    return JudgmentSiteConfig(
+        title_selector="h1, h2.case-title, .order-title",
+        bench_selector=".bench, .members, .coram",
+        date_selector=".date, .order-date, .judgment-date",
+        content_selector=".order-content, .judgment-text, .full-text",
+        document_type="tribunal_order",
+        jurisdiction="tribunal",
+        default_title=f"{tribunal_name} Order",
+        keywords=(tribunal_name.lower(), "tribunal", "order")
+    )
+
+
+# Court and tribunal sites handled by EnhancedLegalCrawler._extract_judgment()
+_JUDGMENT_SITES: Dict[str, JudgmentSiteConfig] = {
+    "supreme_court": JudgmentSiteConfig(
+        title_selector="div.judgment-title, h1.case-title",
+        bench_selector="div.bench-info, div.coram",
+        date_selector="span.judgment-date, div.date-of-judgment",
+        content_selector="div.judgment-text, div.judgment-content",
+        document_type="case_law",
+        jurisdiction="supreme_court",
+        default_title="SC Judgment",
+        keywords=("supreme court",)
+    ),
+    "high_court_chandigarh": _high_court_site("High Court of Punjab & Haryana at Chandigarh"),
+    "high_court_delhi": _high_court_site("High Court of Delhi"),
+    "high_court_bombay": _high_court_site("High Court of Bombay"),
+    "nclt": _tribunal_site("National Company Law Tribunal"),
+    "nclat": _tribunal_site("National Company Law Appellate Tribunal"),
+    "tdsat": _tribunal_site("Telecom Disputes Settlement & Appellate Tribunal")
+}
+
 
 class EnhancedLegalCrawler(WebCrawler):
     """Enhanced crawler with support for multiple Indian legal websites."""
@@ -38,26 +344,102 @@ class EnhancedLegalCrawler(WebCrawler):
         "rbi.org.in": "rbi"
     }
     
-    def __init__(self, llm_provider: Optional[str] = None, api_key: Optional[str] = None):
-        """Initialize enhanced crawler with site-specific configurations."""
+    def __init__(
+        self,
+        llm_provider: Optional[str] = None,
+        api_key: Optional[str] = None,
+        prewarm: bool = False,
+        document_cache_size: int = DEFAULT_DOCUMENT_CACHE_SIZE,
+        http_cache_dir: Optional[str] = None
+    ):
+        """
+        Initialize enhanced crawler with site-specific configurations.
+        
+        Args:
+            llm_provider: LLM provider for extraction (openai, gemini, etc.)
+            api_key: API key for the LLM provider
+            prewarm: Connect to every supported site in the background when the crawler
+                is entered, so DNS, TCP and TLS setup is done before the first fetch
+            document_cache_size: Number of extracted documents remembered by URL, 0 to
+                disable
+            http_cache_dir: Directory of an on-disk cache of fetched pages. Cached pages
+                are revalidated with conditional GETs, so unchanged pages cost a 304
+                response instead of a full download. Disabled when None.
+        """
         super().__init__(llm_provider, api_key)
         self.site_extractors = self._initialize_extractors()
+        self.prewarm = prewarm
+        self._http: Optional[httpx.AsyncClient] = None
+        self._prewarm_task: Optional[asyncio.Task] = None
+        self.document_cache_size = document_cache_size
+        self._documents: OrderedDict[str, LegalDocument] = OrderedDict()
+        self._pending: Dict[str, asyncio.Task] = {}
+        self._http_cache = Cache(http_cache_dir) if http_cache_dir is not None else None
+    
+    async def __aenter__(self):
+        """Open the browser session and a keep-alive HTTP client shared by all fetches."""
+        await super().__aenter__()
+        self._http = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=DEFAULT_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=DEFAULT_HTTP_KEEPALIVE_SECONDS
+            ),
+            timeout=DEFAULT_HTTP_TIMEOUT_SECONDS,
+            follow_redirects=True
+        )
+        if self.prewarm:
+            self._prewarm_task = asyncio.create_task(self.prewarm_connections())
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the HTTP client, the HTTP cache and the browser session."""
+        if self._prewarm_task is not None:
+            self._prewarm_task.cancel()
+            self._prewarm_task = None
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        if self._http_cache is not None:
+            # diskcache reopens its database on the next access, so the crawler can be reused
+            self._http_cache.close()
+        await super().__aexit__(exc_type, exc_val, exc_tb)
+        
+    async def prewarm_connections(self, hosts: Optional[Iterable[str]] = None) -> int:
+        """
+        Open pooled connections to legal website hosts ahead of the first fetch.
+        
+        Args:
+            hosts: Hosts to connect to, defaults to every supported site
+            
+        Returns:
+            Number of hosts that responded
+        """
+        if self._http is None:
+            raise RuntimeError("Crawler not initialized. Use async context manager.")
         
+        hosts = list(_SITES_BY_HOST) if hosts is None else list(hosts)
+        results = await semaphore_gather(
+            *(self._http.head(f"https://{host}/") for host in hosts),
+            max_coroutines=DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            return_exceptions=True
+        )
+        connected = sum(not isinstance(result, BaseException) for result in results)
+        logger.debug(f"Prewarmed connections to {connected} of {len(hosts)} legal sites")
+        return connected
+    
     def _initialize_extractors(self) -> Dict[str, callable]:
-        """Initialize site-specific extractors."""
+        """Initialize site-specific extractors, which parse a fetched page's HTML."""
         return {
             "indian_kanoon": self._extract_indian_kanoon,
-            "supreme_court": self._extract_supreme_court,
-            "high_court_chandigarh": self._extract_high_court,
-            "high_court_delhi": self._extract_high_court,
-            "high_court_bombay": self._extract_high_court,
+            **{
+                site_type: partial(self._extract_judgment, config=config)
+                for site_type, config in _JUDGMENT_SITES.items()
+            },
             "lok_sabha": self._extract_parliament,
             "rajya_sabha": self._extract_parliament,
             "gazette": self._extract_gazette,
             "law_commission": self._extract_law_commission,
-            "nclt": self._extract_tribunal,
-            "nclat": self._extract_tribunal,
-            "tdsat": self._extract_tribunal,
             "ncdrc": self._extract_consumer_forum,
             "mca": self._extract_regulatory,
             "sebi": self._extract_regulatory,
@@ -65,7 +447,36 @@ class EnhancedLegalCrawler(WebCrawler):
         }
     
     async def extract_legal_document(self, url: str) -> LegalDocument:
-        """Extract legal document from any supported website."""
+        """
+        Extract legal document from any supported website.
+        
+        Result pages link to the same judgment many times, so documents are remembered per
+        URL: a repeated URL is served from memory, and concurrent requests for a URL that
+        is still being extracted share that extraction. Failed extractions are not kept.
+        """
+        document = self._documents.get(url)
+        if document is not None:
+            self._documents.move_to_end(url)
+            return document
+        
+        task = self._pending.get(url)
+        if task is None:
+            task = asyncio.create_task(self._extract_document(url))
+            task.add_done_callback(partial(self._remember_document, url))
+            self._pending[url] = task
+        # Shielded so one cancelled caller does not cancel the extraction for the others
+        return await asyncio.shield(task)
+    
+    def _remember_document(self, url: str, task: asyncio.Task) -> None:
+        self._pending.pop(url, None)
+        if task.cancelled() or task.exception() is not None or self.document_cache_size <= 0:
+            return
+        
+        self._documents[url] = task.result()
+        while len(self._documents) > self.document_cache_size:
+            self._documents.popitem(last=False)
+    
+    async def _extract_document(self, url: str) -> LegalDocument:
         # Identify the website
         site_type = self._identify_site(url)
         if not site_type:
@@ -74,319 +485,286 @@ class EnhancedLegalCrawler(WebCrawler):
         
         # Use site-specific extractor
         extractor = self.site_extractors.get(site_type)
-        if extractor:
-            return await extractor(url)
-        else:
+        if not extractor:
             return await self._llm_extract(url)
+        
+        html = await self._fetch_html(url)
+        # Parsing is CPU-bound, so it runs off the event loop and other fetches started by
+        # extract_many() keep making progress meanwhile
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, extractor, url, html)
+    
+    async def _fetch(self, url: str, **kwargs):
+        """Fetch a URL with the open crawler, or open one just for this fetch."""
+        if self.crawler is not None:
+            return await self.crawler.arun(url=url, **kwargs)
+        
+        async with self as session:
+            if session.crawler is None:
+                raise RuntimeError("Crawler failed to initialize.")
+            return await session.crawler.arun(url=url, **kwargs)
+    
+    async def _fetch_html(self, url: str) -> str:
+        """
+        Fetch the HTML of a page, reusing pooled HTTP connections when possible.
+        
+        The supported legal sites serve their documents as plain HTML, so a GET over the
+        keep-alive client avoids a browser render and a new TLS handshake per document.
+        Pages the client cannot fetch are rendered by the crawler instead.
+        """
+        if self._http is not None:
+            cached: Optional[_CachedPage] = None
+            if self._http_cache is not None:
+                cached = cast(Optional[_CachedPage], self._http_cache.get(url))
+            headers = {}
+            if cached is not None:
+                etag, last_modified, _ = cached
+                if etag:
+                    headers["If-None-Match"] = etag
+                if last_modified:
+                    headers["If-Modified-Since"] = last_modified
+            
+            try:
+                response = await self._http.get(url, headers=headers)
+                if response.status_code == 304 and cached is not None:
+                    return cached[2]
+                response.raise_for_status()
+                
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                # Pages without validators could never be revalidated, so they are not kept
+                if self._http_cache is not None and (etag or last_modified):
+                    self._http_cache.set(
+                        url,
+                        (etag, last_modified, response.text),
+                        expire=DEFAULT_CRAWL_CACHE_TTL_SECONDS
+                    )
+                return response.text
+            except httpx.HTTPError as e:
+                logger.debug(f"HTTP fetch of {url} failed, rendering it instead: {e}")
+        
+        result = await self._fetch(url)
+        return result.html
     
     def _identify_site(self, url: str) -> Optional[str]:
         """Identify which legal website the URL belongs to."""
-        for domain, site_type in self.SUPPORTED_SITES.items():
-            if domain in url:
-                return site_type
-        return None
+        return _site_type_for_url(url)
     
-    async def _extract_indian_kanoon(self, url: str) -> LegalDocument:
-        """Extract from Indian Kanoon."""
-        async with self:
-            result = await self.crawler.arun(url=url)
-            soup = BeautifulSoup(result.html, 'html.parser')
-            
-            # Extract metadata
-            title = soup.select_one('h2.doc_title')
-            title_text = title.text.strip() if title else "Unknown Case"
-            
-            court = soup.select_one('div.docsource_main')
-            court_text = court.text.strip() if court else "Unknown Court"
-            
-            date = soup.select_one('div.doc_date')
-            date_text = date.text.strip() if date else None
-            
-            # Extract citation
-            citation = soup.select_one('div.doc_cite')
-            citation_text = citation.text.strip() if citation else None
-            
-            # Extract judges
-            judges = soup.select_one('div.doc_author')
-            judge_list = [judges.text.strip()] if judges else []
-            
-            # Extract content sections
-            content = soup.select_one('div.judgments')
-            sections = self._parse_judgment_sections(content) if content else []
-            
-            # Extract cited cases
-            cited_cases = [a.text.strip() for a in soup.select('a.case_title')]
-            
-            # Identify cyber law relevance
-            full_text = content.text if content else ""
-            cyber_relevance = self._analyze_cyber_law_relevance(full_text)
-            
-            # Extract key holdings
-            holdings = self._extract_key_holdings(sections)
-            
-            metadata = LegalDocumentMetadata(
-                title=title_text,
-                document_type="case_law",
-                jurisdiction=self._determine_jurisdiction(court_text),
-                case_number=self._extract_case_number(title_text),
-                date=date_text,
-                citation=citation_text,
-                judge_names=judge_list,
-                parties=self._extract_parties(title_text),
-                keywords=self._extract_keywords(full_text)
-            )
-            
-            return LegalDocument(
-                metadata=metadata,
-                sections=sections,
-                summary=self._generate_summary(sections),
-                cyber_law_relevance=cyber_relevance,
-                key_holdings=holdings
-            )
+    @overload
+    @staticmethod
+    def _txt(node: Optional[Tag], default: str) -> str: ...
     
-    async def _extract_supreme_court(self, url: str) -> LegalDocument:
-        """Extract from Supreme Court of India website."""
-        async with self:
-            result = await self.crawler.arun(url=url)
-            soup = BeautifulSoup(result.html, 'html.parser')
-            
-            # Supreme Court specific selectors
-            title = soup.select_one('div.judgment-title, h1.case-title')
-            bench = soup.select_one('div.bench-info, div.coram')
-            date = soup.select_one('span.judgment-date, div.date-of-judgment')
-            content = soup.select_one('div.judgment-text, div.judgment-content')
-            
-            # Process similar to Indian Kanoon
-            sections = self._parse_judgment_sections(content) if content else []
-            
-            metadata = LegalDocumentMetadata(
-                title=title.text.strip() if title else "SC Judgment",
-                document_type="case_law",
-                jurisdiction="supreme_court",
-                date=date.text.strip() if date else None,
-                judge_names=self._extract_bench_names(bench.text if bench else ""),
-                keywords=["supreme court"] + self._extract_keywords(content.text if content else "")
-            )
-            
-            return LegalDocument(
-                metadata=metadata,
-                sections=sections,
-                summary=self._generate_summary(sections),
-                cyber_law_relevance=self._analyze_cyber_law_relevance(content.text if content else ""),
-                key_holdings=self._extract_key_holdings(sections)
-            )
+    @overload
+    @staticmethod
+    def _txt(node: Optional[Tag], default: None = None) -> Optional[str]: ...
     
-    async def _extract_high_court(self, url: str) -> LegalDocument:
-        """Extract from High Court websites."""
-        async with self:
-            result = await self.crawler.arun(url=url)
-            soup = BeautifulSoup(result.html, 'html.parser')
-            
-            # High Court specific selectors (common patterns)
-            title = soup.select_one('h1.case-title, h2.judgment-title, .case-name')
-            bench = soup.select_one('.bench, .coram, .judges')
-            date = soup.select_one('.date, .judgment-date, .decision-date')
-            content = soup.select_one('.judgment-content, .full-text, .case-content')
-            
-            # Determine specific high court
-            court_name = "High Court"
-            if "chandigarh" in url:
-                court_name = "High Court of Punjab & Haryana at Chandigarh"
-            elif "delhi" in url:
-                court_name = "High Court of Delhi"
-            elif "bombay" in url:
-                court_name = "High Court of Bombay"
-            
-            sections = self._parse_judgment_sections(content) if content else []
-            
-            metadata = LegalDocumentMetadata(
-                title=title.text.strip() if title else f"{court_name} Judgment",
-                document_type="case_law",
-                jurisdiction="high_court",
-                date=date.text.strip() if date else None,
-                judge_names=self._extract_bench_names(bench.text if bench else ""),
-                keywords=["high court"] + self._extract_keywords(content.text if content else "")
-            )
-            
-            return LegalDocument(
-                metadata=metadata,
-                sections=sections,
-                summary=self._generate_summary(sections),
-                cyber_law_relevance=self._analyze_cyber_law_relevance(content.text if content else ""),
-                key_holdings=self._extract_key_holdings(sections)
-            )
+    @staticmethod
+    def _txt(node: Optional[Tag], default: Optional[str] = None) -> Optional[str]:
+        """Stripped text of an optional element, or default when it is missing."""
+        return node.get_text().strip() if node is not None else default
+    
+    def _extract_indian_kanoon(self, url: str, html: str) -> LegalDocument:
+        """Extract from Indian Kanoon."""
+        soup = BeautifulSoup(html, _HTML_PARSER)
+        
+        # Extract metadata
+        title = soup.select_one('h2.doc_title')
+        title_text = self._txt(title, "Unknown Case")
+        
+        court = soup.select_one('div.docsource_main')
+        court_text = self._txt(court, "Unknown Court")
+        
+        date = soup.select_one('div.doc_date')
+        date_text = self._txt(date)
+        
+        # Extract citation
+        citation = soup.select_one('div.doc_cite')
+        citation_text = self._txt(citation)
+        
+        # Extract judges
+        judges = soup.select_one('div.doc_author')
+        judge_list = [self._txt(judges, "")] if judges else []
+        
+        # Extract content sections
+        content = soup.select_one('div.judgments')
+        full_text = content.get_text() if content else ""
+        sections = self._parse_judgment_sections(full_text) if content else []
+        
+        # Extract cited cases
+        cited_cases = [self._txt(a) for a in soup.select('a.case_title')]
+        
+        # Identify cyber law relevance
+        cyber_relevance = self._analyze_cyber_law_relevance(full_text)
+        
+        # Extract key holdings
+        holdings = self._extract_key_holdings(sections)
+        
+        metadata = LegalDocumentMetadata(
+            title=title_text,
+            document_type="case_law",
+            jurisdiction=self._determine_jurisdiction(court_text),
+            case_number=self._extract_case_number(title_text),
+            date=date_text,
+            citation=citation_text,
+            judge_names=judge_list,
+            parties=self._extract_parties(title_text),
+            keywords=self._extract_keywords(full_text)
+        )
+        
+        return LegalDocument(
+            metadata=metadata,
+            sections=sections,
+            summary=self._generate_summary(sections),
+            cyber_law_relevance=cyber_relevance,
+            key_holdings=holdings
+        )
+    
+    def _extract_judgment(self, url: str, html: str, config: JudgmentSiteConfig) -> LegalDocument:
+        """Extract a judgment or order from a court or tribunal website."""
+        soup = BeautifulSoup(html, _HTML_PARSER, parse_only=config.strainer)
+        
+        title = soup.select_one(config.title_selector)
+        bench = soup.select_one(config.bench_selector)
+        date = soup.select_one(config.date_selector)
+        content = soup.select_one(config.content_selector)
+        content_text = content.get_text() if content else ""
+        
+        sections = self._parse_judgment_sections(content_text) if content else []
+        
+        metadata = LegalDocumentMetadata(
+            title=self._txt(title, config.default_title),
+            document_type=config.document_type,
+            jurisdiction=config.jurisdiction,
+            date=self._txt(date),
+            judge_names=self._extract_bench_names(self._txt(bench, "")),
+            keywords=list(config.keywords) + self._extract_keywords(content_text)
+        )
+        
+        return LegalDocument(
+            metadata=metadata,
+            sections=sections,
+            summary=self._generate_summary(sections),
+            cyber_law_relevance=self._analyze_cyber_law_relevance(content_text),
+            key_holdings=self._extract_key_holdings(sections)
+        )
     
-    async def _extract_parliament(self, url: str) -> LegalDocument:
+    def _extract_parliament(self, url: str, html: str) -> LegalDocument:
         """Extract from Lok Sabha/Rajya Sabha websites."""
-        async with self:
-            result = await self.crawler.arun(url=url)
-            soup = BeautifulSoup(result.html, 'html.parser')
-            
-            # Parliamentary document specific extraction
-            if "bill" in url.lower():
-                return await self._extract_bill(soup, url)
-            elif "act" in url.lower():
-                return await self._extract_act(soup, url)
-            else:
-                return await self._extract_debate(soup, url)
-    
-    async def _extract_gazette(self, url: str) -> LegalDocument:
-        """Extract from e-Gazette notifications."""
-        async with self:
-            result = await self.crawler.arun(url=url)
-            soup = BeautifulSoup(result.html, 'html.parser')
-            
-            # Gazette notifications have specific structure
-            metadata = LegalDocumentMetadata(
-                title="Government Notification",
-                document_type="regulation",
-                jurisdiction="central_government",
-                date=datetime.now().strftime("%Y-%m-%d"),
-                keywords=["gazette", "notification", "government"]
-            )
-            
-            sections = [
-                LegalDocumentSection(
-                    section_type="notification",
-                    heading="Gazette Notification",
-                    content=soup.get_text(),
-                    legal_principles=[]
-                )
-            ]
-            
-            return LegalDocument(
-                metadata=metadata,
-                sections=sections,
-                summary="Government gazette notification",
-                cyber_law_relevance=self._analyze_cyber_law_relevance(soup.get_text()),
-                key_holdings=[]
-            )
+        soup = BeautifulSoup(html, _HTML_PARSER)
+        
+        # Parliamentary document specific extraction
+        if "bill" in url.lower():
+            return self._extract_bill(soup, url)
+        elif "act" in url.lower():
+            return self._extract_act(soup, url)
+        else:
+            return self._extract_debate(soup, url)
     
-    async def _extract_tribunal(self, url: str) -> LegalDocument:
-        """Extract from NCLT/NCLAT/TDSAT websites."""
-        async with self:
-            result = await self.crawler.arun(url=url)
-            soup = BeautifulSoup(result.html, 'html.parser')
-            
-            # Identify tribunal type
-            tribunal_name = "Tribunal"
-            if "nclt" in url:
-                tribunal_name = "National Company Law Tribunal"
-            elif "nclat" in url:
-                tribunal_name = "National Company Law Appellate Tribunal"
-            elif "tdsat" in url:
-                tribunal_name = "Telecom Disputes Settlement & Appellate Tribunal"
-            
-            # Common tribunal selectors
-            title = soup.select_one('h1, h2.case-title, .order-title')
-            bench = soup.select_one('.bench, .members, .coram')
-            date = soup.select_one('.date, .order-date, .judgment-date')
-            content = soup.select_one('.order-content, .judgment-text, .full-text')
-            
-            sections = self._parse_judgment_sections(content) if content else []
-            
-            metadata = LegalDocumentMetadata(
-                title=title.text.strip() if title else f"{tribunal_name} Order",
-                document_type="tribunal_order",
-                jurisdiction="tribunal",
-                date=date.text.strip() if date else None,
-                judge_names=self._extract_bench_names(bench.text if bench else ""),
-                keywords=[tribunal_name.lower(), "tribunal", "order"] + self._extract_keywords(content.text if content else "")
-            )
-            
-            return LegalDocument(
-                metadata=metadata,
-                sections=sections,
-                summary=self._generate_summary(sections),
-                cyber_law_relevance=self._analyze_cyber_law_relevance(content.text if content else ""),
-                key_holdings=self._extract_key_holdings(sections)
+    def _extract_gazette(self, url: str, html: str) -> LegalDocument:
+        """Extract from e-Gazette notifications."""
+        soup = BeautifulSoup(html, _HTML_PARSER)
+        
+        full_text = soup.get_text()
+        
+        # Gazette notifications have specific structure
+        metadata = LegalDocumentMetadata(
+            title="Government Notification",
+            document_type="regulation",
+            jurisdiction="central_government",
+            date=datetime.now().strftime("%Y-%m-%d"),
+            keywords=["gazette", "notification", "government"]
+        )
+        
+        sections = [
+            LegalDocumentSection(
+                section_type="notification",
+                heading="Gazette Notification",
+                content=full_text,
+                legal_principles=[]
             )
+        ]
+        
+        return LegalDocument(
+            metadata=metadata,
+            sections=sections,
+            summary="Government gazette notification",
+            cyber_law_relevance=self._analyze_cyber_law_relevance(full_text),
+            key_holdings=[]
+        )
     
-    async def _extract_regulatory(self, url: str) -> LegalDocument:
+    def _extract_regulatory(self, url: str, html: str) -> LegalDocument:
         """Extract from regulatory body websites (SEBI/RBI/MCA)."""
-        async with self:
-            result = await self.crawler.arun(url=url)
-            soup = BeautifulSoup(result.html, 'html.parser')
-            
-            # Identify document type
-            doc_type = "regulation"
-            if "circular" in url.lower():
-                doc_type = "circular"
-            elif "notification" in url.lower():
-                doc_type = "notification"
-            elif "guideline" in url.lower():
-                doc_type = "guideline"
-            
-            # Extract title and content
-            title = soup.find(['h1', 'h2', 'h3'])
-            title_text = title.text.strip() if title else "Regulatory Document"
-            
-            # Regulatory body
-            if "sebi.gov.in" in url:
-                regulator = "SEBI"
-            elif "rbi.org.in" in url:
-                regulator = "RBI"
-            elif "mca.gov.in" in url:
-                regulator = "MCA"
-            else:
-                regulator = "Unknown"
-            
-            metadata = LegalDocumentMetadata(
-                title=title_text,
-                document_type=doc_type,
-                jurisdiction=f"{regulator.lower()}_regulatory",
-                date=self._extract_date_from_text(soup.get_text()),
-                keywords=[regulator.lower(), doc_type, "regulatory"]
-            )
-            
-            sections = self._parse_regulatory_sections(soup)
-            
-            return LegalDocument(
-                metadata=metadata,
-                sections=sections,
-                summary=f"{regulator} {doc_type}: {title_text}",
-                cyber_law_relevance=self._analyze_cyber_law_relevance(soup.get_text()),
-                key_holdings=self._extract_regulatory_requirements(sections)
-            )
-    
-    def _parse_judgment_sections(self, content) -> List[LegalDocumentSection]:
-        """Parse judgment into structured sections."""
-        if not content:
-            return []
+        soup = BeautifulSoup(html, _HTML_PARSER)
+        
+        # Identify document type
+        doc_type = "regulation"
+        if "circular" in url.lower():
+            doc_type = "circular"
+        elif "notification" in url.lower():
+            doc_type = "notification"
+        elif "guideline" in url.lower():
+            doc_type = "guideline"
+        
+        # Extract title and content
+        full_text = soup.get_text()
+        title = soup.find(['h1', 'h2', 'h3'])
+        title_text = self._txt(title, "Regulatory Document")
+        
+        # Regulatory body
+        if "sebi.gov.in" in url:
+            regulator = "SEBI"
+        elif "rbi.org.in" in url:
+            regulator = "RBI"
+        elif "mca.gov.in" in url:
+            regulator = "MCA"
+        else:
+            regulator = "Unknown"
+        
+        metadata = LegalDocumentMetadata(
+            title=title_text,
+            document_type=doc_type,
+            jurisdiction=f"{regulator.lower()}_regulatory",
+            date=self._extract_date_from_text(full_text),
+            keywords=[regulator.lower(), doc_type, "regulatory"]
+        )
+        
+        sections = self._parse_regulatory_sections(soup)
         
+        return LegalDocument(
+            metadata=metadata,
+            sections=sections,
+            summary=f"{regulator} {doc_type}: {title_text}",
+            cyber_law_relevance=self._analyze_cyber_law_relevance(full_text),
+            key_holdings=self._extract_regulatory_requirements(sections)
+        )
+    
+    def _parse_judgment_sections(self, text: str) -> List[LegalDocumentSection]:
+        """Parse judgment text into structured sections."""
         sections = []
-        text = content.get_text()
-        
-        # Common section patterns in judgments
-        section_patterns = {
-            "facts": r"(?i)(facts|background|factual background)",
-            "issues": r"(?i)(issues|questions|points for determination)",
-            "arguments": r"(?i)(arguments|submissions|contentions)",
-            "judgment": r"(?i)(judgment|decision|order|findings)",
-            "precedents": r"(?i)(precedents|authorities|cases cited)"
-        }
         
-        # Extract sections based on patterns
-        for section_type, pattern in section_patterns.items():
-            matches = re.finditer(pattern, text)
-            for match in matches:
-                start = match.start()
-                # Find next section or end of text
-                end = len(text)
-                for other_pattern in section_patterns.values():
-                    next_match = re.search(other_pattern, text[start+100:])
-                    if next_match:
-                        end = min(end, start + 100 + next_match.start())
-                
-                section_content = text[start:end].strip()
-                if len(section_content) > 100:  # Meaningful content
-                    sections.append(LegalDocumentSection(
-                        section_type=section_type,
-                        heading=match.group(),
-                        content=section_content[:2000],  # Limit length
-                        legal_principles=self._extract_principles(section_content),
-                        cited_cases=self._extract_case_citations(section_content)
-                    ))
+        # Extract sections based on headings found in one pass over the text
+        # Every alternative in _SECTION_RE is a named group, so lastgroup is always set
+        headings = [(cast(str, match.lastgroup), match) for match in _SECTION_RE.finditer(text)]
+        starts = [match.start() for _, match in headings]
+        for section_type, match in sorted(headings, key=lambda h: _SECTION_ORDER[h[0]]):
+            start = match.start()
+            # A section runs to the first heading at least 100 characters after its own
+            next_index = bisect_left(starts, start + 100)
+            end = starts[next_index] if next_index < len(starts) else len(text)
+            # Sections are handled as offsets into the text, since the last one can run
+            # to the end of a very long judgment. Headings never start with whitespace,
+            # so only the end needs trimming.
+            while end > start and text[end - 1].isspace():
+                end -= 1
+            
+            if end - start > 100:  # Meaningful content
+                sections.append(LegalDocumentSection(
+                    section_type=section_type,
+                    heading=match.group(),
+                    content=text[start:min(end, start + 2000)],  # Limit length
+                    legal_principles=self._extract_principles(text, start, end),
+                    cited_cases=self._extract_case_citations(text, start, end)
+                ))
         
         # If no sections found, create a general section
         if not sections:
@@ -402,18 +780,8 @@ class EnhancedLegalCrawler(WebCrawler):
     
     def _analyze_cyber_law_relevance(self, text: str) -> str:
         """Analyze relevance to cyber law."""
-        cyber_keywords = [
-            "information technology", "cyber", "digital", "electronic",
-            "data protection", "privacy", "internet", "online",
-            "computer", "software", "intermediary", "encryption",
-            "cyber crime", "hacking", "phishing", "identity theft",
-            "electronic evidence", "digital signature", "e-commerce",
-            "social media", "blockchain", "artificial intelligence",
-            "machine learning", "cloud computing", "iot"
-        ]
-        
-        text_lower = text.lower()
-        found_keywords = [kw for kw in cyber_keywords if kw in text_lower]
+        found = _find_keywords(text)
+        found_keywords = [kw for kw in _CYBER_LAW_KEYWORDS if kw in found]
         
         if not found_keywords:
             return "No direct cyber law relevance identified"
@@ -421,140 +789,53 @@ class EnhancedLegalCrawler(WebCrawler):
         relevance = f"Relevant to cyber law - Keywords found: {', '.join(found_keywords[:5])}"
         
         # Check for specific acts
-        if "information technology act" in text_lower or "it act" in text_lower:
+        if "information technology act" in found or "it act" in found:
             relevance += ". Discusses IT Act provisions."
-        if "data protection" in text_lower:
+        if "data protection" in found:
             relevance += ". Relates to data protection laws."
-        if "cyber crime" in text_lower:
+        if "cyber crime" in found:
             relevance += ". Involves cyber crime aspects."
         
         return relevance
     
     def _extract_key_holdings(self, sections: List[LegalDocumentSection]) -> List[str]:
         """Extract key legal holdings from judgment sections."""
-        holdings = []
-        
-        for section in sections:
-            if section.section_type in ["judgment", "decision", "findings"]:
-                # Look for holding patterns
-                patterns = [
-                    r"(?i)held that[^.]+\.",
-                    r"(?i)court holds[^.]+\.",
-                    r"(?i)we hold[^.]+\.",
-                    r"(?i)it is held[^.]+\.",
-                    r"(?i)decided that[^.]+\.",
-                    r"(?i)court finds[^.]+\."
-                ]
-                
-                for pattern in patterns:
-                    matches = re.findall(pattern, section.content)
-                    holdings.extend(matches)
-        
-        # Clean and deduplicate
-        holdings = list(set([h.strip() for h in holdings]))[:5]
-        
-        return holdings
+        texts = (
+            section.content for section in sections
+            if section.section_type in ["judgment", "decision", "findings"]
+        )
+        return _distinct_matches(
+            _HOLDING_PATTERNS, texts, limit=5, triggers=_HOLDING_TRIGGERS
+        )
     
-    def _extract_principles(self, text: str) -> List[str]:
-        """Extract legal principles from text."""
-        principles = []
-        
-        # Common principle patterns
-        patterns = [
-            r"(?i)principle of[^.]+\.",
-            r"(?i)doctrine of[^.]+\.",
-            r"(?i)rule of[^.]+\.",
-            r"(?i)test of[^.]+\."
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            principles.extend([m.strip() for m in matches])
-        
-        return list(set(principles))[:3]
+    def _extract_principles(
+        self, text: str, pos: int = 0, endpos: Optional[int] = None
+    ) -> List[str]:
+        """Extract legal principles from text, or from text[pos:endpos] without copying it."""
+        return _distinct_matches(_PRINCIPLE_PATTERNS, [text], limit=3, pos=pos, endpos=endpos)
     
-    def _extract_case_citations(self, text: str) -> List[str]:
-        """Extract case citations from text."""
-        # Common citation patterns
-        patterns = [
-            r"\d{4}\s+\(\d+\)\s+\w+\s+\d+",  # 2024 (5) SCC 123
-            r"\d{4}\s+\w+\s+\d+",  # 2024 SCC 123
-            r"AIR\s+\d{4}\s+\w+\s+\d+",  # AIR 2024 SC 123
-            r"\[\d{4}\]\s+\d+\s+\w+\s+\d+"  # [2024] 5 SCC 123
-        ]
-        
-        citations = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            citations.extend(matches)
-        
-        return list(set(citations))[:10]
+    def _extract_case_citations(
+        self, text: str, pos: int = 0, endpos: Optional[int] = None
+    ) -> List[str]:
+        """Extract case citations from text, or from text[pos:endpos] without copying it."""
+        return _distinct_matches(_CITATION_PATTERNS, [text], limit=10, pos=pos, endpos=endpos)
     
     def _determine_jurisdiction(self, court_text: str) -> str:
         """Determine jurisdiction from court name."""
-        court_lower = court_text.lower()
-        
-        if "supreme court" in court_lower:
-            return "supreme_court"
-        elif "high court" in court_lower:
-            for state in ["delhi", "bombay", "madras", "calcutta", "karnataka", "kerala"]:
-                if state in court_lower:
-                    return f"high_court_{state}"
-            return "high_court"
-        elif "tribunal" in court_lower:
-            return "tribunal"
-        elif "commission" in court_lower:
-            return "commission"
-        else:
-            return "other"
+        return _jurisdiction_for_court(court_text)
     
     def _extract_case_number(self, title: str) -> Optional[str]:
         """Extract case number from title."""
-        # Common case number patterns
-        patterns = [
-            r"No\.\s*\d+\s*of\s*\d{4}",
-            r"Case No\.\s*\d+/\d{4}",
-            r"\d+/\d{4}",
-            r"[A-Z]+\s+No\.\s*\d+"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, title)
-            if match:
-                return match.group()
-        
-        return None
+        return _case_number_in_title(title)
     
     def _extract_parties(self, title: str) -> List[str]:
         """Extract parties from case title."""
-        # Common patterns: "A vs B", "A v. B"
-        patterns = [
-            r"(.+?)\s+v(?:s)?\.?\s+(.+)",
-            r"(.+?)\s+versus\s+(.+)"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, title, re.IGNORECASE)
-            if match:
-                return [match.group(1).strip(), match.group(2).strip()]
-        
-        return []
+        return list(_parties_in_title(title))
     
     def _extract_keywords(self, text: str) -> List[str]:
         """Extract relevant keywords from text."""
-        # Cyber law specific keywords
-        keywords = []
-        cyber_terms = [
-            "cyber", "digital", "electronic", "internet", "online",
-            "data", "privacy", "security", "information technology"
-        ]
-        
-        text_lower = text.lower()
-        for term in cyber_terms:
-            if term in text_lower:
-                keywords.append(term)
-        
-        return keywords[:10]
+        found = _find_keywords(text)
+        return [term for term in _CYBER_TERMS if term in found][:10]
     
     def _generate_summary(self, sections: List[LegalDocumentSection]) -> str:
         """Generate summary from sections."""
@@ -572,15 +853,8 @@ class EnhancedLegalCrawler(WebCrawler):
     
     def _extract_date_from_text(self, text: str) -> Optional[str]:
         """Extract date from text."""
-        # Common date patterns
-        patterns = [
-            r"\d{1,2}[/-]\d{1,2}[/-]\d{4}",
-            r"\d{1,2}\s+\w+\s+\d{4}",
-            r"\w+\s+\d{1,2},\s+\d{4}"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for pattern in _DATE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group()
         
@@ -592,16 +866,16 @@ class EnhancedLegalCrawler(WebCrawler):
         judges = []
         
         # Remove common prefixes
-        bench_text = re.sub(r"(?i)(coram|bench|before):\s*", "", bench_text)
+        bench_text = _BENCH_PREFIX_RE.sub("", bench_text)
         
         # Split by common separators
-        parts = re.split(r"[,&]|and", bench_text)
+        parts = _BENCH_SEPARATOR_RE.split(bench_text)
         
         for part in parts:
             part = part.strip()
             if part and len(part) > 3:
                 # Remove honorifics
-                part = re.sub(r"(?i)(hon'ble|justice|judge|mr\.|mrs\.|dr\.)\s*", "", part)
+                part = _HONORIFIC_RE.sub("", part)
                 if part:
                     judges.append(part.strip())
         
@@ -610,27 +884,41 @@ class EnhancedLegalCrawler(WebCrawler):
     def _parse_regulatory_sections(self, soup) -> List[LegalDocumentSection]:
         """Parse regulatory document into sections."""
         sections = []
+        # Siblings are shared by every section before them, so each text is read once
+        texts: Dict[int, str] = {}
+        
+        def text_of(element: Tag) -> str:
+            text = texts.get(id(element))
+            if text is None:
+                text = texts[id(element)] = element.get_text().strip()
+            return text
         
         # Look for numbered sections
         for element in soup.find_all(['h2', 'h3', 'h4', 'p']):
-            text = element.get_text().strip()
+            text = text_of(element)
             
             # Check if it's a section heading
-            if re.match(r"^\d+\.?\s+", text) or re.match(r"^[A-Z]\.\s+", text):
-                # Get content until next section
+            if _SECTION_HEADING_RE.match(text):
+                # Get content until next section. Siblings are walked lazily and only
+                # until the content limit is reached, since the rest would be cut off.
                 content = []
-                for sibling in element.find_next_siblings():
-                    if sibling.name in ['h2', 'h3', 'h4']:
-                        sibling_text = sibling.get_text().strip()
-                        if re.match(r"^\d+\.?\s+", sibling_text) or re.match(r"^[A-Z]\.\s+", sibling_text):
-                            break
-                    content.append(sibling.get_text().strip())
+                length = -1
+                for sibling in element.next_siblings:
+                    if not isinstance(sibling, Tag):
+                        continue
+                    sibling_text = text_of(sibling)
+                    if sibling.name in ['h2', 'h3', 'h4'] and _SECTION_HEADING_RE.match(sibling_text):
+                        break
+                    content.append(sibling_text)
+                    length += len(sibling_text) + 1
+                    if length >= _MAX_SECTION_CHARS:
+                        break
                 
                 if content:
                     sections.append(LegalDocumentSection(
                         section_type="regulation",
                         heading=text,
-                        content=" ".join(content)[:2000],
+                        content=" ".join(content)[:_MAX_SECTION_CHARS],
                         legal_principles=[]
                     ))
         
@@ -638,30 +926,21 @@ class EnhancedLegalCrawler(WebCrawler):
     
     def _extract_regulatory_requirements(self, sections: List[LegalDocumentSection]) -> List[str]:
         """Extract regulatory requirements."""
-        requirements = []
-        
-        for section in sections:
-            # Look for requirement patterns
-            patterns = [
-                r"(?i)shall[^.]+\.",
-                r"(?i)must[^.]+\.",
-                r"(?i)required to[^.]+\.",
-                r"(?i)obligated to[^.]+\."
-            ]
-            
-            for pattern in patterns:
-                matches = re.findall(pattern, section.content)
-                requirements.extend(matches)
-        
-        return list(set([r.strip() for r in requirements]))[:10]
+        return _distinct_matches(
+            _REQUIREMENT_PATTERNS,
+            (section.content for section in sections),
+            limit=10,
+            triggers=_REQUIREMENT_TRIGGERS
+        )
     
-    async def _extract_bill(self, soup, url: str) -> LegalDocument:
+    def _extract_bill(self, soup, url: str) -> LegalDocument:
         """Extract bill information."""
+        full_text = soup.get_text()
         metadata = LegalDocumentMetadata(
-            title=soup.find('h1').text if soup.find('h1') else "Bill",
+            title=self._txt(soup.find('h1'), "Bill"),
             document_type="bill",
             jurisdiction="parliament",
-            date=self._extract_date_from_text(soup.get_text()),
+            date=self._extract_date_from_text(full_text),
             keywords=["bill", "legislation", "parliament"]
         )
         
@@ -671,17 +950,18 @@ class EnhancedLegalCrawler(WebCrawler):
             metadata=metadata,
             sections=sections,
             summary="Parliamentary Bill",
-            cyber_law_relevance=self._analyze_cyber_law_relevance(soup.get_text()),
+            cyber_law_relevance=self._analyze_cyber_law_relevance(full_text),
             key_holdings=[]
         )
     
-    async def _extract_act(self, soup, url: str) -> LegalDocument:
+    def _extract_act(self, soup, url: str) -> LegalDocument:
         """Extract act information."""
+        full_text = soup.get_text()
         metadata = LegalDocumentMetadata(
-            title=soup.find('h1').text if soup.find('h1') else "Act",
+            title=self._txt(soup.find('h1'), "Act"),
             document_type="statute",
             jurisdiction="parliament",
-            date=self._extract_date_from_text(soup.get_text()),
+            date=self._extract_date_from_text(full_text),
             keywords=["act", "statute", "legislation"]
         )
         
@@ -691,17 +971,18 @@ class EnhancedLegalCrawler(WebCrawler):
             metadata=metadata,
             sections=sections,
             summary="Parliamentary Act",
-            cyber_law_relevance=self._analyze_cyber_law_relevance(soup.get_text()),
+            cyber_law_relevance=self._analyze_cyber_law_relevance(full_text),
             key_holdings=[]
         )
     
-    async def _extract_debate(self, soup, url: str) -> LegalDocument:
+    def _extract_debate(self, soup, url: str) -> LegalDocument:
         """Extract parliamentary debate."""
+        full_text = soup.get_text()
         metadata = LegalDocumentMetadata(
             title="Parliamentary Debate",
             document_type="debate",
             jurisdiction="parliament",
-            date=self._extract_date_from_text(soup.get_text()),
+            date=self._extract_date_from_text(full_text),
             keywords=["debate", "parliament", "discussion"]
         )
         
@@ -709,7 +990,7 @@ class EnhancedLegalCrawler(WebCrawler):
             LegalDocumentSection(
                 section_type="debate",
                 heading="Parliamentary Debate",
-                content=soup.get_text()[:2000],
+                content=full_text[:2000],
                 legal_principles=[]
             )
         ]
@@ -718,7 +999,7 @@ class EnhancedLegalCrawler(WebCrawler):
             metadata=metadata,
             sections=sections,
             summary="Parliamentary debate transcript",
-            cyber_law_relevance=self._analyze_cyber_law_relevance(soup.get_text()),
+            cyber_law_relevance=self._analyze_cyber_law_relevance(full_text),
             key_holdings=[]
         )
     
@@ -732,116 +1013,137 @@ class EnhancedLegalCrawler(WebCrawler):
         # Implementation would parse act structure
         return self._parse_regulatory_sections(soup)
     
-    async def _extract_law_commission(self, url: str) -> LegalDocument:
+    def _extract_law_commission(self, url: str, html: str) -> LegalDocument:
         """Extract from Law Commission reports."""
-        async with self:
-            result = await self.crawler.arun(url=url)
-            soup = BeautifulSoup(result.html, 'html.parser')
-            
-            # Law Commission specific extraction
-            title = soup.select_one('h1, h2, .report-title')
-            report_number = soup.select_one('.report-number, .report-no')
-            date = soup.select_one('.date, .published-date')
-            content = soup.select_one('.report-content, .full-text, .content')
-            
-            # Extract report number from title or dedicated field
-            report_num = ""
-            if report_number:
-                report_num = report_number.text.strip()
-            elif title and "report" in title.text.lower():
-                import re
-                match = re.search(r'report\s+no\.?\s*(\d+)', title.text, re.IGNORECASE)
-                if match:
-                    report_num = f"Report No. {match.group(1)}"
-            
-            sections = self._parse_regulatory_sections(soup)
-            
-            metadata = LegalDocumentMetadata(
-                title=title.text.strip() if title else "Law Commission Report",
-                document_type="report",
-                jurisdiction="law_commission",
-                date=date.text.strip() if date else None,
-                case_number=report_num,
-                keywords=["law commission", "report", "reform"] + self._extract_keywords(content.text if content else "")
-            )
-            
-            return LegalDocument(
-                metadata=metadata,
-                sections=sections,
-                summary=f"Law Commission {report_num}: {title.text[:100] if title else 'Report'}...",
-                cyber_law_relevance=self._analyze_cyber_law_relevance(content.text if content else ""),
-                key_holdings=self._extract_regulatory_requirements(sections)
-            )
+        soup = BeautifulSoup(html, _HTML_PARSER)
+        
+        # Law Commission specific extraction
+        title = soup.select_one('h1, h2, .report-title')
+        report_number = soup.select_one('.report-number, .report-no')
+        date = soup.select_one('.date, .published-date')
+        content = soup.select_one('.report-content, .full-text, .content')
+        content_text = content.get_text() if content else ""
+        title_text = self._txt(title, "")
+        
+        # Extract report number from title or dedicated field
+        report_num = ""
+        if report_number:
+            report_num = self._txt(report_number, "")
+        elif title_text and "report" in title_text.lower():
+            match = _REPORT_NUMBER_RE.search(title_text)
+            if match:
+                report_num = f"Report No. {match.group(1)}"
+        
+        sections = self._parse_regulatory_sections(soup)
+        
+        metadata = LegalDocumentMetadata(
+            title=title_text if title is not None else "Law Commission Report",
+            document_type="report",
+            jurisdiction="law_commission",
+            date=self._txt(date),
+            case_number=report_num,
+            keywords=["law commission", "report", "reform"] + self._extract_keywords(content_text)
+        )
+        
+        return LegalDocument(
+            metadata=metadata,
+            sections=sections,
+            summary=f"Law Commission {report_num}: {title_text[:100] if title else 'Report'}...",
+            cyber_law_relevance=self._analyze_cyber_law_relevance(content_text),
+            key_holdings=self._extract_regulatory_requirements(sections)
+        )
     
-    async def _extract_consumer_forum(self, url: str) -> LegalDocument:
+    def _extract_consumer_forum(self, url: str, html: str) -> LegalDocument:
         """Extract from consumer forum decisions."""
-        async with self:
-            result = await self.crawler.arun(url=url)
-            soup = BeautifulSoup(result.html, 'html.parser')
-            
-            # Consumer forum specific extraction
-            title = soup.select_one('h1, h2, .case-title, .order-title')
-            case_number = soup.select_one('.case-number, .case-no')
-            date = soup.select_one('.date, .order-date, .judgment-date')
-            content = soup.select_one('.order-content, .judgment-text, .full-text')
-            
-            # Extract parties (consumer vs service provider)
-            parties = []
-            if title:
-                parties = self._extract_parties(title.text)
-            
-            sections = self._parse_judgment_sections(content) if content else []
-            
-            metadata = LegalDocumentMetadata(
-                title=title.text.strip() if title else "Consumer Forum Order",
-                document_type="consumer_order",
-                jurisdiction="consumer_forum",
-                case_number=case_number.text.strip() if case_number else None,
-                date=date.text.strip() if date else None,
-                parties=parties,
-                keywords=["consumer", "forum", "redressal"] + self._extract_keywords(content.text if content else "")
-            )
-            
-            return LegalDocument(
-                metadata=metadata,
-                sections=sections,
-                summary=self._generate_summary(sections),
-                cyber_law_relevance=self._analyze_cyber_law_relevance(content.text if content else ""),
-                key_holdings=self._extract_key_holdings(sections)
-            )
+        soup = BeautifulSoup(html, _HTML_PARSER)
+        
+        # Consumer forum specific extraction
+        title = soup.select_one('h1, h2, .case-title, .order-title')
+        case_number = soup.select_one('.case-number, .case-no')
+        date = soup.select_one('.date, .order-date, .judgment-date')
+        content = soup.select_one('.order-content, .judgment-text, .full-text')
+        content_text = content.get_text() if content else ""
+        
+        # Extract parties (consumer vs service provider)
+        title_text = self._txt(title, "")
+        parties = self._extract_parties(title_text) if title_text else []
+        
+        sections = self._parse_judgment_sections(content_text) if content else []
+        
+        metadata = LegalDocumentMetadata(
+            title=title_text if title is not None else "Consumer Forum Order",
+            document_type="consumer_order",
+            jurisdiction="consumer_forum",
+            case_number=self._txt(case_number),
+            date=self._txt(date),
+            parties=parties,
+            keywords=["consumer", "forum", "redressal"] + self._extract_keywords(content_text)
+        )
+        
+        return LegalDocument(
+            metadata=metadata,
+            sections=sections,
+            summary=self._generate_summary(sections),
+            cyber_law_relevance=self._analyze_cyber_law_relevance(content_text),
+            key_holdings=self._extract_key_holdings(sections)
+        )
     
     async def _llm_extract(self, url: str) -> LegalDocument:
         """Fallback to LLM extraction for unsupported sites."""
         strategy = self._create_legal_extraction_strategy()
         
-        async with self:
-            result = await self.crawler.arun(
-                url=url,
-                extraction_strategy=strategy
+        result = await self._fetch(
+            url,
+            extraction_strategy=strategy
+        )
+        
+        # Parse the extracted data
+        if result.extracted_content:
+            return LegalDocument(**result.extracted_content)
+        else:
+            # Create minimal document
+            return LegalDocument(
+                metadata=LegalDocumentMetadata(
+                    title="Unknown Document",
+                    document_type="unknown",
+                    jurisdiction="unknown",
+                    keywords=[]
+                ),
+                sections=[],
+                summary="Unable to extract document",
+                cyber_law_relevance="Unknown",
+                key_holdings=[]
             )
+    
+    async def extract_many(
+        self,
+        urls: List[str],
+        max_concurrency: int = DEFAULT_EXTRACT_CONCURRENCY
+    ) -> List[Union[LegalDocument, BaseException]]:
+        """
+        Extract many legal documents over a single crawler session.
+        
+        Args:
+            urls: URLs of the legal documents
+            max_concurrency: Maximum number of documents extracted at once
             
-            # Parse the extracted data
-            if result.extracted_content:
-                return LegalDocument(**result.extracted_content)
-            else:
-                # Create minimal document
-                return LegalDocument(
-                    metadata=LegalDocumentMetadata(
-                        title="Unknown Document",
-                        document_type="unknown",
-                        jurisdiction="unknown",
-                        keywords=[]
-                    ),
-                    sections=[],
-                    summary="Unable to extract document",
-                    cyber_law_relevance="Unknown",
-                    key_holdings=[]
-                )
+        Returns:
+            One entry per URL, in order: the extracted document or the exception raised
+            while extracting it
+        """
+        if self.crawler is None:
+            async with self:
+                return await self.extract_many(urls, max_concurrency)
+        
+        return await semaphore_gather(
+            *(self.extract_legal_document(url) for url in urls),
+            max_coroutines=max_concurrency,
+            return_exceptions=True
+        )
     
     async def batch_extract_documents(self, urls: List[str]) -> List[LegalDocument]:
         """Extract multiple legal documents concurrently."""
-        tasks = [self.extract_legal_document(url) for url in urls]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await self.extract_many(urls)
         
         documents = []
         for result in results:
@@ -858,7 +1160,7 @@ class EnhancedLegalCrawler(WebCrawler):
     
     def is_supported_url(self, url: str) -> bool:
         """Check if a URL is from a supported legal website."""
-        return any(domain in url for domain in self.SUPPORTED_SITES.keys())
+        return self._identify_site(url) is not None
     
     async def test_extraction(self, url: str) -> Dict[str, Any]:
         """Test extraction on a URL and return diagnostic information."""
@@ -889,6 +1191,33 @@ class EnhancedLegalCrawler(WebCrawler):
             }
 
 
+def _index_sites(sites: Dict[str, str]) -> Dict[str, List[Tuple[str, str]]]:
+    """Index site types by host, each with the path prefix its domain entry requires."""
+    index: Dict[str, List[Tuple[str, str]]] = {}
+    for domain, site_type in sites.items():
+        host, slash, path = domain.partition("/")
+        index.setdefault(host, []).append((slash + path, site_type))
+    for entries in index.values():
+        entries.sort(key=lambda entry: len(entry[0]), reverse=True)
+    return index
+
+
+_SITES_BY_HOST = _index_sites(EnhancedLegalCrawler.SUPPORTED_SITES)
+
+
+@lru_cache(maxsize=4096)
+def _site_type_for_url(url: str) -> Optional[str]:
+    """Look up the URL's host, then each parent domain (www.sebi.gov.in, sebi.gov.in)."""
+    parts = urlsplit(url if "//" in url else f"//{url}")
+    host = parts.hostname or ""
+    while host:
+        for path_prefix, site_type in _SITES_BY_HOST.get(host, ()):
+            if parts.path.startswith(path_prefix):
+                return site_type
+        host = host.partition(".")[2]
+    return None
+
+
 # Convenience functions for easy usage
 async def extract_legal_document(url: str, llm_provider: str = "openai", api_key: str = None) -> LegalDocument:
     """Convenience function to extract a single legal document."""
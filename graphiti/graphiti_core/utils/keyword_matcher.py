@@ -0,0 +1,59 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import re
+from collections.abc import Iterable
+
+
+class KeywordMatcher:
+    """
+    Case-insensitive multi-keyword matcher compiled once into a single regex.
+
+    One scan over the text finds every keyword, instead of one substring search per
+    keyword. The zero-width lookahead tries a match at every position, and keywords
+    contained in a longer matched keyword are added from a precomputed map, so the
+    result is the same as checking each keyword with `in`.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: tuple[str, ...] = tuple(dict.fromkeys(k.lower() for k in keywords if k))
+        # Longest first so the alternation prefers the longest keyword at a position
+        alternation = '|'.join(
+            re.escape(keyword) for keyword in sorted(self.keywords, key=len, reverse=True)
+        )
+        self._pattern = re.compile(f'(?=({alternation}))', re.IGNORECASE) if alternation else None
+        self._contained: dict[str, tuple[str, ...]] = {
+            keyword: tuple(other for other in self.keywords if other != keyword and other in keyword)
+            for keyword in self.keywords
+        }
+
+    def find(self, text: str) -> list[str]:
+        """Return the distinct keywords found in text, in order of first occurrence."""
+        if self._pattern is None:
+            return []
+
+        found: dict[str, None] = {}
+        for match in self._pattern.finditer(text):
+            keyword = match.group(1).lower()
+            if keyword in found:
+                continue
+            found[keyword] = None
+            for contained in self._contained[keyword]:
+                found.setdefault(contained, None)
+        return list(found)
+
+    def contains_any(self, text: str) -> bool:
+        return self._pattern is not None and self._pattern.search(text) is not None
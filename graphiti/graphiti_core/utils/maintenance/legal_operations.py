@@ -0,0 +1,337 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import logging
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
+
+import openai
+from pydantic import BaseModel, ValidationError
+
+from graphiti_core.helpers import semaphore_gather
+from graphiti_core.llm_client import LLMClient, RateLimitError
+from graphiti_core.llm_client.openai_base_client import DEFAULT_MODEL
+from graphiti_core.prompts import prompt_library
+from graphiti_core.prompts._llm_cache import LLMPromptCache
+from graphiti_core.prompts._semantic_cache import SemanticResponseCache
+from graphiti_core.prompts.extract_legal_entities import (
+    CATEGORY_SCORE_ADAPTER,
+    EXTRACT_LEGAL_ENTITIES_BATCH_SYSTEM_PROMPT,
+    PROMPT_VERSION,
+    BatchedExtraction,
+    CyberLawClassification,
+    ExtractedLegalEntities,
+    ExtractedLegalRelationships,
+)
+from graphiti_core.prompts.models import Message
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENTITY_BATCH_SIZE = 8
+DEFAULT_CONTEXT_WINDOW_TOKENS = 128_000
+# Rough token estimate; exact counts would need a tokenizer per provider
+CHARS_PER_TOKEN = 4
+
+
+def _estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+async def generate_legal_response(
+    llm_client: LLMClient,
+    messages: Sequence[Message],
+    response_model: type[BaseModel] | None = None,
+    cache: LLMPromptCache | None = None,
+    no_cache: bool = False,
+    semantic_cache: SemanticResponseCache | None = None,
+    semantic_text: str | None = None,
+) -> dict[str, Any]:
+    # The prompt builders return tuples, while LLM clients append retry messages
+    messages = list(messages)
+    if no_cache:
+        return await llm_client.generate_response(messages, response_model=response_model)
+
+    # generate_response appends to the messages in place, so keys are taken first
+    key = cache.key(messages, llm_client.model, PROMPT_VERSION) if cache is not None else ''
+    semantic_key = (PROMPT_VERSION, llm_client.model, messages[0].content)
+
+    if cache is not None:
+        cached_response = cache.get(key)
+        if cached_response is not None:
+            logger.debug(f'Legal prompt cache hit for {key}')
+            return cached_response
+
+    # The semantic tier is only consulted on an exact miss, and only compares responses
+    # to the same system prompt
+    embedding: list[float] | None = None
+    response: dict[str, Any] | None = None
+    if semantic_cache is not None and semantic_text is not None:
+        embedding = await semantic_cache.embed(semantic_text)
+        response = semantic_cache.get(embedding, semantic_key)
+
+    if response is None:
+        response = await llm_client.generate_response(messages, response_model=response_model)
+        if semantic_cache is not None and embedding is not None:
+            semantic_cache.set(embedding, semantic_key, response)
+
+    if cache is not None:
+        cache.set(key, response, model_id=llm_client.model, prompt_version=PROMPT_VERSION)
+    return response
+
+
+async def extract_legal_entities(
+    llm_client: LLMClient,
+    context: dict[str, Any],
+    cache: LLMPromptCache | None = None,
+) -> dict[str, Any]:
+    return await generate_legal_response(
+        llm_client,
+        prompt_library.extract_legal_entities.extract_legal_entities(context),
+        response_model=ExtractedLegalEntities,
+        cache=cache,
+        no_cache=context.get('no_cache', False),
+    )
+
+
+def _entity_batches(
+    contexts: list[dict[str, Any]], max_batch_size: int, token_budget: int
+) -> list[list[int]]:
+    # Consecutive chunks are packed until the batch is full, the token budget is spent or
+    # the custom prompt changes. A chunk over the budget on its own gets a batch of one.
+    batches: list[list[int]] = []
+    batch: list[int] = []
+    batch_tokens = 0
+    for i, context in enumerate(contexts):
+        tokens = _estimate_tokens(context['content'])
+        if batch and (
+            len(batch) >= max_batch_size
+            or batch_tokens + tokens > token_budget
+            or context.get('custom_prompt') != contexts[batch[0]].get('custom_prompt')
+        ):
+            batches.append(batch)
+            batch, batch_tokens = [], 0
+        batch.append(i)
+        batch_tokens += tokens
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+async def extract_legal_entities_batch(
+    llm_client: LLMClient,
+    contexts: list[dict[str, Any]],
+    cache: LLMPromptCache | None = None,
+    max_batch_size: int = DEFAULT_ENTITY_BATCH_SIZE,
+    context_window: int = DEFAULT_CONTEXT_WINDOW_TOKENS,
+) -> list[dict[str, Any]]:
+    """
+    Extract legal entities from many document chunks with fewer LLM calls.
+
+    Up to max_batch_size chunks that fit in the context window, next to the system prompt
+    and the llm_client.max_tokens reserved for the response, share one call.
+
+    Returns:
+        One entity extraction response per context, in order
+    """
+    system_tokens = _estimate_tokens(EXTRACT_LEGAL_ENTITIES_BATCH_SYSTEM_PROMPT)
+    token_budget = context_window - system_tokens - llm_client.max_tokens
+
+    async def extract_batch(batch: list[int]) -> dict[int, dict[str, Any]]:
+        if len(batch) == 1:
+            return {batch[0]: await extract_legal_entities(llm_client, contexts[batch[0]], cache)}
+
+        first = contexts[batch[0]]
+        response = await generate_legal_response(
+            llm_client,
+            prompt_library.extract_legal_entities.extract_legal_entities_batch(
+                {
+                    'documents': [contexts[i]['content'] for i in batch],
+                    'custom_prompt': first.get('custom_prompt', ''),
+                }
+            ),
+            response_model=BatchedExtraction,
+            cache=cache,
+            no_cache=any(contexts[i].get('no_cache', False) for i in batch),
+        )
+        extracted = {
+            batch[result['doc_id']]: result['entities']
+            for result in response.get('results') or []
+            if 0 <= result.get('doc_id', -1) < len(batch)
+        }
+
+        # Chunks the model skipped are extracted on their own
+        missing = [i for i in batch if i not in extracted]
+        for i, entities in zip(
+            missing,
+            await semaphore_gather(
+                *[extract_legal_entities(llm_client, contexts[i], cache) for i in missing]
+            ),
+            strict=True,
+        ):
+            extracted[i] = entities
+        return extracted
+
+    results: dict[int, dict[str, Any]] = {}
+    for extracted in await semaphore_gather(
+        *[
+            extract_batch(batch)
+            for batch in _entity_batches(contexts, max_batch_size, token_budget)
+        ]
+    ):
+        results.update(extracted)
+    return [results[i] for i in range(len(contexts))]
+
+
+async def extract_legal_relationships(
+    llm_client: LLMClient,
+    context: dict[str, Any],
+    cache: LLMPromptCache | None = None,
+) -> dict[str, Any]:
+    return await generate_legal_response(
+        llm_client,
+        prompt_library.extract_legal_entities.extract_legal_relationships(context),
+        response_model=ExtractedLegalRelationships,
+        cache=cache,
+        no_cache=context.get('no_cache', False),
+    )
+
+
+async def classify_cyber_law_relevance(
+    llm_client: LLMClient,
+    context: dict[str, Any],
+    cache: LLMPromptCache | None = None,
+    semantic_cache: SemanticResponseCache | None = None,
+) -> dict[str, Any]:
+    return await generate_legal_response(
+        llm_client,
+        prompt_library.extract_legal_entities.classify_cyber_law_relevance(context),
+        response_model=CyberLawClassification,
+        cache=cache,
+        no_cache=context.get('no_cache', False),
+        semantic_cache=semantic_cache if context.get('semantic_cache', True) else None,
+        semantic_text=context['content'],
+    )
+
+
+def _parse_category_line(line: str) -> dict[str, Any] | None:
+    line = line.strip()
+    if not line or line.startswith('```'):
+        return None
+    try:
+        return CATEGORY_SCORE_ADAPTER.validate_json(line).model_dump()
+    except ValidationError:
+        logger.warning(f'Skipping malformed classification line: {line}')
+        return None
+
+
+async def classify_cyber_law_relevance_stream(
+    llm_client: LLMClient,
+    context: dict[str, Any],
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Classify a legal text, yielding each category's relevance as soon as it is generated.
+
+    OpenAI-compatible clients are streamed with a prompt that asks for one JSON object per
+    line, so every category is parsed and yielded once its line is complete. Other clients
+    have no streaming API: the full classification is generated and its categories are
+    yielded in turn. Streamed responses bypass the prompt caches.
+    """
+    openai_client = getattr(llm_client, 'client', None)
+    if not isinstance(openai_client, openai.AsyncOpenAI):
+        response = await llm_client.generate_response(
+            list(prompt_library.extract_legal_entities.classify_cyber_law_relevance(context)),
+            response_model=CyberLawClassification,
+        )
+        for category in response.get('categories') or []:
+            yield category
+        return
+
+    messages = prompt_library.extract_legal_entities.classify_cyber_law_relevance_stream(context)
+    try:
+        stream = await openai_client.chat.completions.create(
+            model=llm_client.model or DEFAULT_MODEL,
+            messages=[
+                {'role': m.role, 'content': llm_client._clean_input(m.content)}  # type: ignore
+                for m in messages
+            ],
+            temperature=llm_client.temperature,
+            max_tokens=llm_client.max_tokens,
+            stream=True,
+        )
+
+        buffer = ''
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            buffer += chunk.choices[0].delta.content or ''
+            *lines, buffer = buffer.split('\n')
+            for line in lines:
+                category = _parse_category_line(line)
+                if category is not None:
+                    yield category
+
+        category = _parse_category_line(buffer)
+        if category is not None:
+            yield category
+    except openai.RateLimitError as e:
+        raise RateLimitError from e
+
+
+def _entity_refs(extracted_entities: dict[str, Any]) -> list[dict[str, str]]:
+    return [
+        {'name': entity['name'], 'type': entity.get('entity_type', '')}
+        for field in ExtractedLegalEntities.model_fields
+        for entity in extracted_entities.get(field) or []
+        if entity.get('name')
+    ]
+
+
+async def analyze_legal_document(
+    llm_client: LLMClient,
+    context: dict[str, Any],
+    cache: LLMPromptCache | None = None,
+    semantic_cache: SemanticResponseCache | None = None,
+) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
+    """
+    Extract entities and relationships from a legal document and classify it.
+
+    Classification never depends on the other calls, so it always runs concurrently.
+    Relationship extraction needs the entities: when context['entities'] is given all
+    three calls are gathered, otherwise it runs after entity extraction.
+
+    Returns:
+        Entity extraction, relationship extraction and classification responses
+    """
+    if context.get('entities'):
+        entities, relationships, classification = await semaphore_gather(
+            extract_legal_entities(llm_client, context, cache),
+            extract_legal_relationships(llm_client, context, cache),
+            classify_cyber_law_relevance(llm_client, context, cache, semantic_cache),
+        )
+        return entities, relationships, classification
+
+    async def extract_entities_then_relationships() -> tuple[dict[str, Any], dict[str, Any]]:
+        extracted_entities = await extract_legal_entities(llm_client, context, cache)
+        extracted_relationships = await extract_legal_relationships(
+            llm_client, {**context, 'entities': _entity_refs(extracted_entities)}, cache
+        )
+        return extracted_entities, extracted_relationships
+
+    (entities, relationships), classification = await semaphore_gather(
+        extract_entities_then_relationships(),
+        classify_cyber_law_relevance(llm_client, context, cache, semantic_cache),
+    )
+    return entities, relationships, classification
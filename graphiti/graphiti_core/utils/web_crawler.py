@@ -4,12 +4,17 @@ Specialized for legal document extraction and processing.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
-from typing import Any, Dict, List, Optional, Union
+import weakref
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union, cast
 
 from crawl4ai import AsyncWebCrawler
 from crawl4ai.extraction_strategy import JsonCssExtractionStrategy, LLMExtractionStrategy
+from diskcache import Cache
 from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
@@ -20,21 +25,21 @@ class LegalDocumentMetadata(BaseModel):
     title: str = Field(description="Title of the legal document")
     document_type: str = Field(description="Type: case_law, statute, regulation, circular, guideline")
     jurisdiction: str = Field(description="Jurisdiction: supreme_court, high_court, tribunal, regulatory")
-    case_number: Optional[str] = Field(description="Case number if applicable")
-    date: Optional[str] = Field(description="Date of judgment/enactment")
-    citation: Optional[str] = Field(description="Legal citation")
-    judge_names: Optional[List[str]] = Field(description="Names of judges")
-    parties: Optional[List[str]] = Field(description="Parties involved")
+    case_number: Optional[str] = Field(default=None, description="Case number if applicable")
+    date: Optional[str] = Field(default=None, description="Date of judgment/enactment")
+    citation: Optional[str] = Field(default=None, description="Legal citation")
+    judge_names: Optional[List[str]] = Field(default=None, description="Names of judges")
+    parties: Optional[List[str]] = Field(default=None, description="Parties involved")
     keywords: List[str] = Field(description="Legal keywords and topics")
 
 
 class LegalDocumentSection(BaseModel):
     """Structure for sections within legal documents."""
     section_type: str = Field(description="Type: facts, issues, arguments, judgment, precedents")
-    heading: Optional[str] = Field(description="Section heading")
+    heading: Optional[str] = Field(default=None, description="Section heading")
     content: str = Field(description="Section content")
-    legal_principles: Optional[List[str]] = Field(description="Legal principles identified")
-    cited_cases: Optional[List[str]] = Field(description="Cases cited in this section")
+    legal_principles: Optional[List[str]] = Field(default=None, description="Legal principles identified")
+    cited_cases: Optional[List[str]] = Field(default=None, description="Cases cited in this section")
 
 
 class LegalDocument(BaseModel):
@@ -71,6 +76,7 @@ class WebCrawler:
         """Async context manager exit."""
         if self.crawler:
             await self.crawler.__aexit__(exc_type, exc_val, exc_tb)
+            self.crawler = None
     
     def _create_legal_extraction_strategy(self) -> LLMExtractionStrategy:
         """Create LLM extraction strategy for legal documents."""
@@ -92,7 +98,7 @@ class WebCrawler:
             7. Summarize the document's significance for cyber law practice"""
         )
     
-    def _create_css_extraction_strategy(self, selectors: Dict[str, str]) -> JsonCssExtractionStrategy:
+    def _create_css_extraction_strategy(self, selectors: Mapping[str, str]) -> JsonCssExtractionStrategy:
         """Create CSS extraction strategy for structured legal websites."""
         schema = {
             "name": "Legal Document Extraction",
@@ -111,7 +117,7 @@ class WebCrawler:
         self, 
         url: str, 
         use_llm_extraction: bool = True,
-        css_selectors: Optional[Dict[str, str]] = None
+        css_selectors: Optional[Mapping[str, str]] = None
     ) -> Dict[str, Any]:
         """
         Crawl a legal document from a URL.
@@ -154,7 +160,7 @@ class WebCrawler:
         self, 
         urls: List[str], 
         use_llm_extraction: bool = True,
-        css_selectors: Optional[Dict[str, str]] = None
+        css_selectors: Optional[Mapping[str, str]] = None
     ) -> List[Dict[str, Any]]:
         """
         Crawl multiple legal documents concurrently.
@@ -174,6 +180,194 @@ class WebCrawler:
         return await asyncio.gather(*tasks, return_exceptions=True)
 
 
+# Shared crawlers per event loop, keyed by (llm_provider, api_key). Each one keeps its
+# browser session open so repeated crawls reuse connections instead of paying startup
+# per URL. A browser session is bound to the loop it was opened on, so another loop gets
+# its own crawlers, and entries go away with their loop.
+_shared_crawlers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[Optional[str], Optional[str]], WebCrawler]]" = weakref.WeakKeyDictionary()
+_shared_crawler_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+
+def _loop_shared_crawlers() -> Tuple[Dict[Tuple[Optional[str], Optional[str]], WebCrawler], asyncio.Lock]:
+    """Get the shared crawlers of the running event loop and the lock guarding them."""
+    loop = asyncio.get_running_loop()
+    crawlers = _shared_crawlers.get(loop)
+    if crawlers is None:
+        crawlers = _shared_crawlers[loop] = {}
+        _shared_crawler_locks[loop] = asyncio.Lock()
+    return crawlers, _shared_crawler_locks[loop]
+
+
+async def get_shared_crawler(
+    llm_provider: Optional[str] = None,
+    api_key: Optional[str] = None
+) -> WebCrawler:
+    """
+    Get a shared, already-entered crawler for the given LLM configuration.
+    
+    Crawlers are shared within the running event loop only.
+    
+    Args:
+        llm_provider: LLM provider for extraction (openai, gemini, etc.)
+        api_key: API key for the LLM provider
+        
+    Returns:
+        WebCrawler that stays open until close_shared_crawlers() is called
+    """
+    crawlers, lock = _loop_shared_crawlers()
+    key = (llm_provider, api_key)
+    crawler = crawlers.get(key)
+    if crawler is not None:
+        return crawler
+    
+    async with lock:
+        crawler = crawlers.get(key)
+        if crawler is None:
+            crawler = WebCrawler(llm_provider=llm_provider, api_key=api_key)
+            await crawler.__aenter__()
+            crawlers[key] = crawler
+    
+    return crawler
+
+
+async def close_shared_crawlers() -> None:
+    """Close every shared crawler that get_shared_crawler() opened on the running loop."""
+    crawlers, lock = _loop_shared_crawlers()
+    async with lock:
+        to_close = list(crawlers.values())
+        crawlers.clear()
+    
+    for crawler in to_close:
+        await crawler.__aexit__(None, None, None)
+
+
+DEFAULT_CRAWL_CACHE_DIR = "./.crawl_cache"
+DEFAULT_CRAWL_CACHE_SIZE = 1024
+DEFAULT_CRAWL_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+
+class CrawlCache:
+    """
+    Two-tier cache for crawl_legal_document() responses.
+    
+    L1 is an in-memory LRU that expires entries after ttl_seconds. L2 is an on-disk
+    diskcache store with the same TTL, so warm runs skip both the download and the
+    LLM extraction. The disk store is only opened on first use.
+    """
+    
+    def __init__(
+        self,
+        max_size: int = DEFAULT_CRAWL_CACHE_SIZE,
+        ttl_seconds: float = DEFAULT_CRAWL_CACHE_TTL_SECONDS,
+        cache_dir: Optional[str] = DEFAULT_CRAWL_CACHE_DIR
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.cache_dir = cache_dir
+        self._entries: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        self._disk: Optional[Cache] = None
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    @staticmethod
+    def key(
+        url: str,
+        use_llm_extraction: bool,
+        css_selectors: Optional[Mapping[str, str]] = None
+    ) -> str:
+        selectors = json.dumps(dict(css_selectors or {}), sort_keys=True)
+        raw_key = json.dumps([url, use_llm_extraction, selectors])
+        return hashlib.sha1(raw_key.encode()).hexdigest()
+    
+    def _get_disk(self) -> Optional[Cache]:
+        if self._disk is None and self.cache_dir is not None:
+            self._disk = Cache(self.cache_dir)
+        return self._disk
+    
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            created_at, value = entry
+            if monotonic() - created_at < self.ttl_seconds:
+                self._entries.move_to_end(key)
+                return value
+            del self._entries[key]
+        
+        disk = self._get_disk()
+        if disk is None:
+            return None
+        
+        # Entries are written by put() as JSON strings
+        serialized = cast(Optional[str], disk.get(key))
+        if serialized is None:
+            return None
+        
+        value = json.loads(serialized)
+        self._put_memory(key, value)
+        return value
+    
+    def put(self, key: str, value: Any) -> None:
+        self._put_memory(key, value)
+        disk = self._get_disk()
+        if disk is not None:
+            disk.set(key, json.dumps(value), expire=self.ttl_seconds)
+    
+    def _put_memory(self, key: str, value: Any) -> None:
+        self._entries[key] = (monotonic(), value)
+        self._entries.move_to_end(key)
+        
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        self._entries.clear()
+        disk = self._get_disk()
+        if disk is not None:
+            disk.clear()
+
+
+_crawl_cache = CrawlCache()
+
+
+async def cached_crawl(
+    crawler: WebCrawler,
+    url: str,
+    use_llm_extraction: bool = True,
+    css_selectors: Optional[Mapping[str, str]] = None,
+    cache: Optional[CrawlCache] = None
+) -> Any:
+    """
+    Crawl a legal document, reusing a cached response for repeat URLs.
+    
+    Args:
+        crawler: Entered crawler used on a cache miss
+        url: URL of the legal document
+        use_llm_extraction: Whether to use LLM extraction (True) or CSS extraction (False)
+        css_selectors: CSS selectors for structured extraction (if not using LLM)
+        cache: Cache to use instead of the process-wide crawl cache
+        
+    Returns:
+        Extracted legal document data
+    """
+    cache = cache if cache is not None else _crawl_cache
+    key = cache.key(url, use_llm_extraction, css_selectors)
+    
+    document_data = cache.get(key)
+    if document_data is not None:
+        return document_data
+    
+    # Failed crawls raise before reaching the cache, so they are retried next time
+    document_data = await crawler.crawl_legal_document(url, use_llm_extraction, css_selectors)
+    cache.put(key, document_data)
+    return document_data
+
+
+def clear_crawl_cache() -> None:
+    """Clear the in-memory and on-disk crawl caches."""
+    _crawl_cache.clear()
+
+
 def create_legal_entity_definitions():
     """Create Pydantic models for legal entities in the knowledge graph."""
     
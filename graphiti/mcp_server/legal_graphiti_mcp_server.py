@@ -24,9 +24,9 @@ from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 from pydantic import BaseModel, Field
 
-from graphiti_core import Graphiti
 from graphiti_core.driver.neo4j_driver import Neo4jDriver
 from graphiti_core.edges import EntityEdge
+from graphiti_core.helpers import use_uvloop
 from graphiti_core.embedder.openai import OpenAIEmbedder, OpenAIEmbedderConfig
 from graphiti_core.llm_client.openai_client import OpenAIClient
 from graphiti_core.llm_client.config import LLMConfig
@@ -39,8 +39,12 @@ from graphiti_core.search.search_filters import SearchFilters
 from graphiti_core.utils.maintenance.graph_data_operations import clear_data
 
 # Import legal extensions
-from graphiti_core.legal_entities import LEGAL_ENTITY_TYPES, get_legal_entity_type_descriptions
-from graphiti_core.graphiti_web_extension import extend_graphiti_with_web_capabilities
+from graphiti_core.legal_entities import (
+    LEGAL_ENTITY_JSON_SCHEMAS,
+    LEGAL_ENTITY_TYPES,
+    get_legal_entity_type_descriptions,
+)
+from graphiti_core.graphiti_web_extension import LegalGraphiti
 from graphiti_core.synthetic_legal_graph import extend_graphiti_with_synthesis
 from graphiti_core.legal_analysis_prompts import AnalysisType, LegalWebsiteSchema
 
@@ -85,7 +89,7 @@ class LegalResearchRequest(BaseModel):
 
 
 # Global Graphiti instance
-graphiti: Optional[Graphiti] = None
+graphiti: Optional[LegalGraphiti] = None
 neo4j_driver: Optional[Neo4jDriver] = None
 
 
@@ -95,7 +99,7 @@ async def get_graphiti():
     
     if graphiti is None:
         # Initialize Graphiti
-        graphiti = Graphiti(
+        graphiti = LegalGraphiti(
             uri=os.getenv('NEO4J_URI', 'bolt://localhost:7687'),
             user=os.getenv('NEO4J_USER', 'neo4j'),
             password=os.getenv('NEO4J_PASSWORD', 'password'),
@@ -118,8 +122,7 @@ async def get_graphiti():
         # Store driver reference for Cypher queries
         neo4j_driver = graphiti.driver
         
-        # Extend with legal capabilities
-        extend_graphiti_with_web_capabilities()
+        # Extend with legal synthesis capabilities
         extend_graphiti_with_synthesis()
         
         # Initialize indices
@@ -254,6 +257,7 @@ async def get_graph_schema() -> Dict[str, Any]:
         "relationship_types": rels_result[0]["relationships"] if rels_result else [],
         "constraints": constraints_result,
         "legal_entity_types": legal_descriptions,
+        "legal_entity_schemas": dict(LEGAL_ENTITY_JSON_SCHEMAS),
         "custom_entities": {
             "Requirement": "Product/service requirements",
             "Preference": "User preferences",
@@ -350,28 +354,33 @@ async def visualize_subgraph(
     """
     await get_graphiti()
     
+    # Variable-length bounds cannot be query parameters, so only the integer depth is
+    # interpolated. Everything else is bound so Neo4j can reuse the cached query plan.
+    depth = int(depth)
+    
     # Build the query
     if center_node_id:
         query = f"""
         MATCH path = (center {{uuid: $center_id}})-[*0..{depth}]-(connected)
-        WHERE center:Entity OR center:CaseLaw OR center:Statute
+        WHERE (center:Entity OR center:CaseLaw OR center:Statute)
         """
     else:
-        query = """
-        MATCH (n)
-        WHERE n:Entity OR n:CaseLaw OR n:Statute
-        WITH n LIMIT 1
-        MATCH path = (n)-[*0..{depth}]-(connected)
+        query = f"""
+        MATCH (center)
+        WHERE center:Entity OR center:CaseLaw OR center:Statute
+        WITH center LIMIT 1
+        MATCH path = (center)-[*0..{depth}]-(connected)
+        WHERE true
         """
     
     if node_types:
-        query += f" AND any(label IN labels(connected) WHERE label IN {node_types})"
+        query += " AND any(label IN labels(connected) WHERE label IN $node_types)"
     
-    query += f"""
+    query += """
     WITH collect(distinct center) + collect(distinct connected) as nodes, 
          collect(distinct relationships(path)) as rels
     UNWIND nodes as node
-    WITH collect(distinct node)[0..{limit}] as limitedNodes, rels
+    WITH collect(distinct node)[0..$limit] as limitedNodes, rels
     UNWIND rels as relList
     UNWIND relList as rel
     WITH limitedNodes, collect(distinct rel) as relationships
@@ -379,7 +388,7 @@ async def visualize_subgraph(
     RETURN limitedNodes as nodes, relationships
     """
     
-    params = {"center_id": center_node_id} if center_node_id else {}
+    params = {"center_id": center_node_id, "node_types": node_types or [], "limit": limit}
     result = await neo4j_driver.execute_read(query, params)
     
     if result:
@@ -719,7 +728,7 @@ async def get_legal_website_schemas() -> Dict[str, Any]:
     Returns:
         Available website configurations
     """
-    schemas = LegalWebsiteSchema.SCHEMAS
+    schemas = LegalWebsiteSchema.as_dict()
     
     return {
         "websites": list(schemas.keys()),
@@ -798,44 +807,50 @@ async def main():
     
     args = parser.parse_args()
     
-    # Initialize Graphiti on startup
-    await get_graphiti()
-    
-    if args.transport == 'stdio':
-        from mcp.server.stdio import stdio_server
-        async with stdio_server() as (read_stream, write_stream):
-            await mcp.run(
-                read_stream,
-                write_stream,
-                mcp.create_initialization_options()
-            )
-    else:  # sse
-        from mcp.server.sse import SseServerTransport
-        from starlette.applications import Starlette
-        from starlette.routing import Route
-        
-        # Create SSE transport
-        transport = SseServerTransport("/messages")
-        
-        # Create Starlette app
-        async def handle_sse(request):
-            async with transport:
+    try:
+        # Initialize Graphiti on startup
+        await get_graphiti()
+            
+        if args.transport == 'stdio':
+            from mcp.server.stdio import stdio_server
+            async with stdio_server() as (read_stream, write_stream):
                 await mcp.run(
-                    transport.read_stream,
-                    transport.write_stream,
+                    read_stream,
+                    write_stream,
                     mcp.create_initialization_options()
                 )
-        
-        app = Starlette(
-            routes=[
-                Route("/sse", endpoint=handle_sse),
-            ]
-        )
-        
-        # Run with uvicorn
-        import uvicorn
-        uvicorn.run(app, host="0.0.0.0", port=8000)
+        else:  # sse
+            from mcp.server.sse import SseServerTransport
+            from starlette.applications import Starlette
+            from starlette.routing import Route
+                
+            # Create SSE transport
+            transport = SseServerTransport("/messages")
+                
+            # Create Starlette app
+            async def handle_sse(request):
+                async with transport:
+                    await mcp.run(
+                        transport.read_stream,
+                        transport.write_stream,
+                        mcp.create_initialization_options()
+                    )
+                
+            app = Starlette(
+                routes=[
+                    Route("/sse", endpoint=handle_sse),
+                ]
+            )
+                
+            # Run with uvicorn
+            import uvicorn
+            uvicorn.run(app, host="0.0.0.0", port=8000)
+    finally:
+        # Release the shared browser session used by the web crawler
+        if graphiti is not None:
+            await graphiti.aclose_web()
 
 
 if __name__ == "__main__":
+    use_uvloop()
     asyncio.run(main())
\ No newline at end of file
@@ -14,9 +14,12 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
+import sys
+
 import pytest
 
-from graphiti_core.helpers import lucene_sanitize
+from graphiti_core.helpers import AsyncRateLimiter, lucene_sanitize, semaphore_gather, use_uvloop
 
 
 def test_lucene_sanitize():
@@ -34,5 +37,61 @@ def test_lucene_sanitize():
         assert assert_result == result
 
 
+@pytest.mark.asyncio
+async def test_semaphore_gather_bounds_concurrency():
+    running = 0
+    max_running = 0
+
+    async def task(i: int) -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return i
+
+    results = await semaphore_gather(*[task(i) for i in range(10)], max_coroutines=3)
+
+    assert results == list(range(10))
+    assert max_running <= 3
+
+
+@pytest.mark.asyncio
+async def test_semaphore_gather_return_exceptions():
+    async def ok() -> str:
+        return 'ok'
+
+    async def fail() -> str:
+        raise ValueError('boom')
+
+    results = await semaphore_gather(ok(), fail(), ok(), return_exceptions=True)
+
+    assert results[0] == 'ok'
+    assert isinstance(results[1], ValueError)
+    assert results[2] == 'ok'
+
+
+@pytest.mark.asyncio
+async def test_async_rate_limiter_spaces_concurrent_callers():
+    limiter = AsyncRateLimiter(requests_per_minute=1200)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    await asyncio.gather(*(limiter.acquire() for _ in range(3)))
+
+    # The first caller proceeds at once and the other two wait 50ms each
+    assert loop.time() - start >= 0.095
+    with pytest.raises(ValueError):
+        AsyncRateLimiter(requests_per_minute=0)
+
+
+def test_use_uvloop_keeps_default_loop_without_uvloop(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'uvloop', None)
+    policy = asyncio.get_event_loop_policy()
+
+    assert use_uvloop() is False
+    assert asyncio.get_event_loop_policy() is policy
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
@@ -0,0 +1,156 @@
+import hashlib
+import json
+from unittest.mock import patch
+
+import pytest
+
+from graphiti_core.legal_analysis_prompts import (
+    AnalysisType,
+    LegalAnalysisPrompts,
+    LegalWebsiteSchema,
+    ResponseCache,
+    SyntheticGraphPrompts,
+    dumps_prompt_json,
+)
+
+
+def test_response_key_ignores_field_order():
+    key = LegalAnalysisPrompts.response_key(
+        AnalysisType.CASE_TO_LAW, {'case_name': 'A', 'court': 'SC'}
+    )
+
+    assert key.startswith('case_to_law:')
+    assert key == LegalAnalysisPrompts.response_key(
+        AnalysisType.CASE_TO_LAW, {'court': 'SC', 'case_name': 'A'}
+    )
+    assert key != LegalAnalysisPrompts.response_key(
+        AnalysisType.LAW_TO_CASE, {'case_name': 'A', 'court': 'SC'}
+    )
+
+
+def test_build_messages_keeps_fields_out_of_system_prefix():
+    fields = {
+        'case_name': 'Shreya Singhal v. Union of India',
+        'court': 'SC',
+        'citation': '(2015) 5 SCC 1',
+        'date': '2015-03-24',
+        'facts': 'facts',
+        'issues': 'issues',
+        'judgment': 'judgment',
+    }
+    first = LegalAnalysisPrompts.build_messages(AnalysisType.CASE_TO_LAW, **fields)
+    second = LegalAnalysisPrompts.build_messages(
+        AnalysisType.CASE_TO_LAW, **{**fields, 'case_name': 'Other'}
+    )
+
+    assert first[0].role == 'system'
+    assert first[0].content is second[0].content
+    assert 'Tasks:' in first[0].content
+    assert 'Shreya Singhal' not in first[0].content
+    assert 'Shreya Singhal' in first[1].content
+    assert 'Tasks:' not in first[1].content
+
+
+def test_build_messages_rejects_analysis_without_prompt():
+    with pytest.raises(ValueError, match='incident_analysis'):
+        LegalAnalysisPrompts.build_messages(AnalysisType.INCIDENT_ANALYSIS)
+
+
+def test_response_cache_returns_copies_and_expires():
+    cache = ResponseCache(ttl_seconds=10)
+    with patch('graphiti_core.legal_analysis_prompts.monotonic', return_value=100.0):
+        cache.set('key', {'legal_gaps': ['a']})
+        hit = cache.get('key')
+        hit['legal_gaps'].append('b')
+        assert cache.get('key') == {'legal_gaps': ['a']}
+
+    with patch('graphiti_core.legal_analysis_prompts.monotonic', return_value=111.0):
+        assert cache.get('key') is None
+
+
+def test_response_cache_evicts_oldest_entry():
+    cache = ResponseCache(max_size=2)
+    cache.set('a', {})
+    cache.set('b', {})
+    cache.set('c', {})
+
+    assert len(cache) == 2
+    assert cache.get('a') is None
+    assert cache.get('c') == {}
+
+
+def test_render_batch_chunks_items():
+    items = [{'statute_name': 'IT Act', 'section': str(i), 'section_text': 'text'} for i in range(10)]
+
+    prompts = LegalAnalysisPrompts.render_batch(AnalysisType.LAW_TO_CASE, items, batch_size=8)
+
+    assert len(prompts) == 2
+    assert 'Provision [8]:' in prompts[0]
+    assert 'Provision [9]:' not in prompts[0]
+    assert 'Provision [2]:\nStatute: IT Act\nSection: 9' in prompts[1]
+
+
+def test_parse_batch_response():
+    assert LegalAnalysisPrompts.parse_batch_response({'2': {'legal_gaps': []}}, 2) == [
+        {},
+        {'legal_gaps': []},
+    ]
+    assert LegalAnalysisPrompts.parse_batch_response('[1] {"a": 1}\n[2] not json\n', 2) == [
+        {'a': 1},
+        {},
+    ]
+
+
+def test_render_synthesis_prompt_is_order_independent():
+    cases = [
+        {'uuid': str(i), 'name': f'Case {i}', 'citation': f'2020 SCC {i}', 'summary': 's'}
+        for i in range(5)
+    ]
+    shuffled = [dict(reversed(list(case.items()))) for case in reversed(cases)]
+
+    rendered = SyntheticGraphPrompts.render_synthesis_prompt('case_law_synthesis', cases=cases)
+    rendered_shuffled = SyntheticGraphPrompts.render_synthesis_prompt(
+        'case_law_synthesis', cases=shuffled
+    )
+
+    assert hashlib.sha256(rendered.encode()).hexdigest() == hashlib.sha256(
+        rendered_shuffled.encode()
+    ).hexdigest()
+
+
+def test_dumps_prompt_json_matches_json_module():
+    cases = [{'name': 'Case', 'summary': 'Sharma v. State', 'sections': ['43A', '72A']}]
+
+    assert json.loads(dumps_prompt_json(cases)) == cases
+    assert dumps_prompt_json(cases) == json.dumps(cases, indent=2)
+
+
+def test_select_fields_uses_compiled_selectors():
+    html = (
+        '<html><body><h2 class="doc_title"> Shreya Singhal v. Union of India </h2>'
+        '<a class="case_title">Case A</a><a class="case_title">Case B</a></body></html>'
+    )
+
+    fields = LegalWebsiteSchema.select_fields('indiankanoon', html)
+
+    assert fields['title'] == ['Shreya Singhal v. Union of India']
+    assert fields['referred_cases'] == ['Case A', 'Case B']
+    assert fields['date'] == []
+    assert LegalWebsiteSchema.get_compiled('indiankanoon', 'title') is (
+        LegalWebsiteSchema.get_compiled('indiankanoon', 'title')
+    )
+    assert LegalWebsiteSchema.get_compiled('meity', 'title') is None
+    assert LegalWebsiteSchema.select_fields('meity', html) == {}
+
+
+def test_website_schemas_are_read_only():
+    schema = LegalWebsiteSchema.get_schema('indiankanoon')
+
+    with pytest.raises(TypeError):
+        schema['base_url'] = 'https://example.com'
+    assert 'cyber crime' in schema['cyber_law_keywords']
+    assert LegalWebsiteSchema.get_schema('unknown') == {}
+
+    plain = LegalWebsiteSchema.as_dict()
+    assert json.loads(json.dumps(plain)) == plain
+    assert plain['indiankanoon']['cyber_law_keywords'] == sorted(schema['cyber_law_keywords'])
@@ -0,0 +1,81 @@
+import json
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from graphiti_core.legal_entities import (
+    LEGAL_ENTITY_JSON_SCHEMAS,
+    LEGAL_ENTITY_TYPES,
+    CaseLaw,
+    decode_bulk,
+    dequantize_relevance,
+    load_case_law_bulk,
+    quantize_relevance,
+)
+
+
+def case_record(i: int) -> dict:
+    return {
+        'uuid': str(i),
+        'name': f'Case {i}',
+        'summary': 'summary',
+        'citation': f'2020 SCC {i}',
+        'court': 'Supreme Court of India',
+        'date': '2020-01-01',
+        'key_holding': 'holding',
+        'cyber_law_category': 'data_protection',
+        'cyber_law_relevance': 0.5,
+    }
+
+
+def test_decode_bulk():
+    payload = json.dumps([case_record(i) for i in range(3)]).encode()
+
+    cases = decode_bulk('CaseLaw', payload)
+
+    assert all(isinstance(case, CaseLaw) for case in cases)
+    assert [case.uuid for case in cases] == ['0', '1', '2']
+    assert cases[0].judges == []
+
+
+def test_decode_bulk_rejects_invalid_records():
+    with pytest.raises(ValidationError):
+        decode_bulk('CaseLaw', json.dumps([{**case_record(0), 'cyber_law_relevance': 2.0}]))
+
+
+def test_load_case_law_bulk(tmp_path):
+    raw = [case_record(i) for i in range(3)]
+    raw[1]['cyber_law_relevance'] = 0.9
+    raw[1]['judges'] = ['A. Judge']
+    raw[2]['date'] = '2021-06-30T10:00:00'
+    path = tmp_path / 'cases.json'
+    path.write_text(json.dumps(raw))
+
+    records, list_fields = load_case_law_bulk(path)
+
+    assert records.cyber_law_relevance.dtype == np.uint8
+    assert list(records[records.cyber_law_relevance >= quantize_relevance(0.7)].uuid) == ['1']
+    assert records.date[2] == np.datetime64('2021-06-30')
+    assert records.precedential_value[0] == 'medium'
+    assert list_fields['1']['judges'] == ['A. Judge']
+    assert list_fields['0']['legal_reasoning'] == []
+
+
+def test_quantize_relevance_round_trip():
+    scores = np.array([0.0, 0.5, 0.78, 1.0, 1.5])
+
+    quantized = quantize_relevance(scores)
+
+    assert list(quantized) == [0, 128, 199, 255, 255]
+    assert np.allclose(dequantize_relevance(quantized)[:4], scores[:4], atol=0.5 / 255)
+
+
+def test_legal_entity_json_schemas_are_generated_once():
+    schema = LEGAL_ENTITY_JSON_SCHEMAS['CaseLaw']
+
+    assert schema is LEGAL_ENTITY_JSON_SCHEMAS['CaseLaw']
+    assert schema['properties']['citation']['description'].startswith('Legal citation')
+    assert set(LEGAL_ENTITY_JSON_SCHEMAS) == set(LEGAL_ENTITY_TYPES)
+    with pytest.raises(KeyError):
+        LEGAL_ENTITY_JSON_SCHEMAS['Unknown']
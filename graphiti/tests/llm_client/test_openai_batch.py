@@ -0,0 +1,92 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from graphiti_core.llm_client.openai_batch import OpenAIBatchProcessor
+from graphiti_core.prompts.models import Message
+
+
+def batch_client(answer):
+    uploaded = {}
+
+    async def create_file(file, purpose):
+        uploaded['lines'] = [json.loads(line) for line in file[1].decode().splitlines()]
+        return SimpleNamespace(id='file-in')
+
+    async def file_content(file_id):
+        lines = [
+            json.dumps(
+                {
+                    'custom_id': request['custom_id'],
+                    'response': {
+                        'body': {
+                            'choices': [
+                                {'message': {'content': json.dumps(answer(request['body']))}}
+                            ]
+                        }
+                    },
+                }
+            )
+            for request in uploaded['lines']
+        ]
+        return SimpleNamespace(text='\n'.join(lines))
+
+    client = MagicMock()
+    client.files.create = AsyncMock(side_effect=create_file)
+    client.files.content = AsyncMock(side_effect=file_content)
+    client.batches.create = AsyncMock(return_value=SimpleNamespace(id='batch', status='validating'))
+    client.batches.retrieve = AsyncMock(
+        return_value=SimpleNamespace(id='batch', status='completed', output_file_id='file-out')
+    )
+    return client, uploaded
+
+
+@pytest.mark.asyncio
+async def test_batch_processor_submits_concurrent_requests_as_one_batch():
+    client, uploaded = batch_client(lambda body: {'echo': body['messages'][1]['content']})
+    processor = OpenAIBatchProcessor(client, 'test-model', collect_seconds=0, poll_seconds=0)
+
+    results = await asyncio.gather(
+        *[
+            processor.submit(
+                [Message(role='system', content='sys'), Message(role='user', content=text)]
+            )
+            for text in ['cases', 'statutes']
+        ]
+    )
+
+    assert results == [{'echo': 'cases'}, {'echo': 'statutes'}]
+    assert client.batches.create.await_count == 1
+    assert len(uploaded['lines']) == 2
+    assert uploaded['lines'][0]['body']['response_format'] == {'type': 'json_object'}
+
+
+@pytest.mark.asyncio
+async def test_batch_processor_fails_requests_of_an_unsuccessful_batch():
+    client, _ = batch_client(lambda body: {})
+    client.batches.retrieve.return_value = SimpleNamespace(
+        id='batch', status='expired', output_file_id=None
+    )
+    processor = OpenAIBatchProcessor(client, 'test-model', collect_seconds=0, poll_seconds=0)
+
+    with pytest.raises(Exception, match='expired'):
+        await processor.submit([Message(role='user', content='cases')])
@@ -0,0 +1,415 @@
+import asyncio
+import re
+from itertools import pairwise
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from graphiti_core.legal_analysis_prompts import AnalysisType
+from graphiti_core.nodes import EntityNode
+from graphiti_core.synthetic_legal_graph import LegalGraphSynthesizer, _entity_role
+
+
+def principle_fields(content: str) -> dict:
+    return {'content': content}
+
+
+@pytest.mark.asyncio
+async def test_batch_generate_keeps_order_and_reuses_cache():
+    graphiti = MagicMock()
+    graphiti.llm_client.generate_response = AsyncMock(
+        side_effect=lambda messages, **kwargs: {'prompt': messages[1].content}
+    )
+    synthesizer = LegalGraphSynthesizer(graphiti)
+    specs = [
+        (AnalysisType.PRINCIPLE_EXTRACTION, principle_fields(content))
+        for content in ['first', 'second', 'first']
+    ]
+
+    results = await synthesizer.batch_generate(specs, concurrency=2)
+
+    assert ['first' in r['prompt'] for r in results] == [True, False, True]
+    assert 'second' in results[1]['prompt']
+
+    # Completed analyses are served from the response cache
+    calls = graphiti.llm_client.generate_response.await_count
+    await synthesizer.batch_generate(specs[:1])
+    assert graphiti.llm_client.generate_response.await_count == calls
+
+
+def provision_fields(section: str) -> dict:
+    return {'statute_name': 'IT Act', 'section': section, 'section_text': 'text'}
+
+
+@pytest.mark.asyncio
+async def test_analyze_batch_keeps_order_and_caches_each_item():
+    def generate_response(messages, **kwargs):
+        assert 'Batch Output Format' in messages[0].content
+        sections = re.findall(r'^Section: (\S+)$', messages[1].content, re.MULTILINE)
+        return {
+            str(index): {'section': section} for index, section in enumerate(sections, start=1)
+        }
+
+    graphiti = MagicMock()
+    graphiti.llm_client.generate_response = AsyncMock(side_effect=generate_response)
+    synthesizer = LegalGraphSynthesizer(graphiti)
+    items = [provision_fields(section) for section in ['43A', '66A', '79']]
+
+    results = await synthesizer.analyze_batch(AnalysisType.LAW_TO_CASE, items, batch_size=2)
+
+    assert results == [{'section': '43A'}, {'section': '66A'}, {'section': '79'}]
+    assert graphiti.llm_client.generate_response.await_count == 2
+
+    # Batched results are cached per item, for single and batch analyses alike
+    assert await synthesizer.analyze_law_to_case(items[1]) == {'section': '66A'}
+    assert await synthesizer.analyze_batch(AnalysisType.LAW_TO_CASE, items) == results
+    assert graphiti.llm_client.generate_response.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_semantic_cache_reuses_near_duplicate_analyses():
+    graphiti = MagicMock()
+    graphiti.llm_client.generate_response = AsyncMock(return_value={'principles': []})
+    graphiti.embedder.create = AsyncMock(
+        side_effect=lambda input_data: [1.0, 0.0] if 'privacy' in input_data[0] else [0.0, 1.0]
+    )
+    synthesizer = LegalGraphSynthesizer(graphiti, semantic_threshold=0.97)
+
+    await synthesizer._run_analysis(
+        AnalysisType.PRINCIPLE_EXTRACTION, principle_fields('Right to privacy.')
+    )
+    reused = await synthesizer._run_analysis(
+        AnalysisType.PRINCIPLE_EXTRACTION, principle_fields('Right to  privacy')
+    )
+    await synthesizer._run_analysis(
+        AnalysisType.PRINCIPLE_EXTRACTION, principle_fields('Intermediary liability')
+    )
+
+    assert reused == {'principles': []}
+    assert graphiti.llm_client.generate_response.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_create_legal_research_graph_searches_websites_concurrently():
+    synthesizer = LegalGraphSynthesizer(MagicMock())
+    second_started = asyncio.Event()
+    searched = []
+
+    async def iter_documents(website, *args, **kwargs):
+        searched.append(website)
+        if website == 'indiankanoon':
+            # Only completes if the other website is searched at the same time
+            await asyncio.wait_for(second_started.wait(), timeout=1)
+            return
+        second_started.set()
+        raise RuntimeError('site down')
+        yield
+
+    synthesizer._iter_documents = iter_documents
+
+    results = await synthesizer.create_legal_research_graph(
+        'intermediary liability', websites=['indiankanoon', 'scconline']
+    )
+
+    assert results['sources_searched'] == ['indiankanoon', 'scconline']
+    assert results['documents_analyzed'] == 0
+    assert sorted(searched) == ['indiankanoon', 'scconline']
+
+
+class FakeCrawler:
+    def __init__(self, **kwargs):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    async def crawl_legal_document(self, url, use_llm_extraction=True, css_selectors=None):
+        if not use_llm_extraction:
+            return {}
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if url.endswith('broken'):
+            raise RuntimeError('timeout')
+        return {'url': url, 'content': url, 'metadata': {'document_type': 'statute'}}
+
+
+@pytest.mark.asyncio
+async def test_crawl_and_synthesize_crawls_documents_concurrently(monkeypatch):
+    crawler = FakeCrawler()
+    monkeypatch.setattr('graphiti_core.utils.web_crawler.WebCrawler', lambda **kwargs: crawler)
+    graphiti = MagicMock()
+    graphiti.add_legal_document_from_web = AsyncMock(
+        side_effect=lambda url, **kwargs: {'episode': url} if url.endswith('1') else 1 / 0
+    )
+    synthesizer = LegalGraphSynthesizer(
+        graphiti, crawl_concurrency=2, llm_requests_per_minute=None
+    )
+    urls = ['https://example.com/1', 'https://example.com/broken', 'https://example.com/3']
+    synthesizer._extract_document_urls = MagicMock(return_value=urls)
+
+    results = await synthesizer.crawl_and_synthesize(
+        'indiankanoon', 'section 66A', AnalysisType.PRECEDENT_MAPPING
+    )
+
+    assert [doc['url'] for doc in results['documents']] == [urls[0], urls[2]]
+    assert crawler.max_in_flight == 2
+    # Episodes are added concurrently and a failed ingestion is skipped
+    assert results['episodes'] == [{'episode': urls[0]}]
+    assert graphiti.add_legal_document_from_web.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_crawl_and_synthesize_extracts_principles_concurrently(monkeypatch):
+    monkeypatch.setattr('graphiti_core.utils.web_crawler.WebCrawler', FakeCrawler)
+    in_flight = max_in_flight = 0
+
+    async def generate_response(messages, **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        url = messages[1].content.split('https://example.com/')[1].split()[0]
+        return {'principles': [{'name': f'principle {url}'}]}
+
+    graphiti = MagicMock()
+    graphiti.llm_client.generate_response = AsyncMock(side_effect=generate_response)
+    # Distinct principles embed orthogonally
+    graphiti.embedder.create_batch = AsyncMock(
+        side_effect=lambda texts: np.eye(len(texts)).tolist()
+    )
+    synthesizer = LegalGraphSynthesizer(
+        graphiti, llm_concurrency=2, llm_requests_per_minute=None
+    )
+    urls = [f'https://example.com/{i}' for i in range(4)]
+    synthesizer._extract_document_urls = MagicMock(return_value=urls)
+
+    results = await synthesizer.crawl_and_synthesize(
+        'indiankanoon', 'privacy', AnalysisType.PRINCIPLE_EXTRACTION
+    )
+
+    assert [p['name'] for p in results['principles']] == [f'principle {i}' for i in range(4)]
+    assert max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_semantic_cache_persists_between_synthesizers(tmp_path):
+    graphiti = MagicMock()
+    graphiti.llm_client.generate_response = AsyncMock(return_value={'principles': []})
+    graphiti.embedder.create = AsyncMock(return_value=[1.0, 0.0])
+    path = str(tmp_path / 'semantic_cache.npz')
+
+    first = LegalGraphSynthesizer(graphiti, semantic_threshold=0.97, semantic_cache_path=path)
+    await first.extract_legal_principles('Right to privacy.')
+    first.save_semantic_cache()
+
+    second = LegalGraphSynthesizer(graphiti, semantic_threshold=0.97, semantic_cache_path=path)
+    assert await second.extract_legal_principles('Right to  privacy') == []
+    assert graphiti.llm_client.generate_response.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_create_legal_research_graph_dedupes_documents_across_websites():
+    synthesizer = LegalGraphSynthesizer(MagicMock())
+    shreya = {'metadata': {'document_type': 'case_law', 'citation': '(2015) 5 SCC 1'}}
+    section = {'metadata': {'document_type': 'statute'}}
+    section_text = {'indiankanoon': 'Section 79.', 'scconline': ' section  79. '}
+    # Both websites return the same judgment and the same section, formatted differently
+    async def iter_documents(website, *args, **kwargs):
+        # The scconline documents arrive first but indiankanoon is listed first
+        if website == 'indiankanoon':
+            await asyncio.sleep(0.01)
+        yield 1, {**section, 'content': section_text[website]}, []
+        yield 0, {**shreya, 'url': website}, []
+
+    synthesizer._iter_documents = iter_documents
+    synthesizer.synthesize_case_law = AsyncMock(return_value=([], []))
+    synthesizer.integrate_statute_cases = AsyncMock(return_value=([], []))
+    synthesizer._doc_to_node = MagicMock(side_effect=lambda doc: doc)
+
+    results = await synthesizer.create_legal_research_graph(
+        'intermediary liability', websites=['indiankanoon', 'scconline']
+    )
+
+    assert results['documents_analyzed'] == 2
+    cases = synthesizer.synthesize_case_law.await_args.args[0]
+    assert [case['url'] for case in cases] == ['indiankanoon']
+
+
+@pytest.mark.asyncio
+async def test_dedupe_principles_keeps_first_of_near_duplicates():
+    graphiti = MagicMock()
+    graphiti.embedder.create_batch = AsyncMock(
+        return_value=[[1.0, 0.0], [0.0, 1.0], [0.99, 0.05], [0.05, 0.99]]
+    )
+    synthesizer = LegalGraphSynthesizer(graphiti)
+    principles = [
+        {'name': 'Right to privacy', 'definition': 'Privacy is a fundamental right.'},
+        {'name': 'Safe harbour', 'definition': 'Intermediaries are exempt from liability.'},
+        {'name': 'Privacy', 'definition': 'Privacy is a fundamental right'},
+        {'name': 'Intermediary exemption', 'definition': 'Intermediaries are not liable.'},
+    ]
+
+    deduped = await synthesizer.dedupe_principles(principles)
+
+    assert deduped == principles[:2]
+    graphiti.embedder.create_batch.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_synthesize_case_law_builds_nodes_and_edges():
+    graphiti = MagicMock()
+    graphiti.llm_client.generate_response = AsyncMock(
+        return_value={
+            'common_principles': [
+                {
+                    'name': 'Proportionality',
+                    'description': 'Restrictions must be proportionate.',
+                    'source_cases': ['a', 'b'],
+                    'confidence': 1.5,
+                }
+            ],
+            'legal_evolution': [
+                {'earlier_case': 'a', 'later_case': 'b', 'type': 'expanded', 'changes': []}
+            ],
+        }
+    )
+    synthesizer = LegalGraphSynthesizer(graphiti)
+    cases = [MagicMock(uuid=uuid, summary='', citation='', key_holding='') for uuid in 'ab']
+
+    nodes, edges = await synthesizer.synthesize_case_law(cases)
+
+    assert [(n.name, n.source_nodes, n.confidence) for n in nodes] == [
+        ('Proportionality', ['a', 'b'], 1.0)
+    ]
+    assert [(e.source_node, e.relationship_type, e.confidence) for e in edges] == [
+        ('a', 'establishes_principle', 1.0),
+        ('b', 'establishes_principle', 1.0),
+        ('a', 'evolved_into', 0.7),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_llm_calls_are_rate_limited():
+    graphiti = MagicMock()
+    started = []
+
+    async def generate_response(messages, **kwargs):
+        started.append(asyncio.get_running_loop().time())
+        return {'principles': []}
+
+    graphiti.llm_client.generate_response = AsyncMock(side_effect=generate_response)
+    synthesizer = LegalGraphSynthesizer(graphiti, llm_requests_per_minute=1200)
+
+    await synthesizer.batch_generate(
+        [(AnalysisType.PRINCIPLE_EXTRACTION, principle_fields(str(i))) for i in range(3)]
+    )
+
+    # 1200 requests per minute start one request every 50ms
+    assert [b - a >= 0.045 for a, b in pairwise(started)] == [True, True]
+
+
+@pytest.mark.asyncio
+async def test_crawl_and_synthesize_analyzes_while_crawling(monkeypatch):
+    first_analyzed = asyncio.Event()
+
+    class SlowCrawler(FakeCrawler):
+        async def crawl_legal_document(self, url, use_llm_extraction=True, css_selectors=None):
+            if url.endswith('1'):
+                # Only completes if the first document is analyzed before the crawl ends
+                await asyncio.wait_for(first_analyzed.wait(), timeout=1)
+            return await super().crawl_legal_document(url, use_llm_extraction, css_selectors)
+
+    async def generate_response(messages, **kwargs):
+        first_analyzed.set()
+        return {'principles': []}
+
+    monkeypatch.setattr('graphiti_core.utils.web_crawler.WebCrawler', SlowCrawler)
+    graphiti = MagicMock()
+    graphiti.llm_client.generate_response = AsyncMock(side_effect=generate_response)
+    synthesizer = LegalGraphSynthesizer(graphiti, llm_requests_per_minute=None)
+    urls = ['https://example.com/0', 'https://example.com/1']
+    synthesizer._extract_document_urls = MagicMock(return_value=urls)
+
+    results = await synthesizer.crawl_and_synthesize(
+        'indiankanoon', 'privacy', AnalysisType.PRINCIPLE_EXTRACTION
+    )
+
+    assert [doc['url'] for doc in results['documents']] == urls
+    assert graphiti.llm_client.generate_response.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_generate_embeds_inputs_in_one_request():
+    graphiti = MagicMock()
+    graphiti.llm_client.generate_response = AsyncMock(return_value={'principles': []})
+    graphiti.embedder.create_batch = AsyncMock(side_effect=lambda texts: np.eye(3).tolist())
+    graphiti.embedder.create = AsyncMock()
+    synthesizer = LegalGraphSynthesizer(
+        graphiti, semantic_threshold=0.97, llm_requests_per_minute=None
+    )
+
+    await synthesizer.batch_generate(
+        [(AnalysisType.PRINCIPLE_EXTRACTION, principle_fields(str(i))) for i in range(3)]
+    )
+
+    graphiti.embedder.create_batch.assert_awaited_once()
+    graphiti.embedder.create.assert_not_awaited()
+    assert graphiti.llm_client.generate_response.await_count == 3
+
+
+def test_entity_role_uses_entity_type_labels():
+    def node(*labels):
+        return EntityNode(name='node', group_id='legal', labels=['Entity', *labels])
+
+    assert _entity_role(node('CaseLaw')) == 'case'
+    assert _entity_role(node('Statute')) == 'statute'
+    assert _entity_role(node('LegalPrinciple')) is None
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_reuses_analyses_across_synthesizers(tmp_path):
+    graphiti = MagicMock()
+    graphiti.llm_client.model = 'test-model'
+    graphiti.llm_client.generate_response = AsyncMock(
+        return_value={'principles': [{'name': 'Privacy'}]}
+    )
+    path = str(tmp_path / 'responses.sqlite3')
+
+    first = LegalGraphSynthesizer(graphiti, disk_cache_path=path)
+    assert await first.extract_legal_principles('Right to privacy.') == [{'name': 'Privacy'}]
+
+    second = LegalGraphSynthesizer(graphiti, disk_cache_path=path)
+    assert await second.extract_legal_principles('Right to privacy.') == [{'name': 'Privacy'}]
+    assert graphiti.llm_client.generate_response.await_count == 1
+
+
+def test_doc_to_node_keeps_known_metadata_of_partial_documents():
+    synthesizer = LegalGraphSynthesizer(MagicMock())
+    doc = {
+        'uuid': 'case-1',
+        'summary': 'Struck down section 66A.',
+        'metadata': {
+            'document_type': 'case_law',
+            'title': 'Shreya Singhal v. Union of India',
+            'citation': '(2015) 5 SCC 1',
+            'source': 'indiankanoon',
+        },
+    }
+
+    node = synthesizer._doc_to_node(doc)
+
+    assert type(node).__name__ == 'CaseLaw'
+    assert (node.uuid, node.name, node.citation) == (
+        'case-1',
+        'Shreya Singhal v. Union of India',
+        '(2015) 5 SCC 1',
+    )
+    assert not hasattr(node, 'source')
@@ -0,0 +1,233 @@
+from functools import partial
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from graphiti_core.utils.enhanced_legal_crawler import EnhancedLegalCrawler
+
+KANOON_HTML = """
+<html><body>
+<h2 class="doc_title">Shreya Singhal vs Union Of India on 24 March, 2015</h2>
+<div class="docsource_main">Supreme Court of India</div>
+<div class="judgments">Section 66A of the Information Technology Act is struck down.</div>
+</body></html>
+"""
+
+
+@pytest.fixture
+def browser(monkeypatch):
+    browser = MagicMock()
+    browser.__aenter__ = AsyncMock(return_value=browser)
+    browser.__aexit__ = AsyncMock(return_value=None)
+
+    async def arun(url, **kwargs):
+        if 'missing' in url:
+            raise RuntimeError(f'Failed to crawl {url}')
+        return MagicMock(html=KANOON_HTML)
+
+    browser.arun = AsyncMock(side_effect=arun)
+    monkeypatch.setattr(
+        'graphiti_core.utils.web_crawler.AsyncWebCrawler', MagicMock(return_value=browser)
+    )
+    return browser
+
+
+@pytest.fixture
+def http_requests(monkeypatch):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if 'missing' in request.url.path:
+            return httpx.Response(404)
+        return httpx.Response(200, text=KANOON_HTML)
+
+    monkeypatch.setattr(
+        httpx, 'AsyncClient', partial(httpx.AsyncClient, transport=httpx.MockTransport(handler))
+    )
+    return requests
+
+
+@pytest.mark.asyncio
+async def test_extract_many_shares_one_crawler_session(browser, http_requests):
+    crawler = EnhancedLegalCrawler()
+    urls = [
+        'https://indiankanoon.org/doc/110813550/',
+        'https://indiankanoon.org/doc/missing/',
+        'https://indiankanoon.org/doc/1031794/',
+    ]
+
+    results = await crawler.extract_many(urls, max_concurrency=2)
+
+    assert browser.__aenter__.await_count == 1
+    assert browser.__aexit__.await_count == 1
+    assert len(http_requests) == 3
+    # Only the page the HTTP client could not fetch falls back to the browser
+    assert browser.arun.await_count == 1
+    assert crawler.crawler is None
+    assert crawler._http is None
+
+    assert isinstance(results[1], RuntimeError)
+    for result in (results[0], results[2]):
+        assert result.metadata.jurisdiction == 'supreme_court'
+        assert result.metadata.parties == ['Shreya Singhal', 'Union Of India on 24 March, 2015']
+
+    documents = await crawler.batch_extract_documents(urls)
+    assert len(documents) == 2
+
+
+def test_parse_judgment_sections_splits_on_section_headings():
+    facts = (
+        'Facts: the petitioner was arrested for posts made online and was detained for '
+        'several weeks before the police filed a charge sheet. '
+    )
+    judgment = (
+        'Judgment: we hold that Section 66A is unconstitutional. '
+        'The principle of proportionality applies, see AIR 1950 SC 27.'
+    )
+    sections = EnhancedLegalCrawler()._parse_judgment_sections(facts + judgment)
+
+    assert [section.section_type for section in sections] == ['facts', 'judgment']
+    by_type = {section.section_type: section for section in sections}
+    assert by_type['facts'].content == facts.strip()
+    assert by_type['judgment'].content == judgment.strip()
+    assert sorted(by_type['judgment'].cited_cases) == ['1950 SC 27', 'AIR 1950 SC 27']
+    assert by_type['judgment'].legal_principles == [
+        'principle of proportionality applies, see AIR 1950 SC 27.'
+    ]
+    assert EnhancedLegalCrawler()._extract_key_holdings(sections) == [
+        'we hold that Section 66A is unconstitutional.'
+    ]
+
+
+def test_cyber_law_keywords_are_reported_in_keyword_order():
+    crawler = EnhancedLegalCrawler()
+    text = 'Online PRIVACY under the Information Technology Act and data protection rules'
+
+    assert crawler._analyze_cyber_law_relevance(text) == (
+        'Relevant to cyber law - Keywords found: information technology, data protection, '
+        'privacy, online. Discusses IT Act provisions.. Relates to data protection laws.'
+    )
+    assert crawler._extract_keywords(text) == [
+        'online',
+        'data',
+        'privacy',
+        'information technology',
+    ]
+    assert crawler._analyze_cyber_law_relevance('Contract dispute') == (
+        'No direct cyber law relevance identified'
+    )
+
+
+def test_judgment_sites_share_one_extractor():
+    crawler = EnhancedLegalCrawler()
+    html = """
+    <html><body>
+    <nav class="menu"><h1>Supreme Court of India</h1></nav>
+    <div class="judgment-title">Anuradha Bhasin vs Union Of India</div>
+    <div class="coram">Coram: Justice N.V. Ramana, Justice B.R. Gavai</div>
+    <span class="judgment-date">10 January 2020</span>
+    <div class="judgment-text">Internet shutdowns must be proportionate.</div>
+    </body></html>
+    """
+
+    document = crawler.site_extractors['supreme_court']('https://main.sci.gov.in/j', html)
+    assert document.metadata.title == 'Anuradha Bhasin vs Union Of India'
+    assert document.metadata.date == '10 January 2020'
+    assert document.metadata.judge_names == ['N.V. Ramana', 'B.R. Gavai']
+    assert document.metadata.keywords == ['supreme court', 'internet']
+
+    # The tribunal layout selects a bare h1, so the whole page is parsed
+    order = crawler.site_extractors['tdsat']('https://tdsat.gov.in/o', html)
+    assert order.metadata.title == 'Supreme Court of India'
+    assert order.metadata.jurisdiction == 'tribunal'
+    assert order.metadata.keywords[:3] == [
+        'telecom disputes settlement & appellate tribunal',
+        'tribunal',
+        'order',
+    ]
+
+
+@pytest.mark.parametrize(
+    'url, site_type',
+    [
+        ('https://indiankanoon.org/doc/110813550/', 'indian_kanoon'),
+        ('https://www.sebi.gov.in/legal/circulars/jan-2024/x.html', 'sebi'),
+        ('https://consumeraffairs.nic.in/ncdrc/judgments', 'ncdrc'),
+        ('https://consumeraffairs.nic.in/other', None),
+        ('nclat.nic.in/orders', 'nclat'),
+        ('https://example.com/?ref=indiankanoon.org', None),
+    ],
+)
+def test_identify_site_matches_hosts(url, site_type):
+    crawler = EnhancedLegalCrawler()
+    assert crawler._identify_site(url) == site_type
+    assert crawler.is_supported_url(url) == (site_type is not None)
+
+
+def test_extracted_holdings_are_distinct_and_capped():
+    crawler = EnhancedLegalCrawler()
+    text = ' '.join(
+        f'We hold that ground {i} succeeds. We hold that ground 0 succeeds.' for i in range(8)
+    )
+    sections = crawler._parse_judgment_sections(f'Judgment: {text}')
+
+    assert crawler._extract_key_holdings(sections) == [
+        f'We hold that ground {i} succeeds.' for i in range(5)
+    ]
+    assert crawler._extract_principles(
+        'The doctrine of necessity. The rule of law. The test of proportionality. '
+        'The principle of natural justice.'
+    ) == ['principle of natural justice.', 'doctrine of necessity.', 'rule of law.']
+
+
+@pytest.mark.asyncio
+async def test_prewarm_connects_to_every_supported_host(browser, http_requests):
+    async with EnhancedLegalCrawler(prewarm=True) as crawler:
+        await crawler._prewarm_task
+
+    hosts = {request.url.host for request in http_requests}
+    assert {request.method for request in http_requests} == {'HEAD'}
+    assert hosts == {domain.split('/')[0] for domain in EnhancedLegalCrawler.SUPPORTED_SITES}
+
+
+@pytest.mark.asyncio
+async def test_repeated_urls_are_extracted_once(browser, http_requests):
+    crawler = EnhancedLegalCrawler()
+    url = 'https://indiankanoon.org/doc/110813550/'
+
+    results = await crawler.extract_many([url, url, url])
+    again = await crawler.extract_many([url])
+
+    assert len(http_requests) == 1
+    assert results[0] is results[1] is results[2] is again[0]
+
+    uncached = EnhancedLegalCrawler(document_cache_size=0)
+    await uncached.extract_many([url])
+    await uncached.extract_many([url])
+    assert len(http_requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_http_cache_revalidates_with_etag(browser, monkeypatch, tmp_path):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.headers.get('If-None-Match') == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text=KANOON_HTML, headers={'ETag': '"v1"'})
+
+    monkeypatch.setattr(
+        httpx, 'AsyncClient', partial(httpx.AsyncClient, transport=httpx.MockTransport(handler))
+    )
+    url = 'https://indiankanoon.org/doc/110813550/'
+
+    for _ in range(2):
+        crawler = EnhancedLegalCrawler(http_cache_dir=str(tmp_path))
+        [document] = await crawler.extract_many([url])
+        assert document.metadata.jurisdiction == 'supreme_court'
+
+    assert [r.headers.get('If-None-Match') for r in requests] == [None, '"v1"']
+    assert browser.arun.await_count == 0
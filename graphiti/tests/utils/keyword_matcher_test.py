@@ -0,0 +1,40 @@
+from graphiti_core.legal_analysis_prompts import LegalSearchStrategies, LegalWebsiteSchema
+from graphiti_core.utils.keyword_matcher import KeywordMatcher
+
+
+def test_keyword_matcher_matches_like_substring_checks():
+    keywords = ['cyber crime', 'cyber', 'section 66', 'section 6', 'privacy', 'data protection']
+    matcher = KeywordMatcher(keywords)
+    text = 'Charged under Section 66 for a CYBER CRIME; privacy was not argued.'
+
+    found = matcher.find(text)
+
+    assert set(found) == {k for k in keywords if k in text.lower()}
+    assert found[0] == 'section 66'
+    assert matcher.contains_any(text)
+    assert not matcher.contains_any('a contract dispute')
+
+
+def test_keyword_matcher_without_keywords():
+    matcher = KeywordMatcher([])
+
+    assert matcher.find('cyber') == []
+    assert not matcher.contains_any('cyber')
+
+
+def test_website_schema_match_keywords():
+    found = LegalWebsiteSchema.match_keywords('Information Technology Act intermediary rules')
+
+    assert found == ['information technology act', 'intermediary']
+    assert LegalWebsiteSchema.match_keywords('cyber', website='meity') == []
+
+
+def test_search_strategies_match_strategies():
+    text = 'The intermediary must comply with the established test under this provision.'
+
+    assert LegalSearchStrategies.match_strategies(text) == {
+        'find_applicable_cases',
+        'find_compliance_requirements',
+        'find_precedents',
+    }
+    assert LegalSearchStrategies.match_strategies('unrelated text') == set()
@@ -0,0 +1,304 @@
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from openai import AsyncOpenAI
+
+from graphiti_core.llm_client.config import LLMConfig
+from graphiti_core.llm_client.openai_generic_client import OpenAIGenericClient
+from graphiti_core.prompts import prompt_library
+from graphiti_core.prompts._llm_cache import LLMPromptCache
+from graphiti_core.prompts._semantic_cache import SemanticResponseCache
+from graphiti_core.prompts.extract_legal_entities import (
+    EXTRACTED_ENTITIES_ADAPTER,
+    BatchedExtraction,
+    CyberLawClassification,
+    ExtractedLegalEntities,
+    ExtractedLegalRelationships,
+    LegalEntity,
+    _format_entities,
+)
+from graphiti_core.utils.maintenance.legal_operations import (
+    analyze_legal_document,
+    classify_cyber_law_relevance,
+    classify_cyber_law_relevance_stream,
+    extract_legal_entities,
+    extract_legal_entities_batch,
+)
+
+
+@pytest.fixture
+def mock_llm_client():
+    client = MagicMock()
+    client.model = 'test-model'
+    client.generate_response = AsyncMock(return_value={'case_laws': []})
+    return client
+
+
+@pytest.mark.asyncio
+async def test_extract_legal_entities_reuses_cached_response(mock_llm_client, tmp_path):
+    cache = LLMPromptCache(tmp_path / 'cache.sqlite3')
+    context = {'content': 'Section 66A of the IT Act was struck down.'}
+
+    first = await extract_legal_entities(mock_llm_client, context, cache=cache)
+    second = await extract_legal_entities(mock_llm_client, context, cache=cache)
+
+    assert first == second == {'case_laws': []}
+    assert mock_llm_client.generate_response.await_count == 1
+
+    await extract_legal_entities(mock_llm_client, {**context, 'no_cache': True}, cache=cache)
+    assert mock_llm_client.generate_response.await_count == 2
+
+    mock_llm_client.model = 'other-model'
+    await extract_legal_entities(mock_llm_client, context, cache=cache)
+    assert mock_llm_client.generate_response.await_count == 3
+
+
+def test_llm_prompt_cache_expires_entries(tmp_path):
+    cache = LLMPromptCache(tmp_path / 'cache.sqlite3', ttl_days=0)
+    cache.set('key', {'value': 1})
+
+    assert cache.get('key') is None
+    assert cache.evict_expired() == 1
+
+
+def test_llm_prompt_cache_round_trips_unicode_and_falls_back_to_str(tmp_path):
+    cache = LLMPromptCache(tmp_path / 'cache.sqlite3')
+    decided = date(2015, 3, 24)
+    cache.set('key', {'court': 'सर्वोच्च न्यायालय', 'decided': decided})
+
+    assert cache.get('key') == {'court': 'सर्वोच्च न्यायालय', 'decided': str(decided)}
+
+
+@pytest.mark.asyncio
+async def test_classify_cyber_law_relevance_reuses_near_duplicate_texts(mock_llm_client):
+    embedder = MagicMock()
+    embedder.create = AsyncMock(
+        side_effect=lambda input_data: [1.0, 0.0] if 'IT Act' in input_data[0] else [0.0, 1.0]
+    )
+    semantic_cache = SemanticResponseCache(embedder)
+
+    await classify_cyber_law_relevance(
+        mock_llm_client,
+        {'content': 'Recital under the IT Act, 2000.'},
+        semantic_cache=semantic_cache,
+    )
+    await classify_cyber_law_relevance(
+        mock_llm_client, {'content': 'Recital under the IT Act 2000'}, semantic_cache=semantic_cache
+    )
+    assert mock_llm_client.generate_response.await_count == 1
+
+    await classify_cyber_law_relevance(
+        mock_llm_client, {'content': 'A contract dispute.'}, semantic_cache=semantic_cache
+    )
+    await classify_cyber_law_relevance(
+        mock_llm_client,
+        {'content': 'Recital under the IT Act', 'semantic_cache': False},
+        semantic_cache=semantic_cache,
+    )
+    assert mock_llm_client.generate_response.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_legal_prompts_do_not_share_mutated_messages(mock_llm_client):
+    async def generate_response(messages, **kwargs):
+        # LLMClient.generate_response appends to the system message in place
+        messages[0].content += ' suffix'
+        return {}
+
+    mock_llm_client.generate_response = AsyncMock(side_effect=generate_response)
+    context = {'content': 'Section 43A of the IT Act.'}
+
+    await classify_cyber_law_relevance(mock_llm_client, context)
+    await classify_cyber_law_relevance(mock_llm_client, context)
+
+    system_prompts = [
+        call.args[0][0].content for call in mock_llm_client.generate_response.await_args_list
+    ]
+    assert all(prompt.count(' suffix') == 1 for prompt in system_prompts)
+
+
+@pytest.mark.asyncio
+async def test_analyze_legal_document_extracts_relationships_between_found_entities(
+    mock_llm_client,
+):
+    async def generate_response(messages, response_model=None, **kwargs):
+        if response_model is ExtractedLegalEntities:
+            return {'statutes': [{'name': 'IT Act, 2000', 'entity_type': 'statute'}]}
+        if response_model is ExtractedLegalRelationships:
+            return {'relationships': []}
+        assert response_model is CyberLawClassification
+        return {'categories': []}
+
+    mock_llm_client.generate_response = AsyncMock(side_effect=generate_response)
+
+    entities, relationships, classification = await analyze_legal_document(
+        mock_llm_client, {'content': 'Section 66A of the IT Act, 2000 was struck down.'}
+    )
+
+    assert entities['statutes'][0]['name'] == 'IT Act, 2000'
+    assert relationships == {'relationships': []}
+    assert classification == {'categories': []}
+    relationship_call = next(
+        call
+        for call in mock_llm_client.generate_response.await_args_list
+        if call.kwargs.get('response_model') is ExtractedLegalRelationships
+    )
+    assert '- IT Act, 2000 (statute)' in relationship_call.args[0][1].content
+
+
+@pytest.mark.asyncio
+async def test_classify_cyber_law_relevance_stream_yields_each_ndjson_line():
+    deltas = [
+        '{"category": "Intermediary Liability", "relevance": 0.9, ',
+        '"key_points": ["safe harbour"]}\n{"category": "Data Protection',
+        ' & Privacy", "relevance": 0.2, "key_points": []}',
+    ]
+    yielded_deltas = 0
+
+    async def chunks():
+        nonlocal yielded_deltas
+        for delta in deltas:
+            yielded_deltas += 1
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=delta))])
+
+    llm_client = OpenAIGenericClient(
+        LLMConfig(api_key='test', model='test-model'), client=AsyncOpenAI(api_key='test')
+    )
+    create = AsyncMock(return_value=chunks())
+    llm_client.client.chat.completions.create = create
+
+    stream = classify_cyber_law_relevance_stream(
+        llm_client, {'content': 'Section 79 of the IT Act protects intermediaries.'}
+    )
+    first = await anext(stream)
+    # The first category is available before the rest of the response has arrived
+    assert first['category'] == 'Intermediary Liability'
+    assert yielded_deltas == 2
+
+    rest = [category async for category in stream]
+    assert [c['category'] for c in rest] == ['Data Protection & Privacy']
+    assert create.await_args.kwargs['stream'] is True
+    assert 'NDJSON' in create.await_args.kwargs['messages'][0]['content']
+
+
+@pytest.mark.asyncio
+async def test_classify_cyber_law_relevance_stream_falls_back_to_full_response(mock_llm_client):
+    mock_llm_client.generate_response.return_value = {
+        'categories': [{'category': 'Intermediary Liability', 'relevance': 0.9}]
+    }
+
+    categories = [
+        category
+        async for category in classify_cyber_law_relevance_stream(
+            mock_llm_client, {'content': 'Section 79 of the IT Act.'}
+        )
+    ]
+
+    assert categories == [{'category': 'Intermediary Liability', 'relevance': 0.9}]
+
+
+@pytest.mark.asyncio
+async def test_legal_prompts_are_passed_to_the_client_as_lists(mock_llm_client):
+    context = {'content': 'Section 43A of the IT Act.'}
+    assert isinstance(
+        prompt_library.extract_legal_entities.extract_legal_entities(context), tuple
+    )
+
+    await extract_legal_entities(mock_llm_client, context)
+
+    # LLM clients append a message when retrying, which a tuple would not allow
+    messages = mock_llm_client.generate_response.await_args.args[0]
+    assert isinstance(messages, list)
+
+
+def test_legal_prompt_rules_are_stated_once_in_the_system_prompt():
+    prompts = prompt_library.extract_legal_entities
+    context = {
+        'content': 'Section 43A of the IT Act.',
+        'entities': [{'name': 'IT Act', 'type': 'statute'}],
+    }
+
+    for messages in (
+        prompts.extract_legal_entities(context),
+        prompts.extract_legal_relationships(context),
+        prompts.classify_cyber_law_relevance(context),
+    ):
+        system, user = messages
+        assert 'Focus Areas' not in user.content
+        assert 'Identify relationships such as' not in user.content
+        assert system.content.count('Focus Areas') <= 1
+
+
+@pytest.mark.asyncio
+async def test_extract_legal_entities_batch_packs_chunks_into_one_call(mock_llm_client):
+    mock_llm_client.max_tokens = 1000
+
+    async def generate_response(messages, response_model=None, **kwargs):
+        if response_model is BatchedExtraction:
+            # The model skips the last document of the batch
+            return {
+                'results': [
+                    {'doc_id': 1, 'entities': {'statutes': [{'name': 'chunk 1'}]}},
+                    {'doc_id': 0, 'entities': {'statutes': [{'name': 'chunk 0'}]}},
+                ]
+            }
+        return {'statutes': [{'name': 'single'}]}
+
+    mock_llm_client.generate_response = AsyncMock(side_effect=generate_response)
+    contexts = [{'content': f'chunk {i}'} for i in range(3)] + [{'content': 'x' * 4_000}]
+
+    results = await extract_legal_entities_batch(mock_llm_client, contexts, context_window=2_000)
+
+    assert [r['statutes'][0]['name'] for r in results] == ['chunk 0', 'chunk 1', 'single', 'single']
+    calls = mock_llm_client.generate_response.await_args_list
+    batch_calls = [c for c in calls if c.kwargs['response_model'] is BatchedExtraction]
+    assert len(batch_calls) == 1
+    assert '<DOC id=2>\nchunk 2\n</DOC>' in batch_calls[0].args[0][1].content
+    # The skipped chunk and the chunk over the token budget are extracted on their own
+    assert len(calls) == 3
+
+
+def test_relationship_prompt_renders_dict_and_model_entities_identically():
+    prompts = prompt_library.extract_legal_entities
+    content = 'Shreya Singhal v. Union of India struck down Section 66A.'
+
+    from_dicts = prompts.extract_legal_relationships(
+        {'content': content, 'entities': [{'name': 'Section 66A', 'type': 'statute'}]}
+    )
+    from_models = prompts.extract_legal_relationships(
+        {
+            'content': content,
+            'entities': [
+                LegalEntity(name='Section 66A', entity_type='statute', description='IT Act')
+            ],
+        }
+    )
+
+    assert from_dicts == from_models
+
+
+def test_relationship_prompt_reuses_formatted_entity_list():
+    prompts = prompt_library.extract_legal_entities
+    entities = [{'name': 'Section 79', 'type': 'statute'}, {'name': 'IT Act', 'type': 'statute'}]
+
+    first = prompts.extract_legal_relationships({'content': 'First pass.', 'entities': entities})
+    hits = _format_entities.cache_info().hits
+    second = prompts.extract_legal_relationships({'content': 'Second pass.', 'entities': entities})
+
+    assert _format_entities.cache_info().hits == hits + 1
+    assert '- Section 79 (statute)\n- IT Act (statute)' in first[1].content
+    assert '- Section 79 (statute)\n- IT Act (statute)' in second[1].content
+
+
+def test_extraction_adapters_parse_responses_and_keep_schema_descriptions():
+    extracted = EXTRACTED_ENTITIES_ADAPTER.validate_json(
+        '{"statutes": [{"name": "Section 79", "entity_type": "statute", "description": "safe'
+        ' harbour", "section": "79", "act_name": "IT Act", "jurisdiction": "India"}]}'
+    )
+
+    assert extracted.statutes[0].act_name == 'IT Act'
+    # Descriptions feed the structured-output schema sent to the LLM
+    schema = ExtractedLegalRelationships.model_json_schema()
+    assert schema['$defs']['LegalRelationship']['properties']['source_entity']['description']
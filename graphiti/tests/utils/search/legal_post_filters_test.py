@@ -0,0 +1,49 @@
+from graphiti_core.nodes import EntityNode
+from graphiti_core.search.legal_post_filters import (
+    NUMPY_MIN_NODES,
+    filter_nodes_by_category,
+    max_node_score,
+    sort_nodes_by_date,
+)
+
+
+def make_node(i: int, category: str, date: str) -> EntityNode:
+    return EntityNode(
+        uuid=str(i),
+        name=f'Case {i}',
+        labels=['Entity', 'CaseLaw'],
+        group_id='cases',
+        attributes={'cyber_law_category': category, 'date': date},
+    )
+
+
+def test_filter_nodes_by_category():
+    categories = ['data_protection', 'cybercrime', 'intermediary_liability']
+    for count in (10, NUMPY_MIN_NODES * 2):
+        nodes = [make_node(i, categories[i % 3], '2020-01-01') for i in range(count)]
+
+        filtered = filter_nodes_by_category(nodes, ['data_protection', 'cybercrime'])
+
+        assert [node.uuid for node in filtered] == [
+            node.uuid for node in nodes if node.attributes['cyber_law_category'] != 'intermediary_liability'
+        ]
+
+
+def test_sort_nodes_by_date_is_stable():
+    for count in (10, NUMPY_MIN_NODES * 2):
+        nodes = [make_node(i, 'cybercrime', f'20{(i * 7) % 25:02d}-01-01') for i in range(count)]
+
+        sorted_nodes = sort_nodes_by_date(nodes)
+
+        expected = sorted(nodes, key=lambda node: node.attributes['date'])
+        assert [node.uuid for node in sorted_nodes] == [node.uuid for node in expected]
+
+
+def test_max_node_score():
+    nodes = [make_node(i, 'cybercrime', '2020-01-01') for i in range(3)]
+    nodes[1].attributes['cyber_law_relevance'] = 0.75
+    nodes[2].attributes['cyber_law_relevance'] = 0.5
+
+    assert max_node_score(nodes, 'cyber_law_relevance') == 0.75
+    assert max_node_score(nodes[:1], 'cyber_law_relevance') == 0.0
+    assert max_node_score([], 'cyber_law_relevance') == 0.0
@@ -0,0 +1,38 @@
+from graphiti_core.nodes import EntityNode
+from graphiti_core.search.node_view import NodeView
+
+
+def make_node(i: int, **attributes) -> EntityNode:
+    return EntityNode(
+        uuid=str(i),
+        name=f'Case {i}',
+        labels=['Entity', 'CaseLaw'],
+        group_id='cases',
+        attributes=attributes,
+    )
+
+
+def test_node_view_masks_and_date_sort():
+    nodes = [
+        make_node(0, date='2021-05-01', citation='A', cyber_law_category='cybercrime'),
+        make_node(1, date='2017-08-24', cyber_law_category='data_protection'),
+        make_node(2, date='2015-03-24', citation='B', cyber_law_relevance=0.75),
+        make_node(3, compliance_requirements=['report within 6 hours']),
+    ]
+
+    view = NodeView.from_nodes(nodes)
+
+    assert len(view) == 4
+    assert [n.uuid for n in view.select(view.has_compliance)] == ['3']
+    assert [n.uuid for n in view.select(view.has_date & view.has_citation, sort_by_date=True)] == [
+        '2',
+        '0',
+    ]
+    assert [n.uuid for n in view.select(view.category_mask(['data_protection']))] == ['1']
+    assert float(view.relevance.max()) == 0.75
+
+
+def test_node_view_empty():
+    view = NodeView.from_nodes([])
+
+    assert view.select(view.has_date, sort_by_date=True) == []
@@ -0,0 +1,40 @@
+from graphiti_core.search.one_hop_cache import OneHopCache
+
+
+def test_one_hop_cache_key_normalizes_query_and_groups():
+    cache = OneHopCache()
+
+    key = cache.key('Section 43A ', ['b', 'a'], 1, ['Statute'])
+
+    assert key == cache.key('section 43a', ['a', 'b'], 1, ['Statute'])
+    assert key != cache.key('section 43a', ['a', 'b'], 2, ['Statute'])
+    assert key != cache.key('section 43a', ['a', 'b'], 1, ['CaseLaw'])
+
+
+def test_one_hop_cache_evicts_least_recently_used():
+    cache = OneHopCache(max_size=2)
+    cache.put('a', ['1'])
+    cache.put('b', ['2'])
+
+    assert cache.get('a') == ['1']
+    cache.put('c', ['3'])
+
+    assert cache.get('a') == ['1']
+    assert cache.get('b') is None
+    assert cache.get('c') == ['3']
+
+
+def test_one_hop_cache_invalidates_by_group():
+    cache = OneHopCache()
+    key_a = cache.key('query', ['a'], 1)
+    key_b = cache.key('query', ['b'], 1)
+    key_all = cache.key('query', None, 1)
+    cache.put(key_a, ['1'])
+    cache.put(key_b, ['2'])
+    cache.put(key_all, ['1', '2'])
+
+    cache.invalidate(['a'])
+
+    assert cache.get(cache.key('query', ['a'], 1)) is None
+    assert cache.get(cache.key('query', ['b'], 1)) == ['2']
+    assert cache.get(cache.key('query', None, 1)) is None
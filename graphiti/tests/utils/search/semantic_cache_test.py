@@ -0,0 +1,75 @@
+from unittest.mock import patch
+
+from graphiti_core.search.semantic_cache import SemanticSearchCache
+
+
+def test_semantic_cache_hits_similar_query_with_same_key():
+    cache: SemanticSearchCache[str] = SemanticSearchCache(threshold=0.97)
+    cache.put([1.0, 0.0, 0.0], ('group',), 'cached')
+
+    assert cache.get([0.99, 0.01, 0.0], ('group',)) == 'cached'
+    assert cache.get([0.0, 1.0, 0.0], ('group',)) is None
+    assert cache.get([1.0, 0.0, 0.0], ('other',)) is None
+
+
+def test_semantic_cache_evicts_least_recently_used():
+    cache: SemanticSearchCache[str] = SemanticSearchCache(max_size=2)
+    cache.put([1.0, 0.0], 'a', 'first')
+    cache.put([0.0, 1.0], 'b', 'second')
+
+    # Touch 'a' so that 'b' becomes the least recently used entry
+    assert cache.get([1.0, 0.0], 'a') == 'first'
+    cache.put([1.0, 1.0], 'c', 'third')
+
+    assert len(cache) == 2
+    assert cache.get([1.0, 0.0], 'a') == 'first'
+    assert cache.get([0.0, 1.0], 'b') is None
+
+
+def test_semantic_cache_expires_entries():
+    cache: SemanticSearchCache[str] = SemanticSearchCache(ttl_seconds=10)
+    with patch('graphiti_core.search.semantic_cache.monotonic', return_value=100.0):
+        cache.put([1.0, 0.0], 'a', 'value')
+
+    with patch('graphiti_core.search.semantic_cache.monotonic', return_value=105.0):
+        assert cache.get([1.0, 0.0], 'a') == 'value'
+
+    with patch('graphiti_core.search.semantic_cache.monotonic', return_value=111.0):
+        assert cache.get([1.0, 0.0], 'a') is None
+
+
+def test_semantic_cache_group_invalidation():
+    cache: SemanticSearchCache[str] = SemanticSearchCache()
+    key_a = ('a', cache.group_versions(['a']))
+    key_b = ('b', cache.group_versions(['b']))
+    cache.put([1.0, 0.0], key_a, 'a-results')
+    cache.put([1.0, 0.0], key_b, 'b-results')
+
+    cache.invalidate(['a'])
+
+    assert cache.get([1.0, 0.0], ('a', cache.group_versions(['a']))) is None
+    assert cache.get([1.0, 0.0], ('b', cache.group_versions(['b']))) == 'b-results'
+
+
+def test_semantic_cache_saves_and_loads_entries(tmp_path):
+    cache: SemanticSearchCache[str] = SemanticSearchCache(threshold=0.97)
+    cache.put([1.0, 0.0], ('group', 1), 'cached')
+    cache.save(tmp_path / 'cache.npz')
+
+    loaded: SemanticSearchCache[str] = SemanticSearchCache(threshold=0.97)
+    loaded.load(tmp_path / 'cache.npz')
+
+    assert loaded.get([0.99, 0.01], ('group', 1)) == 'cached'
+    assert loaded.get([0.0, 1.0], ('group', 1)) is None
+
+
+def test_semantic_cache_refreshes_key_matrix_on_put():
+    cache: SemanticSearchCache[str] = SemanticSearchCache(threshold=0.97)
+    cache.put([1.0, 0.0], 'key', 'first')
+    assert cache.get([0.0, 1.0], 'key') is None
+
+    # The stacked embeddings of 'key' are rebuilt to include the new entry
+    cache.put([0.0, 1.0], 'key', 'second')
+
+    assert cache.get([0.0, 1.0], 'key') == 'second'
+    assert cache.get([1.0, 0.0], 'key') == 'first'
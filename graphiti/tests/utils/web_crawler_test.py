@@ -0,0 +1,61 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from graphiti_core.legal_analysis_prompts import LegalWebsiteSchema
+from graphiti_core.utils.web_crawler import CrawlCache, cached_crawl
+
+
+@pytest.mark.asyncio
+async def test_cached_crawl_reuses_memory_and_disk_entries(tmp_path):
+    crawler = MagicMock()
+    crawler.crawl_legal_document = AsyncMock(return_value={'summary': 'held'})
+    cache = CrawlCache(cache_dir=str(tmp_path))
+
+    first = await cached_crawl(crawler, 'https://example.com/case', cache=cache)
+    second = await cached_crawl(crawler, 'https://example.com/case', cache=cache)
+
+    assert first == second == {'summary': 'held'}
+    assert crawler.crawl_legal_document.await_count == 1
+
+    # A fresh cache over the same directory is served from disk
+    warm_cache = CrawlCache(cache_dir=str(tmp_path))
+    assert await cached_crawl(crawler, 'https://example.com/case', cache=warm_cache) == first
+    assert crawler.crawl_legal_document.await_count == 1
+
+    # Different extraction options are cached separately
+    await cached_crawl(
+        crawler, 'https://example.com/case', False, {'content': '.judgment'}, cache=cache
+    )
+    assert crawler.crawl_legal_document.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_crawl_accepts_website_schema_selectors():
+    crawler = MagicMock()
+    crawler.crawl_legal_document = AsyncMock(return_value={'summary': 'held'})
+    cache = CrawlCache(cache_dir=None)
+    selectors = LegalWebsiteSchema.get_schema('indiankanoon')['selectors']
+
+    first = await cached_crawl(crawler, 'https://example.com/case', False, selectors, cache=cache)
+    second = await cached_crawl(
+        crawler, 'https://example.com/case', False, dict(selectors), cache=cache
+    )
+
+    assert first == second == {'summary': 'held'}
+    assert crawler.crawl_legal_document.await_count == 1
+
+
+def test_crawl_cache_evicts_least_recently_used():
+    cache = CrawlCache(max_size=2, cache_dir=None)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+
+    assert len(cache) == 2
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+
+    cache.clear()
+    assert cache.get('a') is None